@@ -0,0 +1,69 @@
+# python-gphoto2 - Python interface to libgphoto2
+# http://github.com/jim-easterbrook/python-gphoto2
+# Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+#
+# This file is part of python-gphoto2.
+#
+# python-gphoto2 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# python-gphoto2 is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with python-gphoto2.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+# Measure import time and function call overhead of the installed
+# python-gphoto2, e.g. to compare the normal and merged module builds.
+
+import subprocess
+import sys
+import timeit
+
+_import_script = '''
+import time
+start = time.perf_counter()
+import gphoto2
+from gphoto2 import *
+print(time.perf_counter() - start)
+'''
+
+
+def import_time(repeat=10):
+    result = []
+    for n in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, '-c', _import_script], universal_newlines=True)
+        result.append(float(output.split()[-1]))
+    return min(result)
+
+
+def main(argv=None):
+    import gphoto2 as gp
+    print('python-gphoto2', gp.__version__, 'from', gp.__file__)
+    print('merged module build:', hasattr(gp, '_MergedFinder'))
+    print('import gphoto2: {:.1f} ms'.format(import_time() * 1000.0))
+    camera_list = gp.CameraList()
+    camera_list.append('name', 'value')
+    camera = gp.Camera()
+    tests = (
+        ('gp_list_count (same module)',
+         lambda: gp.gp_list_count(camera_list)),
+        ('CameraList[0] (builtin slot)', lambda: camera_list[0]),
+        ('gp_result_as_string', lambda: gp.gp_result_as_string(-1)),
+        ('Camera.get_abilities (cross module)', camera.get_abilities),
+        )
+    for name, func in tests:
+        number = 100000
+        seconds = min(timeit.repeat(func, number=number, repeat=5))
+        print('{}: {:.0f} ns'.format(name, seconds * 1.0e9 / number))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
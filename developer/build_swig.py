@@ -18,12 +18,164 @@
 # License along with python-gphoto2.  If not, see
 # <https://www.gnu.org/licenses/>.
 
+import hashlib
+import keyword
 import os
+import re
 import shutil
 import subprocess
 import sys
 
 
+def public_names(output_dir, ext_name):
+    # get names that "from gphoto2.ext_name import *" would import
+    result = []
+    with open(os.path.join(output_dir, ext_name + '_wrap.c')) as wrap:
+        text = wrap.read()
+    # module functions, excluding methods of builtin types
+    methods = text.split('static PyMethodDef SwigMethods[] = {')[1]
+    methods = methods.split('{ NULL, NULL, 0, NULL }')[0]
+    result += re.findall(r'{ "(\w+)", _wrap_\w+, METH', methods)
+    for pattern in (r'SWIG_Python_SetConstant\(d, d == md \? '
+                    r'public_interface : NULL, "(\w+)"',
+                    r'SwigPyBuiltin_AddPublicSymbol\(public_interface, '
+                    r'"(\w+)"\)'):
+        result += re.findall(pattern, text)
+    # add names defined in the Python part of the module
+    with open(os.path.join(output_dir, ext_name + '.py')) as py:
+        for line in py:
+            match = re.match(r'(?:def |class )?([A-Za-z]\w*)\s*[=(:]', line)
+            if match and not keyword.iskeyword(match.group(1)):
+                result.append(match.group(1))
+    return result
+
+
+def sources_hash(src_dir):
+    # hash of the files used by build_swig.py, to detect out of date output
+    result = hashlib.sha1()
+    for root, dirs, files in os.walk(src_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name == 'doc.i':
+                # optional, generated from libgphoto2 source
+                continue
+            if os.path.splitext(name)[1] not in ('.i', '.py'):
+                continue
+            path = os.path.join(root, name)
+            result.update(os.path.relpath(path, src_dir).replace(
+                os.sep, '/').encode('utf-8'))
+            with open(path, 'rb') as f:
+                result.update(f.read().replace(b'\r\n', b'\n'))
+    return result.hexdigest()
+
+
+def write_init(output_dir, ext_names, version):
+    module_names = {}
+    for name in ext_names:
+        module_names[name] = sorted(set(public_names(output_dir, name)))
+    init_file = os.path.join(output_dir, '__init__.py')
+    with open(init_file, 'w') as im:
+        im.write('__version__ = "{}"\n'.format(version))
+        im.write('__version_tuple__ = tuple(({}))\n'.format(
+            ', '.join(version.split('.'))))
+        im.write('''
+
+import importlib
+import importlib.machinery
+import os
+import sys
+
+_dir = os.path.dirname(__file__)
+_camlibs = os.path.join(_dir, 'libgphoto2', 'camlibs')
+if os.path.isdir(_camlibs):
+    os.environ['CAMLIBS'] = _camlibs
+if 'VCAMERADIR' in os.environ:
+    _iolibs = os.path.join(_dir, 'libgphoto2', 'vusb')
+else:
+    _iolibs = os.path.join(_dir, 'libgphoto2', 'iolibs')
+if os.path.isdir(_iolibs):
+    os.environ['IOLIBS'] = _iolibs
+# each extension module's init code passes this to gp_init_localedir
+_localedir = os.path.join(_dir, 'libgphoto2', 'locale')
+if not os.path.isdir(_localedir):
+    _localedir = None
+
+class GPhoto2Error(Exception):
+    """Exception raised by gphoto2 library errors
+
+    Attributes:
+        code   (int): the gphoto2 error code
+        string (str): corresponding error message
+    """
+    def __init__(self, code):
+        from gphoto2.result import gp_result_as_string
+        string = gp_result_as_string(code)
+        Exception.__init__(self, '[%d] %s' % (code, string))
+        self.code = code
+        self.string = string
+
+# Extension modules are imported when one of their names is first used
+_module_names = {
+''')
+        for name in ext_names:
+            im.write('    {!r}: (\n'.format(name))
+            line = '       '
+            for item in module_names[name]:
+                item = ' {!r},'.format(item)
+                if len(line) + len(item) > 79:
+                    im.write(line + '\n')
+                    line = '       '
+                line += item
+            im.write(line + '),\n')
+        im.write('''    }
+_name_map = dict((name, module) for (module, names) in _module_names.items()
+                 for name in names)
+
+# Use the merged extension module, if setup.py built one
+for _suffix in importlib.machinery.EXTENSION_SUFFIXES:
+    _merged = os.path.join(_dir, '_gphoto2' + _suffix)
+    if os.path.exists(_merged):
+        class _MergedFinder(object):
+            # find gphoto2._camera etc. in the merged module
+            @staticmethod
+            def find_spec(fullname, path, target=None):
+                package, dot, name = fullname.rpartition('.')
+                if (package != __name__ or name[:1] != '_'
+                        or name[1:] not in _module_names):
+                    return None
+                loader = importlib.machinery.ExtensionFileLoader(
+                    fullname, _merged)
+                spec = importlib.machinery.ModuleSpec(
+                    fullname, loader, origin=_merged)
+                spec.has_location = True
+                return spec
+
+        sys.meta_path.insert(0, _MergedFinder)
+        break
+
+def __getattr__(name):
+    if name in _module_names:
+        return importlib.import_module('gphoto2.' + name)
+    if name not in _name_map:
+        raise AttributeError(
+            'module {!r} has no attribute {!r}'.format(__name__, name))
+    module = importlib.import_module('gphoto2.' + _name_map[name])
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_module_names) | set(_name_map))
+
+if sys.version_info < (3, 7):
+    # module __getattr__ (PEP 562) is not available
+    for _name in _name_map:
+        __getattr__(_name)
+
+__all__ = sorted(set(['GPhoto2Error']) | set(_module_names) | set(_name_map))
+''')
+
+
 def main(argv=None):
     # system or local libexiv2?
     if len(sys.argv) > 2:
@@ -100,49 +252,10 @@ def main(argv=None):
     for py_name in py_names:
         shutil.copy2(os.path.join('src', 'gphoto2', py_name), output_dir)
     # create init module
-    init_file = os.path.join(output_dir, '__init__.py')
-    with open(init_file, 'w') as im:
-        im.write('__version__ = "{}"\n'.format(version))
-        im.write('__version_tuple__ = tuple(({}))\n'.format(
-            ', '.join(version.split('.'))))
-        im.write('''
-
-import os
-
-_dir = os.path.dirname(__file__)
-_camlibs = os.path.join(_dir, 'libgphoto2', 'camlibs')
-if os.path.isdir(_camlibs):
-    os.environ['CAMLIBS'] = _camlibs
-if 'VCAMERADIR' in os.environ:
-    _iolibs = os.path.join(_dir, 'libgphoto2', 'vusb')
-else:
-    _iolibs = os.path.join(_dir, 'libgphoto2', 'iolibs')
-if os.path.isdir(_iolibs):
-    os.environ['IOLIBS'] = _iolibs
-
-class GPhoto2Error(Exception):
-    """Exception raised by gphoto2 library errors
-
-    Attributes:
-        code   (int): the gphoto2 error code
-        string (str): corresponding error message
-    """
-    def __init__(self, code):
-        string = gp_result_as_string(code)
-        Exception.__init__(self, '[%d] %s' % (code, string))
-        self.code = code
-        self.string = string
-
-''')
-        for name in ext_names:
-            im.write('from gphoto2.{} import *\n'.format(name))
-        im.write('''
-_locale = os.path.join(_dir, 'libgphoto2', 'locale')
-if os.path.isdir(_locale):
-    gphoto2.abilities_list.gp_init_localedir(_locale)
-
-__all__ = dir()
-''')
+    write_init(output_dir, ext_names, version)
+    # record what the output was generated from
+    with open(os.path.join(output_dir, 'sources.sha1'), 'w') as f:
+        f.write(sources_hash(os.path.join('src', 'gphoto2')) + '\n')
     return 0
 
 
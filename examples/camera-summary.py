@@ -46,7 +46,7 @@ def main():
     for n in range(len(config_items)):
         name = config_items.get_name(n)
         try:
-            config = config_root.get_child_by_name(name)
+            config = config_root.find(name)
             print(name, config.get_value())
         except gp.GPhoto2Error as ex:
             print(name, 'Error:', str(ex))
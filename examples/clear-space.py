@@ -31,24 +31,13 @@ import gphoto2 as gp
 # my Canon dSLR raises an error on every deletion, but still does it OK
 gp.error_severity[gp.GP_ERROR] = logging.WARNING
 
-def list_files(camera, path='/'):
-    result = []
-    # get files
-    for name, value in camera.folder_list_files(path):
-        result.append(os.path.join(path, name))
-    # read folders
-    folders = []
-    for name, value in camera.folder_list_folders(path):
-        folders.append(name)
-    # recurse over subfolders
-    for name in folders:
-        result.extend(list_files(camera, os.path.join(path, name)))
+def list_files(camera):
+    result = {}
+    for folder, subfolders, files in camera.walk('/', True):
+        for name, info in files.items():
+            result[os.path.join(folder, name)] = info
     return result
 
-def get_file_info(camera, path):
-    folder, name = os.path.split(path)
-    return camera.file_get_info(folder, name)
-
 def delete_file(camera, path):
     folder, name = os.path.split(path)
     camera.file_delete(folder, name)
@@ -88,14 +77,13 @@ def main(argv=None):
         print('Sufficient free space')
         return 0
     print('Getting file list...')
-    files = list_files(camera)
+    file_info = list_files(camera)
     mtime = {}
     size = {}
-    for path in files:
-        info = get_file_info(camera, path)
+    for path, info in file_info.items():
         mtime[path] = info.file.mtime
         size[path] = info.file.size
-    files.sort(key=lambda x: mtime[x], reverse=True)
+    files = sorted(file_info, key=lambda x: mtime[x], reverse=True)
     while True:
         while files and free_space < target:
             path = files.pop()
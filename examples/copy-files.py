@@ -47,20 +47,11 @@ def list_computer_files():
             result.append(os.path.join(root, name))
     return result
 
-def list_camera_files(camera, path='/'):
-    result = []
-    # get files
-    gp_list = camera.folder_list_files(path)
-    for name in gp_list.keys():
-        result.append(os.path.join(path, name))
-    # read folders
-    folders = []
-    gp_list = camera.folder_list_folders(path)
-    for name in gp_list.keys():
-        folders.append(name)
-    # recurse over subfolders
-    for name in folders:
-        result.extend(list_camera_files(camera, os.path.join(path, name)))
+def list_camera_files(camera):
+    result = {}
+    for folder, subfolders, files in camera.walk('/', True):
+        for name, info in files.items():
+            result[os.path.join(folder, name)] = info
     return result
 
 def main():
@@ -77,9 +68,8 @@ def main():
         print('No files found')
         return 1
     print('Copying files...')
-    for path in camera_files:
+    for path, info in camera_files.items():
         folder, name = os.path.split(path)
-        info = camera.file_get_info(folder, name)
         timestamp = datetime.fromtimestamp(info.file.mtime)
         dest_dir = get_target_dir(timestamp)
         dest = os.path.join(dest_dir, name)
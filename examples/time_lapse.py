@@ -74,12 +74,14 @@ def configured_camera():
 
 def empty_event_queue(camera):
     while True:
-        type_, data = camera.wait_for_event(10)
-        if type_ == gp.GP_EVENT_TIMEOUT:
+        events = camera.drain_events(100, 10)
+        for type_, data in events:
+            if type_ == gp.GP_EVENT_FILE_ADDED:
+                # get a second image if camera is set to raw + jpeg
+                print('Unexpected new file', data.folder + data.name)
+        if len(events) < 100:
+            # drain_events stopped at a timeout, so queue is empty
             return
-        if type_ == gp.GP_EVENT_FILE_ADDED:
-            # get a second image if camera is set to raw + jpeg
-            print('Unexpected new file', data.folder + data.name)
 
 
 def main():
@@ -140,6 +140,20 @@ mod_src_dir = 'swig-gp' + '_'.join(map(str, swigged_version))
 mod_src_dir = os.path.join('src', mod_src_dir)
 package_dir['gphoto2'] = mod_src_dir
 
+# warn if the SWIG generated files don't match the SWIG interface files
+if os.path.isdir(os.path.join('src', 'gphoto2')):
+    sys.path.insert(0, 'developer')
+    from build_swig import sources_hash
+    sys.path.pop(0)
+    stamp = None
+    stamp_file = os.path.join(mod_src_dir, 'sources.sha1')
+    if os.path.isfile(stamp_file):
+        with open(stamp_file) as f:
+            stamp = f.read().strip()
+    if stamp != sources_hash(os.path.join('src', 'gphoto2')):
+        print('WARNING: {} is out of date, run developer/build_swig.py to'
+              ' regenerate it'.format(mod_src_dir))
+
 extra_compile_args = [
     '-O3', '-Wno-unused-variable', '-Wno-unused-but-set-variable',
     '-Wno-unused-label', '-Wno-strict-prototypes']
@@ -148,20 +162,32 @@ if 'PYTHON_GPHOTO2_STRICT' in os.environ:
 define_macros = [('GPHOTO2_VERSION',
                   '0x{:02x}{:02x}{:02x}{:02x}'.format(*gphoto2_version, 0, 0)),
                  ('SWIG_TYPE_TABLE', 'gphoto2')]
-for file_name in os.listdir(mod_src_dir):
-    if file_name[-7:] != '_wrap.c':
-        continue
-    ext_name = file_name[:-7]
+wrap_files = sorted(x for x in os.listdir(mod_src_dir) if x[-7:] == '_wrap.c')
+if 'PYTHON_GPHOTO2_MERGED' in os.environ:
+    # link all the wrappers into one shared object, loaded by __init__.py
     ext_modules.append(Extension(
-        '_' + ext_name,
-        sources = [os.path.join(mod_src_dir, file_name)],
+        '_gphoto2',
+        sources = [os.path.join(mod_src_dir, x) for x in wrap_files],
         libraries = libraries,
         library_dirs = library_dirs,
         include_dirs = include_dirs,
-        extra_compile_args = extra_compile_args,
+        extra_compile_args = extra_compile_args + ['-flto'],
         define_macros = define_macros,
-        extra_link_args = extra_link_args,
+        extra_link_args = extra_link_args + ['-flto', '-O3'],
         ))
+else:
+    for file_name in wrap_files:
+        ext_name = file_name[:-7]
+        ext_modules.append(Extension(
+            '_' + ext_name,
+            sources = [os.path.join(mod_src_dir, file_name)],
+            libraries = libraries,
+            library_dirs = library_dirs,
+            include_dirs = include_dirs,
+            extra_compile_args = extra_compile_args,
+            define_macros = define_macros,
+            extra_link_args = extra_link_args,
+            ))
 
 setup_kwds = {
     'ext_package': 'gphoto2',
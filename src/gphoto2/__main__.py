@@ -1,6 +1,6 @@
 # python-gphoto2 - Python interface to libgphoto2
 # http://github.com/jim-easterbrook/python-gphoto2
-# Copyright (C) 2021-23  Jim Easterbrook  jim@jim-easterbrook.me.uk
+# Copyright (C) 2021-25  Jim Easterbrook  jim@jim-easterbrook.me.uk
 #
 # This file is part of python-gphoto2.
 #
@@ -21,15 +21,12 @@
 import argparse
 import os
 import sys
+import threading
 
 import gphoto2 as gp
 
 
-def main():
-    parser = argparse.ArgumentParser()
-    parser.add_argument('-v', '--verbosity', help='increase output verbosity',
-                        action='store_true')
-    args = parser.parse_args()
+def version(args):
     print('python-gphoto2 version:', gp.__version__)
     verbosity = (gp.GP_VERSION_SHORT, gp.GP_VERSION_VERBOSE)[args.verbosity]
     print('libgphoto2 version:',
@@ -40,5 +37,56 @@ def main():
           os.path.join(os.path.dirname(__file__), 'examples'))
 
 
+def liveview(args):
+    from gphoto2.liveview import FrameRing, LiveViewServer
+    camera = gp.Camera()
+    camera.init()
+    try:
+        ring = FrameRing(camera, depth=args.depth, max_fps=args.fps)
+        ring.start()
+        server = LiveViewServer((args.host, args.port), ring)
+        # stop serving if the camera stops producing frames
+        threading.Thread(target=lambda: (ring.join(), server.shutdown()),
+                         daemon=True).start()
+        print('Serving live view on http://{}:{}/ (stats at /stats)'.format(
+            *server.server_address[:2]))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            ring.stop()
+        if ring.error:
+            print('Live view stopped:', ring.error)
+            return 1
+    finally:
+        camera.exit()
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-v', '--verbosity', help='increase output verbosity',
+                        action='store_true')
+    parser.set_defaults(func=version)
+    subparsers = parser.add_subparsers(title='commands')
+    liveview_parser = subparsers.add_parser(
+        'liveview', help='serve camera live view as MJPEG over HTTP')
+    liveview_parser.add_argument(
+        '--host', default='127.0.0.1',
+        help="interface to listen on (default 127.0.0.1), use '' for all"
+        " interfaces")
+    liveview_parser.add_argument('--port', type=int, default=8080,
+                                 help='port to listen on (default 8080)')
+    liveview_parser.add_argument('--fps', type=float, default=None,
+                                 help='maximum frame rate')
+    liveview_parser.add_argument('--depth', type=int, default=4,
+                                 help='number of frames to buffer')
+    liveview_parser.set_defaults(func=liveview)
+    args = parser.parse_args()
+    return args.func(args)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -17,7 +17,8 @@
 // You should have received a copy of the GNU Lesser General Public License
 // along with python-gphoto2.  If not, see <https://www.gnu.org/licenses/>.
 
-%module(package="gphoto2") abilities_list
+%module(package="gphoto2", threads="1") abilities_list
+%nothread;
 
 %include "common/preamble.i"
 
@@ -35,6 +36,11 @@ DEPRECATED(_CameraAbilitiesList::append, 1)
 %typemap(doc) CameraAbilities "$1_name: gphoto2.$1_type"
 %typemap(doc) CameraAbilitiesList * "$1_name: gphoto2.$*1_type"
 
+// Allow other Python threads to continue during driver loading and detection
+%thread gp_abilities_list_load;
+%thread gp_abilities_list_load_dir;
+%thread gp_abilities_list_detect;
+
 // Turn on default exception handling
 DEFAULT_EXCEPTION
 
@@ -104,16 +110,16 @@ static int gp_init_localedir(const char *localedir) {
 // Add member methods to _CameraAbilitiesList
 MEMBER_FUNCTION(_CameraAbilitiesList,
     void, load, (GPContext *context),
-    gp_abilities_list_load, ($self, context), )
+    gp_abilities_list_load, ($self, context), 1)
 MEMBER_FUNCTION(_CameraAbilitiesList,
     void, load_dir, (const char *dir, GPContext *context),
-    gp_abilities_list_load_dir, ($self, dir, context), )
+    gp_abilities_list_load_dir, ($self, dir, context), 1)
 MEMBER_FUNCTION(_CameraAbilitiesList,
     void, reset, (),
     gp_abilities_list_reset, ($self), )
 MEMBER_FUNCTION(_CameraAbilitiesList,
     void, detect, (GPPortInfoList *info_list, CameraList *l, GPContext *context),
-    gp_abilities_list_detect, ($self, info_list, l, context), )
+    gp_abilities_list_detect, ($self, info_list, l, context), 1)
 MEMBER_FUNCTION(_CameraAbilitiesList,
     void, append, (CameraAbilities abilities),
     gp_abilities_list_append, ($self, abilities), )
@@ -127,6 +133,78 @@ MEMBER_FUNCTION(_CameraAbilitiesList,
     void, get_abilities, (int index, CameraAbilities *abilities),
     gp_abilities_list_get_abilities, ($self, index, abilities), )
 
+// Get all the abilities as columns, without creating CameraAbilities objects
+%feature("docstring") _CameraAbilitiesList::to_columns "Return the abilities of every camera model as a dict of tuples.
+
+The keys are 'model', 'status', 'port', 'usb_vendor', 'usb_product',
+'usb_class', 'operations', 'file_operations', 'folder_operations',
+'device_type', 'library' and 'id'. The whole list is converted in one
+call, which is much quicker than getting each CameraAbilities.
+
+Returns
+-------
+a dict of {name: tuple}."
+%{
+static const char *abilities_column_names[] = {
+  "model", "status", "port", "usb_vendor", "usb_product", "usb_class",
+  "operations", "file_operations", "folder_operations", "device_type",
+  "library", "id", NULL};
+%}
+%extend _CameraAbilitiesList {
+  PyObject *to_columns() {
+    PyObject *columns[12] = {NULL};
+    PyObject *result = NULL;
+    CameraAbilities abilities;
+    int count = gp_abilities_list_count($self);
+    int error;
+    int c, n;
+    if (count < 0)
+      count = 0;
+    for (c = 0; abilities_column_names[c]; c++) {
+      columns[c] = PyTuple_New(count);
+      if (!columns[c])
+        goto done;
+    }
+    for (n = 0; n < count; n++) {
+      PyObject *values[12];
+      error = gp_abilities_list_get_abilities($self, n, &abilities);
+      if (error < GP_OK) {
+        GPHOTO2_ERROR(error)
+        goto done;
+      }
+      values[0] = PyUnicode_FromString(abilities.model);
+      values[1] = PyInt_FromLong(abilities.status);
+      values[2] = PyInt_FromLong(abilities.port);
+      values[3] = PyInt_FromLong(abilities.usb_vendor);
+      values[4] = PyInt_FromLong(abilities.usb_product);
+      values[5] = PyInt_FromLong(abilities.usb_class);
+      values[6] = PyInt_FromLong(abilities.operations);
+      values[7] = PyInt_FromLong(abilities.file_operations);
+      values[8] = PyInt_FromLong(abilities.folder_operations);
+      values[9] = PyInt_FromLong(abilities.device_type);
+      values[10] = PyUnicode_FromString(abilities.library);
+      values[11] = PyUnicode_FromString(abilities.id);
+      for (c = 0; abilities_column_names[c]; c++) {
+        if (!values[c]) {
+          for (; abilities_column_names[c]; c++)
+            SWIG_Py_XDECREF(values[c]);
+          goto done;
+        }
+        PyTuple_SET_ITEM(columns[c], n, values[c]);
+      }
+    }
+    result = PyDict_New();
+    for (c = 0; result && abilities_column_names[c]; c++)
+      if (PyDict_SetItemString(
+            result, abilities_column_names[c], columns[c]) < 0)
+        Py_CLEAR(result);
+done:
+    for (c = 0; abilities_column_names[c]; c++)
+      SWIG_Py_XDECREF(columns[c]);
+    return result;
+  }
+};
+
 // Structures are read only
 %immutable;
 
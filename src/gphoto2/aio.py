@@ -0,0 +1,182 @@
+# python-gphoto2 - Python interface to libgphoto2
+# http://github.com/jim-easterbrook/python-gphoto2
+# Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+#
+# This file is part of python-gphoto2.
+#
+# python-gphoto2 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# python-gphoto2 is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with python-gphoto2.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+"""asyncio interface to gphoto2.Camera.
+
+libgphoto2 is not re-entrant for a single camera, so each AsyncCamera
+runs its camera's functions one at a time in its own worker thread.
+Several cameras can be used concurrently from one event loop without
+needing a thread per camera in the application.
+
+Cancelling a task that is awaiting a camera function asks libgphoto2 to
+abandon the operation, using the gphoto2.Context cancel callback. Not
+every camera driver checks for cancellation, so the function may still
+run to completion.
+
+Example::
+
+    async with AsyncCamera() as camera:
+        path = await camera.capture(gp.GP_CAPTURE_IMAGE)
+        camera_file = await camera.file_get(
+            path.folder, path.name, gp.GP_FILE_TYPE_NORMAL)
+
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import gphoto2 as gp
+
+__all__ = ['AsyncCamera']
+
+
+class AsyncCamera(object):
+    """Wrap a gphoto2.Camera with awaitable methods.
+
+    Parameters
+    ----------
+    * `camera` :
+        a gphoto2.Camera (default=None). A new one is created if needed.
+    * `context` :
+        a gphoto2.Context (default=None). A new one is created if needed.
+        Its cancel callback is replaced by the AsyncCamera.
+
+    """
+    def __init__(self, camera=None, context=None):
+        if camera is None:
+            camera = gp.Camera()
+        if context is None:
+            context = gp.Context()
+        self.camera = camera
+        self.context = context
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='gphoto2.aio')
+        self._active = None
+        self._cancel_callback = self.context.set_cancel_func(
+            self._cancel_func, None)
+
+    async def __aenter__(self):
+        await self.init()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        try:
+            await self.exit()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Shut down the worker thread and release the cancel callback.
+
+        Any camera functions already queued are run first. The event loop
+        is not blocked while waiting for them.
+
+        """
+        await asyncio.get_event_loop().run_in_executor(
+            None, self._executor.shutdown)
+        self._cancel_callback = None
+
+    def _cancel_func(self, context, data):
+        # called by libgphoto2 from the worker thread
+        active = self._active
+        if active is not None and active.is_set():
+            return gp.GP_CONTEXT_FEEDBACK_CANCEL
+        return gp.GP_CONTEXT_FEEDBACK_OK
+
+    def _call(self, cancelled, func, args):
+        # runs in the worker thread
+        if cancelled.is_set():
+            raise gp.GPhoto2Error(gp.GP_ERROR_CANCEL)
+        self._active = cancelled
+        try:
+            return func(*args, self.context)
+        finally:
+            self._active = None
+
+    async def run(self, func, *args):
+        """Run any gphoto2.Camera method in the camera's worker thread.
+
+        The gphoto2.Context is appended to ``args``.
+
+        """
+        cancelled = threading.Event()
+        future = asyncio.get_event_loop().run_in_executor(
+            self._executor, self._call, cancelled, func, args)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def init(self):
+        return await self.run(self.camera.init)
+
+    async def exit(self):
+        return await self.run(self.camera.exit)
+
+    async def get_summary(self):
+        return await self.run(self.camera.get_summary)
+
+    async def get_config(self):
+        return await self.run(self.camera.get_config)
+
+    async def get_single_config(self, name):
+        return await self.run(self.camera.get_single_config, name)
+
+    async def set_config(self, window):
+        return await self.run(self.camera.set_config, window)
+
+    async def set_single_config(self, name, widget):
+        return await self.run(self.camera.set_single_config, name, widget)
+
+    async def capture(self, type_):
+        return await self.run(self.camera.capture, type_)
+
+    async def trigger_capture(self):
+        return await self.run(self.camera.trigger_capture)
+
+    async def capture_preview(self):
+        return await self.run(self.camera.capture_preview, None)
+
+    async def wait_for_event(self, timeout):
+        return await self.run(self.camera.wait_for_event, timeout)
+
+    async def drain_events(self, max_events, timeout):
+        return await self.run(self.camera.drain_events, max_events, timeout)
+
+    async def folder_list_files(self, folder):
+        return await self.run(self.camera.folder_list_files, folder)
+
+    async def folder_list_folders(self, folder):
+        return await self.run(self.camera.folder_list_folders, folder)
+
+    async def file_get_info(self, folder, file):
+        return await self.run(self.camera.file_get_info, folder, file)
+
+    async def file_get(self, folder, file, type_):
+        return await self.run(self.camera.file_get, folder, file, type_, None)
+
+    async def file_read(self, folder, file, type_, offset, buf):
+        return await self.run(
+            self.camera.file_read, folder, file, type_, offset, buf)
+
+    async def file_delete(self, folder, file):
+        return await self.run(self.camera.file_delete, folder, file)
@@ -21,9 +21,17 @@
 %nothread;
 
 %include "common/preamble.i"
+%include "common/widget_util.i"
 
 %include "stdint.i"
 
+%{
+#include <errno.h>
+#include <sys/time.h>
+#include <time.h>
+#include <unistd.h>
+%}
+
 %import "abilities_list.i"
 %import "filesys.i"
 %import "widget.i"
@@ -34,23 +42,35 @@
 %typemap(doc) Camera * "$1_name: gphoto2.$*1_type"
 %typemap(doc) enum CameraCaptureType "$1_name: $1_type (gphoto2.GP_CAPTURE_IMAGE etc.)"
 
-// Allow other Python threads to continue during some function calls
-%thread gp_camera_wait_for_event;
-%thread gp_camera_capture;
-%thread gp_camera_trigger_capture;
-%thread gp_camera_capture_preview;
+// Allow other Python threads to continue during any function call that
+// may communicate with the camera
+%thread gp_camera_autodetect;
 %thread gp_camera_init;
+%thread gp_camera_exit;
 %thread gp_camera_get_config;
+%thread gp_camera_list_config;
 %thread gp_camera_get_single_config;
 %thread gp_camera_set_config;
 %thread gp_camera_set_single_config;
+%thread gp_camera_get_summary;
+%thread gp_camera_get_manual;
+%thread gp_camera_get_about;
+%thread gp_camera_capture;
+%thread gp_camera_trigger_capture;
+%thread gp_camera_capture_preview;
+%thread gp_camera_wait_for_event;
+%thread gp_camera_get_storageinfo;
 %thread gp_camera_folder_list_files;
 %thread gp_camera_folder_list_folders;
 %thread gp_camera_folder_delete_all;
 %thread gp_camera_folder_put_file;
-%thread gp_camera_file_get;
+%thread gp_camera_folder_make_dir;
+%thread gp_camera_folder_remove_dir;
 %thread gp_camera_file_get_info;
+%thread gp_camera_file_set_info;
+%thread gp_camera_file_get;
 %thread gp_camera_file_read;
+%thread gp_camera_file_delete;
 
 // Turn on default exception handling
 DEFAULT_EXCEPTION
@@ -114,10 +134,12 @@ int gp_camera_capture_preview(Camera *camera, CameraFile *camera_file, GPContext
 // gp_camera_capture() returns a pointer in an output parameter
 CALLOC_ARGOUT(CameraFilePath *path)
 
-// gp_camera_file_read() fills a user-supplied buffer
+// gp_camera_file_read() fills a user-supplied buffer. The buffer is held
+// until the function returns, so it can't be resized or released while
+// another Python thread runs.
 %typemap(doc) (char * buf, uint64_t * size) "$1_name: writable buffer (e.g. memoryview)"
-%typemap(in, numinputs=1) (char * buf, uint64_t * size) (uint64_t temp) {
-  Py_buffer view;
+%typemap(in, numinputs=1) (char * buf, uint64_t * size)
+                          (Py_buffer view, int got_view = 0, uint64_t temp) {
   if (PyObject_CheckBuffer($input) != 1) {
     PyErr_SetString(
       PyExc_TypeError,
@@ -127,17 +149,21 @@ CALLOC_ARGOUT(CameraFilePath *path)
   if (PyObject_GetBuffer($input, &view, PyBUF_SIMPLE | PyBUF_WRITABLE) != 0) {
     PyErr_SetString(
       PyExc_TypeError,
-      "in method '$symname', argument $argnum does not export a writable buffer");
+      "in method '$symname', argument $argnum does not export a writable contiguous buffer");
     SWIG_fail;
   }
+  got_view = 1;
   $1 = view.buf;
   temp = view.len;
   $2 = &temp;
-  PyBuffer_Release(&view);
 }
 %typemap(argout) (char * buf, uint64_t * size) {
   $result = SWIG_AppendOutput($result, PyLong_FromUnsignedLongLong(*$2));
 }
+%typemap(freearg) (char * buf, uint64_t * size) {
+  if (got_view$argnum)
+    PyBuffer_Release(&view$argnum);
+}
 
 // Add default constructor and destructor to _Camera
 DEFAULT_CTOR(_Camera, gp_camera_new)
@@ -148,7 +174,7 @@ DEFAULT_DTOR(_Camera, gp_camera_unref)
 // Add member methods to _Camera
 MEMBER_FUNCTION(_Camera,
     static void, autodetect, (CameraList *list, GPContext *context),
-    gp_camera_autodetect, (list, context), )
+    gp_camera_autodetect, (list, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, set_abilities, (CameraAbilities abilities),
     gp_camera_set_abilities, ($self, abilities), )
@@ -172,13 +198,13 @@ MEMBER_FUNCTION(_Camera,
     gp_camera_init, ($self, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, exit, (GPContext *context),
-    gp_camera_exit, ($self, context), )
+    gp_camera_exit, ($self, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, get_config, (CameraWidget **window, GPContext *context),
     gp_camera_get_config, ($self, window, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, list_config, (CameraList *list, GPContext *context),
-    gp_camera_list_config, ($self, list, context), )
+    gp_camera_list_config, ($self, list, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, get_single_config, (const char *name, CameraWidget **widget, GPContext *context),
     gp_camera_get_single_config, ($self, name, widget, context), 1)
@@ -190,13 +216,13 @@ MEMBER_FUNCTION(_Camera,
     gp_camera_set_single_config, ($self, name, widget, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, get_summary, (CameraText *summary, GPContext *context),
-    gp_camera_get_summary, ($self, summary, context), )
+    gp_camera_get_summary, ($self, summary, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, get_manual, (CameraText *manual, GPContext *context),
-    gp_camera_get_manual, ($self, manual, context), )
+    gp_camera_get_manual, ($self, manual, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, get_about, (CameraText *about, GPContext *context),
-    gp_camera_get_about, ($self, about, context), )
+    gp_camera_get_about, ($self, about, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, capture, (CameraCaptureType type, CameraFilePath *path, GPContext *context),
     gp_camera_capture, ($self, type, path, context), 1)
@@ -212,7 +238,7 @@ MEMBER_FUNCTION(_Camera,
     gp_camera_wait_for_event, ($self, timeout, eventtype, eventdata, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, get_storageinfo, (CameraStorageInformation **sifs, int *nrofsifs, GPContext *context),
-    gp_camera_get_storageinfo, ($self, sifs, nrofsifs, context), )
+    gp_camera_get_storageinfo, ($self, sifs, nrofsifs, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, folder_list_files, (const char *folder, CameraList *list, GPContext *context),
     gp_camera_folder_list_files, ($self, folder, list, context), 1)
@@ -227,16 +253,16 @@ MEMBER_FUNCTION(_Camera,
     gp_camera_folder_put_file, ($self, folder, filename, type, file, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, folder_make_dir, (const char *folder, const char *name, GPContext *context),
-    gp_camera_folder_make_dir, ($self, folder, name, context), )
+    gp_camera_folder_make_dir, ($self, folder, name, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, folder_remove_dir, (const char *folder, const char *name, GPContext *context),
-    gp_camera_folder_remove_dir, ($self, folder, name, context), )
+    gp_camera_folder_remove_dir, ($self, folder, name, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, file_get_info, (const char *folder, const char *file, CameraFileInfo *info, GPContext *context),
     gp_camera_file_get_info, ($self, folder, file, info, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, file_set_info, (const char *folder, const char *file, CameraFileInfo info, GPContext *context),
-    gp_camera_file_set_info, ($self, folder, file, info, context), )
+    gp_camera_file_set_info, ($self, folder, file, info, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, file_get, (const char *folder, const char *file, CameraFileType type, CameraFile *camera_file, GPContext *context),
     gp_camera_file_get, ($self, folder, file, type, camera_file, context), 1)
@@ -245,7 +271,7 @@ MEMBER_FUNCTION(_Camera,
     gp_camera_file_read, ($self, folder, file, type, offset, buf, size, context), 1)
 MEMBER_FUNCTION(_Camera,
     void, file_delete, (const char *folder, const char *file, GPContext *context),
-    gp_camera_file_delete, ($self, folder, file, context), )
+    gp_camera_file_delete, ($self, folder, file, context), 1)
 
 // gp_camera_get_storageinfo() returns an allocated array in an output parameter
 %typemap(in, numinputs=0)
@@ -288,6 +314,25 @@ MEMBER_FUNCTION(_Camera,
 #endif
 %}
 
+// Convert event data returned by gp_camera_wait_for_event() to a Python
+// object. The Python object takes ownership of the data.
+%{
+static PyObject *camera_event_data(CameraEventType type, void *data) {
+  if (type == GP_EVENT_FILE_ADDED || type == GP_EVENT_FOLDER_ADDED
+                                  || type == GP_EVENT_FILE_CHANGED)
+    return SWIG_NewPointerObj(
+      data, SWIGTYPE_p_CameraFilePath, SWIG_POINTER_OWN);
+  if (type == GP_EVENT_UNKNOWN && data != NULL) {
+    PyObject *result = PyString_FromString(data);
+    free(data);
+    return result;
+  }
+  if (data != NULL)
+    free(data);
+  return SWIG_Py_Void();
+}
+%}
+
 // gp_camera_wait_for_event() returns two pointers in output parameters
 %typemap(in, numinputs=0) (CameraEventType * eventtype, void ** eventdata)
                           (CameraEventType temp_type, void *temp_data) {
@@ -298,23 +343,1906 @@ MEMBER_FUNCTION(_Camera,
 }
 %typemap(argout) (CameraEventType * eventtype, void ** eventdata) {
   $result = SWIG_AppendOutput($result, PyInt_FromLong(*$1));
-  if (*$1 == GP_EVENT_FILE_ADDED || *$1 == GP_EVENT_FOLDER_ADDED
-                                 || *$1 == GP_EVENT_FILE_CHANGED) {
-    $result = SWIG_AppendOutput(
-      $result, SWIG_NewPointerObj(*$2, $descriptor(CameraFilePath*), SWIG_POINTER_OWN));
+  $result = SWIG_AppendOutput($result, camera_event_data(*$1, *$2));
+}
+
+// Add drain_events() method to get several events in one call
+%feature("docstring") _Camera::drain_events "Wait for and return events from the camera.
+
+Calls gp_camera_wait_for_event() repeatedly, with the Python GIL
+released, until it times out or max_events events have been received.
+The GP_EVENT_TIMEOUT event that ends the sequence is not included in the
+result.
+
+Parameters
+----------
+* `max_events` :
+    maximum number of events to return
+* `timeout` :
+    time to wait for each event, in milliseconds. This is not an
+    overall deadline: a camera that keeps sending events can delay
+    the return by up to max_events * timeout.
+* `context` :
+    a GPContext (default=None)
+
+Returns
+-------
+a list of (event_type, event_data) tuples.
+
+See also gphoto2.Camera.wait_for_event"
+%extend _Camera {
+  PyObject *drain_events(int max_events, int timeout, GPContext *context) {
+    CameraEventType *types = NULL;
+    void **data = NULL;
+    PyObject *result = NULL;
+    int count = 0;
+    int error = GP_OK;
+    int n;
+    if (max_events < 1) {
+      PyErr_SetString(PyExc_ValueError, "max_events must be positive");
+      return NULL;
+    }
+    types = malloc(max_events * sizeof(CameraEventType));
+    data = malloc(max_events * sizeof(void *));
+    if (!types || !data) {
+      free(types);
+      free(data);
+      PyErr_SetString(PyExc_MemoryError, "Cannot allocate event buffers");
+      return NULL;
+    }
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    while (count < max_events) {
+      data[count] = NULL;
+      error = gp_camera_wait_for_event(
+        $self, timeout, &types[count], &data[count], context);
+      if (error < GP_OK)
+        break;
+      if (types[count] == GP_EVENT_TIMEOUT) {
+        free(data[count]);
+        break;
+      }
+      count++;
+    }
+    SWIG_PYTHON_THREAD_END_ALLOW;
+    result = PyList_New(0);
+    // Convert every event, even after an error, to free the event data
+    for (n = 0; n < count; n++) {
+      PyObject *item = Py_BuildValue(
+        "(iN)", types[n], camera_event_data(types[n], data[n]));
+      if (result && item)
+        PyList_Append(result, item);
+      SWIG_Py_XDECREF(item);
+    }
+    free(types);
+    free(data);
+    if (error < GP_OK) {
+      SWIG_Py_XDECREF(result);
+      GPHOTO2_ERROR(error)
+      return NULL;
+    }
+    return result;
+  }
+};
+
+// CameraFileStream reads a camera file in chunks with gp_camera_file_read()
+%{
+#include <limits.h>
+
+// Get the expected size of a camera file from its CameraFileInfo
+static int camera_file_size(CameraFileInfo *info, CameraFileType type,
+                            uint64_t *size) {
+  switch (type) {
+    case GP_FILE_TYPE_NORMAL:
+      *size = info->file.size;
+      return info->file.fields & GP_FILE_INFO_SIZE;
+    case GP_FILE_TYPE_PREVIEW:
+      *size = info->preview.size;
+      return info->preview.fields & GP_FILE_INFO_SIZE;
+    case GP_FILE_TYPE_AUDIO:
+      *size = info->audio.size;
+      return info->audio.fields & GP_FILE_INFO_SIZE;
+    default:
+      return 0;
+  }
+}
+
+// Get the size of a camera file, if the camera reports it
+static int camera_file_known_size(Camera *camera, const char *folder,
+                                  const char *file, CameraFileType type,
+                                  uint64_t *size, GPContext *context) {
+  CameraFileInfo info;
+  if (gp_camera_file_get_info(camera, folder, file, &info, context) < GP_OK)
+    return 0;
+  return camera_file_size(&info, type, size);
+}
+
+// Read part of a camera file with gp_camera_file_read(). If the camera
+// doesn't support it the whole file is fetched into *whole with
+// gp_camera_file_get() and copied from there.
+static int camera_file_read_chunk(
+    Camera *camera, const char *folder, const char *file,
+    CameraFileType type, uint64_t offset, char *buf, uint64_t *size,
+    CameraFile **whole, GPContext *context) {
+  const char *data = NULL;
+  unsigned long int data_size = 0;
+  int error;
+  if (!*whole) {
+    error = gp_camera_file_read(camera, folder, file, type, offset,
+                                buf, size, context);
+    if (error != GP_ERROR_NOT_SUPPORTED || offset > 0)
+      return error;
+    error = gp_file_new(whole);
+    if (error < GP_OK)
+      return error;
+    error = gp_camera_file_get(camera, folder, file, type, *whole, context);
+    if (error < GP_OK)
+      return error;
+  }
+  error = gp_file_get_data_and_size(*whole, &data, &data_size);
+  if (error < GP_OK)
+    return error;
+  if (offset >= data_size)
+    *size = 0;
+  else if (*size > data_size - offset)
+    *size = data_size - offset;
+  memcpy(buf, data + offset, *size);
+  return GP_OK;
+}
+
+typedef struct CameraFileStream {
+  Camera         *camera;
+  char           *folder;
+  char           *file;
+  CameraFileType type;
+  GPContext      *context;
+  PyObject       *buffer;
+  uint64_t       chunk_size;
+  uint64_t       end;
+} CameraFileStream;
+
+// Constructor defined outside %extend as not callable from Python
+static CameraFileStream *new_CameraFileStream(
+    Camera *camera, const char *folder, const char *file,
+    CameraFileType type, int chunk_size, GPContext *context) {
+  CameraFileStream *self = NULL;
+  if (chunk_size < 1) {
+    PyErr_SetString(PyExc_ValueError, "chunk_size must be positive");
+    return NULL;
+  }
+  self = calloc(1, sizeof(CameraFileStream));
+  if (!self) {
+    PyErr_SetString(PyExc_MemoryError, "Cannot allocate CameraFileStream");
+    return NULL;
+  }
+  self->folder = strdup(folder);
+  self->file = strdup(file);
+  self->buffer = PyByteArray_FromStringAndSize(NULL, chunk_size);
+  if (!self->folder || !self->file || !self->buffer) {
+    free(self->folder);
+    free(self->file);
+    SWIG_Py_XDECREF(self->buffer);
+    free(self);
+    if (!PyErr_Occurred())
+      PyErr_SetString(PyExc_MemoryError, "Cannot allocate CameraFileStream");
+    return NULL;
+  }
+  gp_camera_ref(camera);
+  self->camera = camera;
+  if (context)
+    gp_context_ref(context);
+  self->context = context;
+  self->type = type;
+  self->chunk_size = chunk_size;
+  SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+  if (!camera_file_known_size(camera, folder, file, type, &self->end,
+                              context))
+    self->end = (uint64_t)-1;
+  SWIG_PYTHON_THREAD_END_ALLOW;
+  return self;
+}
+%}
+
+%feature("docstring") CameraFileStream
+"Sequential or random access to a camera file in fixed size chunks.
+
+Each item is a memoryview of a chunk of the file. The
+same buffer is used for every chunk, so copy the data (e.g. with
+bytes()) if you need to keep it after reading the next chunk.
+
+Iterating over a CameraFileStream reads the whole file, using no more
+memory than one chunk."
+%feature("python:slot", "sq_item", functype="ssizeargfunc")
+  CameraFileStream::__getitem__;
+// SWIG doesn't need to know about CameraFileStream internals
+typedef struct CameraFileStream {} CameraFileStream;
+%extend CameraFileStream {
+  ~CameraFileStream() {
+    gp_camera_unref($self->camera);
+    if ($self->context)
+      gp_context_unref($self->context);
+    free($self->folder);
+    free($self->file);
+    SWIG_Py_DECREF($self->buffer);
+    free($self);
+  }
+  PyObject *__getitem__(int idx) {
+    uint64_t offset = (uint64_t)idx * $self->chunk_size;
+    uint64_t size = $self->chunk_size;
+    char *buf = PyByteArray_AS_STRING($self->buffer);
+    PyObject *view = NULL;
+    PyObject *result = NULL;
+    int error;
+    if (idx < 0 || offset >= $self->end) {
+      PyErr_SetString(PyExc_IndexError,
+                      "CameraFileStream index out of range");
+      return NULL;
+    }
+    if (size > $self->end - offset)
+      size = $self->end - offset;
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    error = gp_camera_file_read($self->camera, $self->folder, $self->file,
+                                $self->type, offset, buf, &size,
+                                $self->context);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+    if (error < GP_OK) {
+      GPHOTO2_ERROR(error)
+      return NULL;
+    }
+    if (size < $self->chunk_size && offset + size < $self->end)
+      $self->end = offset + size;
+    if (size == 0) {
+      PyErr_SetString(PyExc_IndexError,
+                      "CameraFileStream index out of range");
+      return NULL;
+    }
+    view = PyMemoryView_FromObject($self->buffer);
+    if (!view)
+      return NULL;
+    result = PySequence_GetSlice(view, 0, size);
+    SWIG_Py_DECREF(view);
+    return result;
+  }
+};
+
+// Default chunk size for file_stream() and file_get_into()
+%typemap(default) int chunk_size %{
+  $1 = 1024 * 1024;
+%}
+%typemap(doc) int chunk_size "$1_name: int (default=1048576)";
+
+// Add file_stream() and file_get_into() methods to _Camera
+%feature("docstring") _Camera::file_stream "Read a file from the camera in chunks.
+
+Uses gp_camera_file_read(), so not every camera supports this.
+
+Parameters
+----------
+* `folder` :
+    a folder
+* `file` :
+    the name of a file
+* `type` :
+    the CameraFileType
+* `chunk_size` :
+    the number of bytes to read at a time
+* `context` :
+    a GPContext (default=None)
+
+Returns
+-------
+a CameraFileStream object.
+
+See also gphoto2.Camera.file_get_into"
+%feature("docstring") _Camera::file_get_into "Copy a file from the camera to a file descriptor or file object.
+
+The file is copied in chunks with gp_camera_file_read(), so the memory
+used does not depend on the file size. Cameras that don't support
+gp_camera_file_read() use gp_camera_file_get() instead, which reads the
+whole file into memory.
+
+If `dest` is an int, it is used as a file descriptor (e.g. from
+os.open() or socket.fileno()) and the whole copy runs with the Python
+GIL released. Otherwise each chunk is passed to dest.write(), which
+must write all the data (e.g. a file opened in 'wb' mode).
+
+Parameters
+----------
+* `folder` :
+    a folder
+* `file` :
+    the name of a file
+* `type` :
+    the CameraFileType
+* `dest` :
+    a file descriptor or an object with a write() method
+* `chunk_size` :
+    the number of bytes to read at a time
+* `context` :
+    a GPContext (default=None)
+
+Returns
+-------
+the number of bytes copied.
+
+See also gphoto2.Camera.file_stream"
+%typemap(doc) PyObject *dest "$1_name: int or file object";
+%newobject _Camera::file_stream;
+%extend _Camera {
+  CameraFileStream *file_stream(const char *folder, const char *file,
+                                CameraFileType type, int chunk_size,
+                                GPContext *context) {
+    return new_CameraFileStream(
+      $self, folder, file, type, chunk_size, context);
+  }
+  PyObject *file_get_into(const char *folder, const char *file,
+                          CameraFileType type, PyObject *dest,
+                          int chunk_size, GPContext *context) {
+    uint64_t offset = 0;
+    uint64_t size = 0;
+    uint64_t end = 0;
+    CameraFile *whole = NULL;
+    int error = GP_OK;
+    int fd = -1;
+    if (chunk_size < 1) {
+      PyErr_SetString(PyExc_ValueError, "chunk_size must be positive");
+      return NULL;
+    }
+    if (PyBool_Check(dest)) {
+      PyErr_SetString(PyExc_TypeError,
+                      "dest must be a file descriptor or file object");
+      return NULL;
+    }
+    if (PyLong_Check(dest)) {
+      long value = PyLong_AsLong(dest);
+      if (value == -1 && PyErr_Occurred())
+        return NULL;
+      if (value < 0 || value > INT_MAX) {
+        PyErr_SetString(PyExc_ValueError, "invalid file descriptor");
+        return NULL;
+      }
+      fd = (int)value;
+    }
+    // stop at the end of the file if the camera reports its size
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    if (!camera_file_known_size($self, folder, file, type, &end, context))
+      end = (uint64_t)-1;
+    SWIG_PYTHON_THREAD_END_ALLOW;
+    if (fd >= 0) {
+      // write directly to file descriptor with GIL released
+      int write_errno = 0;
+      char *buf = malloc(chunk_size);
+      if (!buf) {
+        PyErr_SetString(PyExc_MemoryError, "Cannot allocate buffer");
+        return NULL;
+      }
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      while (offset < end) {
+        uint64_t done = 0;
+        size = chunk_size;
+        if (size > end - offset)
+          size = end - offset;
+        error = camera_file_read_chunk($self, folder, file, type, offset,
+                                       buf, &size, &whole, context);
+        if (error < GP_OK || size == 0)
+          break;
+        while (done < size) {
+          ssize_t count = write(fd, buf + done, size - done);
+          if (count < 0) {
+            if (errno == EINTR)
+              continue;
+            write_errno = errno;
+            break;
+          }
+          done += count;
+        }
+        if (write_errno)
+          break;
+        offset += size;
+        if (size < (uint64_t)chunk_size && offset < end)
+          break;
+      }
+      SWIG_PYTHON_THREAD_END_ALLOW;
+      free(buf);
+      if (whole)
+        gp_file_unref(whole);
+      if (write_errno) {
+        errno = write_errno;
+        PyErr_SetFromErrno(PyExc_OSError);
+        return NULL;
+      }
+    }
+    else {
+      // pass a memoryview of each chunk to dest.write()
+      PyObject *buffer = NULL;
+      PyObject *view = NULL;
+      PyObject *write = PyObject_GetAttrString(dest, "write");
+      if (!write)
+        return NULL;
+      buffer = PyByteArray_FromStringAndSize(NULL, chunk_size);
+      view = buffer ? PyMemoryView_FromObject(buffer) : NULL;
+      while (view && offset < end) {
+        PyObject *chunk = NULL;
+        PyObject *result = NULL;
+        char *buf = PyByteArray_AS_STRING(buffer);
+        size = chunk_size;
+        if (size > end - offset)
+          size = end - offset;
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        error = camera_file_read_chunk($self, folder, file, type, offset,
+                                       buf, &size, &whole, context);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+        if (error < GP_OK || size == 0)
+          break;
+        chunk = PySequence_GetSlice(view, 0, size);
+        if (!chunk)
+          break;
+        result = PyObject_CallFunctionObjArgs(write, chunk, NULL);
+        SWIG_Py_DECREF(chunk);
+        if (!result)
+          break;
+        SWIG_Py_DECREF(result);
+        offset += size;
+        if (size < (uint64_t)chunk_size && offset < end)
+          break;
+      }
+      SWIG_Py_XDECREF(view);
+      SWIG_Py_XDECREF(buffer);
+      SWIG_Py_DECREF(write);
+      if (whole)
+        gp_file_unref(whole);
+      if (PyErr_Occurred())
+        return NULL;
+    }
+    if (error < GP_OK) {
+      GPHOTO2_ERROR(error)
+      return NULL;
+    }
+    return PyLong_FromUnsignedLongLong(offset);
+  }
+};
+
+// Camera.download_to_path() copies a camera file into a memory mapped file
+%{
+#include <fcntl.h>
+#include <stdio.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+
+// Copy a camera file to fd with gp_camera_file_get(), for cameras that
+// don't support gp_camera_file_read() or don't report the file size
+static int camera_file_get_to_fd(
+    Camera *camera, const char *folder, const char *file,
+    CameraFileType type, int fd, uint64_t *copied, int *os_errno,
+    GPContext *context) {
+  CameraFile *camera_file = NULL;
+  const char *data = NULL;
+  unsigned long int size = 0;
+  unsigned long int done = 0;
+  int error = gp_file_new(&camera_file);
+  if (error < GP_OK)
+    return error;
+  error = gp_camera_file_get(camera, folder, file, type, camera_file, context);
+  if (error >= GP_OK)
+    error = gp_file_get_data_and_size(camera_file, &data, &size);
+  while (error >= GP_OK && done < size) {
+    ssize_t count = pwrite(fd, data + done, size - done, done);
+    if (count < 0) {
+      if (errno == EINTR)
+        continue;
+      *os_errno = errno;
+      error = GP_ERROR_IO;
+      break;
+    }
+    done += count;
+  }
+  gp_file_unref(camera_file);
+  if (error >= GP_OK && ftruncate(fd, done) < 0) {
+    *os_errno = errno;
+    error = GP_ERROR_IO;
+  }
+  *copied = done;
+  return error;
+}
+
+// Flush a directory entry to disk after renaming a file
+static void sync_parent_dir(const char *path) {
+  char *dir = strdup(path);
+  char *sep;
+  int fd;
+  if (!dir)
+    return;
+  sep = strrchr(dir, '/');
+  if (sep == dir)
+    sep[1] = 0;
+  else if (sep)
+    *sep = 0;
+  else
+    strcpy(dir, ".");
+  fd = open(dir, O_RDONLY);
+  if (fd >= 0) {
+    fsync(fd);
+    close(fd);
+  }
+  free(dir);
+}
+
+// Allocate disk space for a file. Writing to a memory map of a sparse file
+// raises SIGBUS if the disk fills up, so ftruncate is only used if the file
+// system can't preallocate.
+static int preallocate_file(int fd, uint64_t size) {
+#ifndef __APPLE__
+  int error = posix_fallocate(fd, 0, size);
+  if (error == 0)
+    return 0;
+  if (error != EOPNOTSUPP && error != EINVAL) {
+    errno = error;
+    return -1;
+  }
+#endif
+  return ftruncate(fd, size);
+}
+
+// Copy a camera file to a temporary file then rename it to path. OS
+// errors return GP_ERROR_IO with *os_errno set.
+static int camera_download_to_path(
+    Camera *camera, const char *folder, const char *file, const char *path,
+    CameraFileType type, int do_sync, uint64_t chunk_size, mode_t mode,
+    uint64_t *copied, int *os_errno, GPContext *context) {
+  CameraFileInfo info;
+  CameraFile *whole = NULL;
+  uint64_t size = 0;
+  uint64_t offset = 0;
+  char *tmp_path = NULL;
+  char *map = NULL;
+  int have_size;
+  int fd = -1;
+  int error;
+
+  *copied = 0;
+  *os_errno = 0;
+  error = gp_camera_file_get_info(camera, folder, file, &info, context);
+  if (error < GP_OK)
+    return error;
+  have_size = camera_file_size(&info, type, &size);
+  // create a uniquely named temporary file in the destination directory
+  tmp_path = malloc(strlen(path) + 8);
+  if (!tmp_path)
+    return GP_ERROR_NO_MEMORY;
+  sprintf(tmp_path, "%s.XXXXXX", path);
+  fd = mkstemp(tmp_path);
+  if (fd < 0) {
+    *os_errno = errno;
+    free(tmp_path);
+    return GP_ERROR_IO;
+  }
+  if (fchmod(fd, mode) < 0)
+    goto os_fail;
+  if (have_size && size > 0) {
+    // preallocate file and read directly into memory map
+    if (preallocate_file(fd, size) < 0)
+      goto os_fail;
+    map = mmap(NULL, size, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+    if (map == MAP_FAILED) {
+      map = NULL;
+      goto os_fail;
+    }
+    while (offset < size) {
+      uint64_t count = size - offset;
+      if (count > chunk_size)
+        count = chunk_size;
+      error = camera_file_read_chunk(camera, folder, file, type, offset,
+                                     map + offset, &count, &whole, context);
+      if (error < GP_OK || count == 0)
+        break;
+      offset += count;
+    }
+    if (whole) {
+      gp_file_unref(whole);
+      whole = NULL;
+    }
+    // don't keep a file that is shorter than the camera said it was
+    if (error >= GP_OK && offset < size)
+      error = GP_ERROR_CORRUPTED_DATA;
+    if (error < GP_OK)
+      goto fail;
+    if (do_sync && msync(map, size, MS_SYNC) < 0)
+      goto os_fail;
+    munmap(map, size);
+    map = NULL;
+  }
+  if (!have_size) {
+    error = camera_file_get_to_fd(camera, folder, file, type, fd, &offset,
+                                  os_errno, context);
+    if (*os_errno)
+      goto os_fail;
+    if (error < GP_OK)
+      goto fail;
+  }
+  if (do_sync && fsync(fd) < 0)
+    goto os_fail;
+  error = close(fd);
+  fd = -1;
+  if (error < 0 || rename(tmp_path, path) < 0)
+    goto os_fail;
+  if (do_sync)
+    sync_parent_dir(path);
+  free(tmp_path);
+  *copied = offset;
+  return GP_OK;
+
+os_fail:
+  if (!*os_errno)
+    *os_errno = errno;
+  error = GP_ERROR_IO;
+fail:
+  if (whole)
+    gp_file_unref(whole);
+  if (map)
+    munmap(map, size);
+  if (fd >= 0)
+    close(fd);
+  unlink(tmp_path);
+  free(tmp_path);
+  return error;
+}
+%}
+
+%typemap(default) CameraFileType download_type %{
+  $1 = GP_FILE_TYPE_NORMAL;
+%}
+%typemap(doc) CameraFileType download_type
+  "$1_name: $1_type (default=gphoto2.GP_FILE_TYPE_NORMAL)";
+%typemap(default) int sync_file %{
+  $1 = 0;
+%}
+%typemap(doc) int sync_file "$1_name: bool (default=False)";
+
+%feature("docstring") _Camera::download_to_path "Copy a file from the camera to a local file.
+
+The destination file is preallocated using the size from
+gp_camera_file_get_info() and memory mapped, then filled with
+gp_camera_file_read(), so the file data is only copied once and the
+memory used does not depend on the file size. Cameras that don't
+support gp_camera_file_read() use gp_camera_file_get() instead.
+
+The data is written to a uniquely named temporary file in the same
+directory which is renamed to `path` when complete, so `path` never
+holds a partial file. If the camera returns less data than its file
+size a GPhoto2Error (GP_ERROR_CORRUPTED_DATA) is raised and the
+temporary file is deleted. If there isn't enough disk space for the file
+an OSError (ENOSPC) is raised before any data is copied.
+The whole download runs with the Python GIL released.
+
+Parameters
+----------
+* `folder` :
+    a folder
+* `file` :
+    the name of a file
+* `path` :
+    the local file to write
+* `download_type` :
+    the CameraFileType (default=GP_FILE_TYPE_NORMAL)
+* `sync_file` :
+    flush the file to disk before renaming it (default=False)
+* `chunk_size` :
+    the number of bytes to read at a time
+* `context` :
+    a GPContext (default=None)
+
+Returns
+-------
+the number of bytes copied.
+
+See also gphoto2.Camera.file_get_into"
+%extend _Camera {
+  PyObject *download_to_path(const char *folder, const char *file,
+                             const char *path, CameraFileType download_type,
+                             int sync_file, int chunk_size,
+                             GPContext *context) {
+    uint64_t copied = 0;
+    mode_t mode;
+    int os_errno = 0;
+    int error;
+    if (chunk_size < 1) {
+      PyErr_SetString(PyExc_ValueError, "chunk_size must be positive");
+      return NULL;
+    }
+    // mkstemp() creates files readable only by the owner, so use the
+    // mode open() would have used
+    mode = umask(0);
+    umask(mode);
+    mode = 0666 & ~mode;
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    error = camera_download_to_path(
+      $self, folder, file, path, download_type, sync_file, chunk_size, mode,
+      &copied, &os_errno, context);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+    if (os_errno) {
+      errno = os_errno;
+      PyErr_SetFromErrnoWithFilename(PyExc_OSError, path);
+      return NULL;
+    }
+    if (error < GP_OK) {
+      GPHOTO2_ERROR(error)
+      return NULL;
+    }
+    return PyLong_FromUnsignedLongLong(copied);
+  }
+};
+
+// Camera.walk() returns a CameraWalk object that traverses the camera's
+// folders like Python's os.walk()
+%{
+typedef struct CameraWalk {
+  Camera    *camera;
+  GPContext *context;
+  int       with_info;
+  PyObject  *stack;       // folders still to be visited
+  PyObject  *folder;      // folder returned by previous item
+  PyObject  *subfolders;  // subfolders returned by previous item
+} CameraWalk;
+
+// Constructor defined outside %extend as not callable from Python
+static CameraWalk *new_CameraWalk(Camera *camera, const char *top,
+                                  int with_info, GPContext *context) {
+  CameraWalk *self = calloc(1, sizeof(CameraWalk));
+  if (!self) {
+    PyErr_SetString(PyExc_MemoryError, "Cannot allocate CameraWalk");
+    return NULL;
   }
-  else if (*$1 == GP_EVENT_UNKNOWN && *$2 != NULL) {
-    $result = SWIG_AppendOutput($result, PyString_FromString(*$2));
-    free(*$2);
+  self->stack = Py_BuildValue("[s]", top);
+  if (!self->stack) {
+    free(self);
+    return NULL;
   }
-  else {
-    SWIG_Py_INCREF(Py_None);
-    $result = SWIG_AppendOutput($result, Py_None);
-    if (*$2 != NULL)
-      free(*$2);
+  gp_camera_ref(camera);
+  self->camera = camera;
+  if (context)
+    gp_context_ref(context);
+  self->context = context;
+  self->with_info = with_info;
+  return self;
+}
+
+// Push the previous item's subfolders onto the stack, in reverse order so
+// the first one is visited next. The user may have modified the list.
+static int CameraWalk_push(CameraWalk *self) {
+  Py_ssize_t n = PyList_Size(self->subfolders);
+  const char *base = PyUnicode_AsUTF8(self->folder);
+  const char *format = "%U/%U";
+  if (n < 0 || !base)
+    return -1;
+  if (base[0] && base[strlen(base) - 1] == '/')
+    format = "%U%U";
+  while (n-- > 0) {
+    PyObject *path = PyUnicode_FromFormat(
+      format, self->folder, PyList_GET_ITEM(self->subfolders, n));
+    if (!path)
+      return -1;
+    if (PyList_Append(self->stack, path) < 0) {
+      SWIG_Py_DECREF(path);
+      return -1;
+    }
+    SWIG_Py_DECREF(path);
   }
+  Py_CLEAR(self->folder);
+  Py_CLEAR(self->subfolders);
+  return 0;
 }
 
+// Convert the names in a CameraList to a Python list of str
+static PyObject *camera_list_names(CameraList *list) {
+  int count = gp_list_count(list);
+  PyObject *result = PyList_New(count > 0 ? count : 0);
+  int n;
+  if (!result)
+    return NULL;
+  for (n = 0; n < count; n++) {
+    const char *name = NULL;
+    PyObject *py_name = NULL;
+    int error = gp_list_get_name(list, n, &name);
+    if (error < GP_OK) {
+      GPHOTO2_ERROR(error)
+      SWIG_Py_DECREF(result);
+      return NULL;
+    }
+    py_name = PyUnicode_FromString(name);
+    if (!py_name) {
+      SWIG_Py_DECREF(result);
+      return NULL;
+    }
+    PyList_SET_ITEM(result, n, py_name);
+  }
+  return result;
+}
+
+// Get the CameraFileInfo of every file in a CameraList. Each info is
+// allocated separately so it can be owned by a Python object.
+static int camera_get_file_infos(Camera *camera, const char *folder,
+                                 CameraList *files, CameraFileInfo ***infos,
+                                 GPContext *context) {
+  int count = gp_list_count(files);
+  int error = GP_OK;
+  int n;
+  *infos = NULL;
+  if (count <= 0)
+    return count;
+  *infos = calloc(count, sizeof(CameraFileInfo *));
+  if (!*infos)
+    return GP_ERROR_NO_MEMORY;
+  for (n = 0; n < count; n++) {
+    const char *name = NULL;
+    error = gp_list_get_name(files, n, &name);
+    if (error < GP_OK)
+      break;
+    (*infos)[n] = calloc(1, sizeof(CameraFileInfo));
+    if (!(*infos)[n]) {
+      error = GP_ERROR_NO_MEMORY;
+      break;
+    }
+    error = gp_camera_file_get_info(camera, folder, name, (*infos)[n],
+                                    context);
+    if (error < GP_OK)
+      break;
+  }
+  return error;
+}
+
+// Free the result of camera_get_file_infos
+static void free_file_infos(CameraFileInfo **infos, int count) {
+  int n;
+  if (!infos)
+    return;
+  for (n = 0; n < count; n++)
+    free(infos[n]);
+  free(infos);
+}
+%}
+
+%feature("docstring") CameraWalk
+"Iterator over the camera's folders, similar to Python's os.walk().
+
+Each item is a (folder, subfolders, files) tuple. subfolders is a list
+of folder names which may be modified in place to control which folders
+are visited next. files is a list of file names, or a dict mapping file
+names to CameraFileInfo objects if with_info is set.
+
+Camera communication for each folder is done with the Python GIL
+released."
+%feature("python:tp_iter") CameraWalk "PyObject_SelfIter";
+%feature("python:slot", "tp_iternext", functype="iternextfunc")
+  CameraWalk::__next__;
+// SWIG doesn't need to know about CameraWalk internals
+typedef struct CameraWalk {} CameraWalk;
+%extend CameraWalk {
+  ~CameraWalk() {
+    gp_camera_unref($self->camera);
+    if ($self->context)
+      gp_context_unref($self->context);
+    SWIG_Py_XDECREF($self->stack);
+    SWIG_Py_XDECREF($self->folder);
+    SWIG_Py_XDECREF($self->subfolders);
+    free($self);
+  }
+  PyObject *__next__() {
+    PyObject *folder = NULL;
+    PyObject *subfolders = NULL;
+    PyObject *files = NULL;
+    PyObject *result = NULL;
+    CameraList *folder_list = NULL;
+    CameraList *file_list = NULL;
+    CameraFileInfo **infos = NULL;
+    const char *path = NULL;
+    Py_ssize_t stack_len;
+    int error;
+    int n;
+    if ($self->subfolders && CameraWalk_push($self) < 0)
+      return NULL;
+    stack_len = PyList_GET_SIZE($self->stack);
+    if (stack_len == 0) {
+      PyErr_SetNone(PyExc_StopIteration);
+      return NULL;
+    }
+    folder = PyList_GET_ITEM($self->stack, stack_len - 1);
+    SWIG_Py_INCREF(folder);
+    if (PyList_SetSlice($self->stack, stack_len - 1, stack_len, NULL) < 0)
+      goto fail;
+    path = PyUnicode_AsUTF8(folder);
+    if (!path)
+      goto fail;
+    error = gp_list_new(&folder_list);
+    if (error >= GP_OK)
+      error = gp_list_new(&file_list);
+    if (error >= GP_OK) {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      error = gp_camera_folder_list_folders(
+        $self->camera, path, folder_list, $self->context);
+      if (error >= GP_OK)
+        error = gp_camera_folder_list_files(
+          $self->camera, path, file_list, $self->context);
+      if (error >= GP_OK && $self->with_info)
+        error = camera_get_file_infos(
+          $self->camera, path, file_list, &infos, $self->context);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+    if (error < GP_OK) {
+      GPHOTO2_ERROR(error)
+      goto fail;
+    }
+    subfolders = camera_list_names(folder_list);
+    if (!subfolders)
+      goto fail;
+    if ($self->with_info) {
+      files = PyDict_New();
+      for (n = 0; files && n < gp_list_count(file_list); n++) {
+        const char *name = NULL;
+        PyObject *info = NULL;
+        error = gp_list_get_name(file_list, n, &name);
+        if (error < GP_OK) {
+          GPHOTO2_ERROR(error)
+          Py_CLEAR(files);
+          break;
+        }
+        info = SWIG_NewPointerObj(
+          infos[n], SWIGTYPE_p__CameraFileInfo, SWIG_POINTER_OWN);
+        infos[n] = NULL;
+        if (!info || PyDict_SetItemString(files, name, info) < 0)
+          Py_CLEAR(files);
+        SWIG_Py_XDECREF(info);
+      }
+    }
+    else
+      files = camera_list_names(file_list);
+    if (!files)
+      goto fail;
+    result = PyTuple_Pack(3, folder, subfolders, files);
+    if (!result)
+      goto fail;
+    // keep folder and subfolders for the next call
+    $self->folder = folder;
+    $self->subfolders = subfolders;
+    folder = NULL;
+    subfolders = NULL;
+fail:
+    if (folder_list)
+      gp_list_unref(folder_list);
+    if (file_list)
+      gp_list_unref(file_list);
+    free_file_infos(infos, file_list ? gp_list_count(file_list) : 0);
+    SWIG_Py_XDECREF(folder);
+    SWIG_Py_XDECREF(subfolders);
+    SWIG_Py_XDECREF(files);
+    return result;
+  }
+};
+
+// Add walk() method to _Camera
+%typemap(default) const char *top %{
+  $1 = (char *)"/";
+%}
+%typemap(doc) const char *top "$1_name: str (default='/')";
+%typemap(default) int with_info %{
+  $1 = 0;
+%}
+%typemap(doc) int with_info "$1_name: bool (default=False)";
+%feature("docstring") _Camera::walk "Traverse the camera's folders, similar to Python's os.walk().
+
+Parameters
+----------
+* `top` :
+    the folder to start from (default='/')
+* `with_info` :
+    get the CameraFileInfo of every file (default=False)
+* `context` :
+    a GPContext (default=None)
+
+Returns
+-------
+a CameraWalk iterator that produces (folder, subfolders, files) tuples."
+%newobject _Camera::walk;
+%extend _Camera {
+  CameraWalk *walk(const char *top, int with_info, GPContext *context) {
+    return new_CameraWalk($self, top, with_info, context);
+  }
+};
+
+// Camera.file_get_info_many() gets the info of many files in one call
+%{
+typedef struct {
+  Py_ssize_t      count;
+  char            **folders;
+  char            **names;
+  CameraFileInfo  **infos;
+  int             *errors;
+} FileInfoBatch;
+
+static void free_FileInfoBatch(FileInfoBatch *batch) {
+  Py_ssize_t n;
+  for (n = 0; n < batch->count; n++) {
+    if (batch->folders)
+      free(batch->folders[n]);
+    if (batch->names)
+      free(batch->names[n]);
+  }
+  free(batch->folders);
+  free(batch->names);
+  free(batch->errors);
+  free_file_infos(batch->infos, batch->count);
+}
+
+// Copy the (folder, name) pairs in a Python sequence to a FileInfoBatch
+static int FileInfoBatch_init(FileInfoBatch *batch, PyObject *paths) {
+  PyObject *seq = PySequence_Fast(paths, "paths must be a sequence");
+  Py_ssize_t n;
+  if (!seq)
+    return -1;
+  batch->count = PySequence_Fast_GET_SIZE(seq);
+  batch->folders = calloc(batch->count + 1, sizeof(char *));
+  batch->names = calloc(batch->count + 1, sizeof(char *));
+  batch->infos = calloc(batch->count + 1, sizeof(CameraFileInfo *));
+  batch->errors = calloc(batch->count + 1, sizeof(int));
+  if (!(batch->folders && batch->names && batch->infos && batch->errors)) {
+    PyErr_SetString(PyExc_MemoryError, "Cannot allocate file info batch");
+    goto fail;
+  }
+  for (n = 0; n < batch->count; n++) {
+    PyObject *pair = PySequence_Fast(
+      PySequence_Fast_GET_ITEM(seq, n),
+      "paths must contain (folder, name) pairs");
+    const char *folder = NULL;
+    const char *name = NULL;
+    if (!pair)
+      goto fail;
+    if (PySequence_Fast_GET_SIZE(pair) != 2) {
+      SWIG_Py_DECREF(pair);
+      PyErr_SetString(PyExc_TypeError,
+                      "paths must contain (folder, name) pairs");
+      goto fail;
+    }
+    folder = PyUnicode_AsUTF8(PySequence_Fast_GET_ITEM(pair, 0));
+    name = folder ? PyUnicode_AsUTF8(PySequence_Fast_GET_ITEM(pair, 1))
+                  : NULL;
+    if (!(folder && name)) {
+      SWIG_Py_DECREF(pair);
+      goto fail;
+    }
+    batch->folders[n] = strdup(folder);
+    batch->names[n] = strdup(name);
+    SWIG_Py_DECREF(pair);
+    batch->infos[n] = calloc(1, sizeof(CameraFileInfo));
+    if (!(batch->folders[n] && batch->names[n] && batch->infos[n])) {
+      PyErr_SetString(PyExc_MemoryError, "Cannot allocate file info batch");
+      goto fail;
+    }
+  }
+  SWIG_Py_DECREF(seq);
+  return 0;
+fail:
+  SWIG_Py_DECREF(seq);
+  return -1;
+}
+
+// Get each file's info, without touching any Python objects. Errors are
+// recorded per file.
+static void FileInfoBatch_get(FileInfoBatch *batch, Camera *camera,
+                              GPContext *context) {
+  Py_ssize_t n;
+  for (n = 0; n < batch->count; n++) {
+    batch->errors[n] = gp_camera_file_get_info(
+      camera, batch->folders[n], batch->names[n], batch->infos[n], context);
+    if (batch->errors[n] < GP_OK)
+      memset(batch->infos[n], 0, sizeof(CameraFileInfo));
+  }
+}
+
+// Get a GPhoto2Error instance for a file, or None if there was no error
+static PyObject *FileInfoBatch_error(FileInfoBatch *batch, Py_ssize_t n) {
+  if (batch->errors[n] < GP_OK)
+    return PyObject_CallFunction(PyExc_GPhoto2Error, "i", batch->errors[n]);
+  SWIG_Py_INCREF(Py_None);
+  return Py_None;
+}
+
+// Convert a FileInfoBatch to a dict of lists
+static PyObject *FileInfoBatch_columns(FileInfoBatch *batch) {
+  static const char *keys[] = {
+    "folder", "name", "size", "mtime", "type", "permissions", "error"};
+  PyObject *columns[7] = {NULL};
+  PyObject *result = NULL;
+  Py_ssize_t n;
+  int k;
+  for (k = 0; k < 7; k++) {
+    columns[k] = PyList_New(batch->count);
+    if (!columns[k])
+      goto done;
+  }
+  for (n = 0; n < batch->count; n++) {
+    CameraFileInfoFile *file = &batch->infos[n]->file;
+    PyObject *values[7];
+    values[0] = PyUnicode_FromString(batch->folders[n]);
+    values[1] = PyUnicode_FromString(batch->names[n]);
+    if (file->fields & GP_FILE_INFO_SIZE)
+      values[2] = PyLong_FromUnsignedLongLong(file->size);
+    else {
+      values[2] = Py_None;
+      SWIG_Py_INCREF(Py_None);
+    }
+    if (file->fields & GP_FILE_INFO_MTIME)
+      values[3] = PyLong_FromLongLong(file->mtime);
+    else {
+      values[3] = Py_None;
+      SWIG_Py_INCREF(Py_None);
+    }
+    if (file->fields & GP_FILE_INFO_TYPE)
+      values[4] = PyUnicode_FromString(file->type);
+    else {
+      values[4] = Py_None;
+      SWIG_Py_INCREF(Py_None);
+    }
+    if (file->fields & GP_FILE_INFO_PERMISSIONS)
+      values[5] = PyInt_FromLong(file->permissions);
+    else {
+      values[5] = Py_None;
+      SWIG_Py_INCREF(Py_None);
+    }
+    values[6] = FileInfoBatch_error(batch, n);
+    for (k = 0; k < 7; k++) {
+      if (!values[k]) {
+        while (++k < 7)
+          SWIG_Py_XDECREF(values[k]);
+        goto done;
+      }
+      PyList_SET_ITEM(columns[k], n, values[k]);
+    }
+  }
+  result = PyDict_New();
+  for (k = 0; result && k < 7; k++) {
+    if (PyDict_SetItemString(result, keys[k], columns[k]) < 0)
+      Py_CLEAR(result);
+  }
+done:
+  for (k = 0; k < 7; k++)
+    SWIG_Py_XDECREF(columns[k]);
+  return result;
+}
+
+// Convert a FileInfoBatch to a list of CameraFileInfo objects, taking
+// ownership of the infos, or GPhoto2Error objects
+static PyObject *FileInfoBatch_list(FileInfoBatch *batch) {
+  PyObject *result = PyList_New(batch->count);
+  Py_ssize_t n;
+  if (!result)
+    return NULL;
+  for (n = 0; n < batch->count; n++) {
+    PyObject *info = NULL;
+    if (batch->errors[n] < GP_OK)
+      info = FileInfoBatch_error(batch, n);
+    else {
+      info = SWIG_NewPointerObj(
+        batch->infos[n], SWIGTYPE_p__CameraFileInfo, SWIG_POINTER_OWN);
+      if (info)
+        batch->infos[n] = NULL;
+    }
+    if (!info) {
+      SWIG_Py_DECREF(result);
+      return NULL;
+    }
+    PyList_SET_ITEM(result, n, info);
+  }
+  return result;
+}
+%}
+
+%typemap(default) int columnar %{
+  $1 = 0;
+%}
+%typemap(doc) int columnar "$1_name: bool (default=False)";
+%feature("docstring") _Camera::file_get_info_many "Get the information of several files in one call.
+
+All the gp_camera_file_get_info() calls are made in one loop with the
+Python GIL released. An error getting one file's information doesn't
+stop the others. If `columnar` is set the result is a dict of equal
+length lists, with keys 'folder', 'name', 'size', 'mtime', 'type',
+'permissions' and 'error'. Values the camera doesn't provide are None.
+
+Parameters
+----------
+* `paths` :
+    a sequence of (folder, name) pairs
+* `columnar` :
+    return a dict of lists instead of a list (default=False)
+* `context` :
+    a GPContext (default=None)
+
+Returns
+-------
+a list of CameraFileInfo objects, or a dict of lists. Files whose
+information could not be got have a GPhoto2Error object instead of a
+CameraFileInfo, or in the 'error' list.
+
+See also gphoto2.Camera.file_get_info"
+%extend _Camera {
+  PyObject *file_get_info_many(PyObject *paths, int columnar,
+                               GPContext *context) {
+    FileInfoBatch batch = {0};
+    PyObject *result = NULL;
+    if (FileInfoBatch_init(&batch, paths) < 0)
+      goto done;
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    FileInfoBatch_get(&batch, $self, context);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+    if (columnar)
+      result = FileInfoBatch_columns(&batch);
+    else
+      result = FileInfoBatch_list(&batch);
+done:
+    free_FileInfoBatch(&batch);
+    return result;
+  }
+};
+
+// Camera.preview_stream() returns a CameraPreviewStream object that
+// captures preview frames into a pool of reusable buffers
+%{
+typedef struct CameraPreviewStream {
+  Camera      *camera;
+  GPContext   *context;
+  CameraFile  *camera_file;   // reused for every frame
+  double      interval;       // minimum time between frames
+  double      last_start;     // time the previous capture started
+  long        sequence;
+  int         pool_size;
+  PyObject    **pool;         // bytearray frame buffers
+} CameraPreviewStream;
+
+static double preview_stream_time(void) {
+  struct timeval tv;
+  gettimeofday(&tv, NULL);
+  return (double)tv.tv_sec + ((double)tv.tv_usec / 1.0e6);
+}
+
+// Constructor defined outside %extend as not callable from Python
+static CameraPreviewStream *new_CameraPreviewStream(
+    Camera *camera, double max_fps, int pool_size, GPContext *context) {
+  CameraPreviewStream *self = NULL;
+  int error;
+  if (max_fps < 0.0) {
+    PyErr_SetString(PyExc_ValueError, "max_fps must not be negative");
+    return NULL;
+  }
+  if (pool_size < 1) {
+    PyErr_SetString(PyExc_ValueError, "pool_size must be positive");
+    return NULL;
+  }
+  self = calloc(1, sizeof(CameraPreviewStream));
+  if (self)
+    self->pool = calloc(pool_size, sizeof(PyObject *));
+  if (!self || !self->pool) {
+    free(self);
+    PyErr_SetString(PyExc_MemoryError, "Cannot allocate CameraPreviewStream");
+    return NULL;
+  }
+  error = gp_file_new(&self->camera_file);
+  if (error < GP_OK) {
+    GPHOTO2_ERROR(error)
+    free(self->pool);
+    free(self);
+    return NULL;
+  }
+  gp_camera_ref(camera);
+  self->camera = camera;
+  if (context)
+    gp_context_ref(context);
+  self->context = context;
+  self->interval = max_fps > 0.0 ? 1.0 / max_fps : 0.0;
+  self->pool_size = pool_size;
+  return self;
+}
+
+// Capture one frame, waiting if needed to limit the frame rate. Called
+// with the GIL released.
+static int CameraPreviewStream_capture(CameraPreviewStream *self,
+                                       double *timestamp) {
+  double wait = self->last_start + self->interval - preview_stream_time();
+  int error;
+  if (self->last_start > 0.0 && wait > 0.0) {
+    struct timespec ts;
+    ts.tv_sec = (time_t)wait;
+    ts.tv_nsec = (long)((wait - (double)ts.tv_sec) * 1.0e9);
+    nanosleep(&ts, NULL);
+  }
+  self->last_start = preview_stream_time();
+  error = gp_camera_capture_preview(self->camera, self->camera_file,
+                                    self->context);
+  *timestamp = preview_stream_time();
+  return error;
+}
+
+// Copy frame data into the next pool buffer. A buffer that is still used
+// by a memoryview of an earlier frame is replaced, not overwritten.
+static PyObject *CameraPreviewStream_store(CameraPreviewStream *self,
+                                           const char *data,
+                                           unsigned long int size) {
+  PyObject **slot = &self->pool[self->sequence % self->pool_size];
+  if (*slot && ((PyByteArrayObject *)*slot)->ob_exports > 0)
+    Py_CLEAR(*slot);
+  if (!*slot) {
+    *slot = PyByteArray_FromStringAndSize(NULL, size);
+    if (!*slot)
+      return NULL;
+  }
+  if ((unsigned long int)PyByteArray_GET_SIZE(*slot) < size &&
+      PyByteArray_Resize(*slot, size) < 0)
+    return NULL;
+  memcpy(PyByteArray_AS_STRING(*slot), data, size);
+  return PyMemoryView_FromObject(*slot);
+}
+%}
+
+%feature("docstring") CameraPreviewStream
+"Iterator that captures preview (live view) frames.
+
+Each item is a (sequence, timestamp, data) tuple. sequence counts the
+frames from zero, timestamp is the time the frame was received (in the
+same units as time.time()), and data is a memoryview of the frame data,
+usually a JPEG image.
+
+The frame data is stored in a small pool of reused buffers. A buffer is
+only reused once all memoryviews of its previous frame have been
+released, otherwise a new buffer is allocated, so a frame's data is
+never overwritten. Release the memoryview (or let it be garbage
+collected) when the frame is no longer needed, so its buffer can be
+reused.
+
+Frames are captured with the Python GIL released. The iterator never
+ends, so use break to stop capturing."
+%feature("python:tp_iter") CameraPreviewStream "PyObject_SelfIter";
+%feature("python:slot", "tp_iternext", functype="iternextfunc")
+  CameraPreviewStream::__next__;
+// SWIG doesn't need to know about CameraPreviewStream internals
+typedef struct CameraPreviewStream {} CameraPreviewStream;
+%extend CameraPreviewStream {
+  ~CameraPreviewStream() {
+    int n;
+    gp_camera_unref($self->camera);
+    if ($self->context)
+      gp_context_unref($self->context);
+    gp_file_unref($self->camera_file);
+    for (n = 0; n < $self->pool_size; n++)
+      SWIG_Py_XDECREF($self->pool[n]);
+    free($self->pool);
+    free($self);
+  }
+  PyObject *__next__() {
+    const char *data = NULL;
+    unsigned long int size = 0;
+    double timestamp = 0.0;
+    PyObject *buffer = NULL;
+    PyObject *frame = NULL;
+    PyObject *result = NULL;
+    int error;
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    error = CameraPreviewStream_capture($self, &timestamp);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+    if (error >= GP_OK)
+      error = gp_file_get_data_and_size($self->camera_file, &data, &size);
+    if (error < GP_OK) {
+      GPHOTO2_ERROR(error)
+      return NULL;
+    }
+    buffer = CameraPreviewStream_store($self, data, size);
+    if (!buffer)
+      return NULL;
+    frame = PySequence_GetSlice(buffer, 0, size);
+    SWIG_Py_DECREF(buffer);
+    if (!frame)
+      return NULL;
+    result = Py_BuildValue("(ldN)", $self->sequence, timestamp, frame);
+    $self->sequence++;
+    return result;
+  }
+};
+
+// Add preview_stream() method to _Camera
+%typemap(default) double max_fps %{
+  $1 = 0.0;
+%}
+%typemap(in) double max_fps {
+  if ($input != Py_None) {
+    $1 = PyFloat_AsDouble($input);
+    if ($1 == -1.0 && PyErr_Occurred())
+      SWIG_fail;
+  }
+}
+%typemap(doc) double max_fps "$1_name: float (default=None)";
+%typemap(default) int pool_size %{
+  $1 = 3;
+%}
+%typemap(doc) int pool_size "$1_name: int (default=3)";
+%feature("docstring") _Camera::preview_stream "Capture a continuous stream of preview (live view) frames.
+
+This is quicker than calling capture_preview() in a loop as one
+CameraFile and a few frame buffers are reused for every frame.
+
+Parameters
+----------
+* `max_fps` :
+    maximum frame rate, or None for no limit (default=None)
+* `pool_size` :
+    number of frame buffers to reuse (default=3)
+* `context` :
+    a GPContext (default=None)
+
+Returns
+-------
+a CameraPreviewStream iterator that produces (sequence, timestamp, data)
+tuples."
+%newobject _Camera::preview_stream;
+%extend _Camera {
+  CameraPreviewStream *preview_stream(double max_fps, int pool_size,
+                                      GPContext *context) {
+    return new_CameraPreviewStream($self, max_fps, pool_size, context);
+  }
+};
+
+// Camera.set_config_values() sets several config values in one call
+%{
+// Get the (key, value) items of a mapping as a list or tuple.
+// PyMapping_Items() returns a view, not a list, before Python 3.7.
+static PyObject *mapping_items(PyObject *mapping) {
+  PyObject *items = PyMapping_Items(mapping);
+  PyObject *result = NULL;
+  if (!items)
+    return NULL;
+  result = PySequence_Fast(items, "argument must be a mapping");
+  SWIG_Py_DECREF(items);
+  return result;
+}
+
+// Get the key and value of an item from mapping_items(), as borrowed
+// references
+static int mapping_item(PyObject *items, Py_ssize_t n, PyObject **key,
+                        PyObject **value) {
+  PyObject *item = PySequence_Fast_GET_ITEM(items, n);
+  if (!PyTuple_Check(item) || PyTuple_GET_SIZE(item) != 2) {
+    PyErr_SetString(PyExc_TypeError, "mapping items must be (key, value)"
+                    " pairs");
+    return -1;
+  }
+  *key = PyTuple_GET_ITEM(item, 0);
+  *value = PyTuple_GET_ITEM(item, 1);
+  return 0;
+}
+
+// Check a Python value against a widget's type, range or choices, then
+// set the widget's value
+static int widget_set_py_value(CameraWidget *widget, PyObject *py_value) {
+  CameraWidgetType type;
+  int readonly = 0;
+  int error = gp_widget_get_type(widget, &type);
+  if (error >= GP_OK)
+    error = gp_widget_get_readonly(widget, &readonly);
+  if (error < GP_OK) {
+    GPHOTO2_ERROR(error)
+    return -1;
+  }
+  if (readonly) {
+    PyErr_SetString(PyExc_ValueError, "widget is read only");
+    return -1;
+  }
+  switch (type) {
+    case GP_WIDGET_DATE:
+    case GP_WIDGET_TOGGLE: {
+      int int_val;
+      if (!PyLong_Check(py_value)) {
+        PyErr_SetString(PyExc_TypeError, "value must be an int");
+        return -1;
+      }
+      int_val = (int)PyLong_AsLong(py_value);
+      if (int_val == -1 && PyErr_Occurred())
+        return -1;
+      error = gp_widget_set_value(widget, &int_val);
+      break;
+    }
+    case GP_WIDGET_RANGE: {
+      float min = 0.0, max = 0.0, increment = 0.0;
+      float flt_val = (float)PyFloat_AsDouble(py_value);
+      if (flt_val == -1.0 && PyErr_Occurred())
+        return -1;
+      error = gp_widget_get_range(widget, &min, &max, &increment);
+      if (error < GP_OK)
+        break;
+      if (flt_val < min || flt_val > max) {
+        PyErr_Format(PyExc_ValueError, "value %g outside range %g to %g",
+                     (double)flt_val, (double)min, (double)max);
+        return -1;
+      }
+      error = gp_widget_set_value(widget, &flt_val);
+      break;
+    }
+    case GP_WIDGET_MENU:
+    case GP_WIDGET_RADIO:
+    case GP_WIDGET_TEXT: {
+      const char *str_val = PyUnicode_AsUTF8(py_value);
+      if (!str_val)
+        return -1;
+      if (type != GP_WIDGET_TEXT) {
+        int count = gp_widget_count_choices(widget);
+        int n;
+        for (n = 0; n < count; n++) {
+          const char *choice = NULL;
+          if (gp_widget_get_choice(widget, n, &choice) >= GP_OK &&
+              choice && !strcmp(choice, str_val))
+            break;
+        }
+        if (n >= count) {
+          PyErr_Format(PyExc_ValueError, "'%s' is not a valid choice",
+                       str_val);
+          return -1;
+        }
+      }
+      error = gp_widget_set_value(widget, str_val);
+      break;
+    }
+    default:
+      PyErr_SetString(PyExc_TypeError, "widget does not have a value");
+      return -1;
+  }
+  if (error < GP_OK) {
+    GPHOTO2_ERROR(error)
+    return -1;
+  }
+  return 0;
+}
+
+// Store the result of setting one value. A gphoto2 error code or the
+// current Python exception is stored as an exception object.
+static int config_value_result(PyObject *results, PyObject *key,
+                               int error) {
+  PyObject *result = NULL;
+  int status;
+  if (PyErr_Occurred()) {
+    PyObject *exc_type, *exc_tb;
+    PyErr_Fetch(&exc_type, &result, &exc_tb);
+    PyErr_NormalizeException(&exc_type, &result, &exc_tb);
+    if (exc_tb)
+      PyException_SetTraceback(result, exc_tb);
+    SWIG_Py_XDECREF(exc_type);
+    SWIG_Py_XDECREF(exc_tb);
+  }
+  else if (error < GP_OK)
+    result = PyObject_CallFunction(PyExc_GPhoto2Error, "i", error);
+  else
+    result = SWIG_Py_Void();
+  if (!result)
+    return -1;
+  status = PyDict_SetItem(results, key, result);
+  SWIG_Py_DECREF(result);
+  return status;
+}
+%}
+
+%feature("docstring") _Camera::set_config_values "Set several configuration values.
+
+Each value is checked against its widget's type, range or choices
+before anything is sent to the camera. Only the widgets named in
+`values` are fetched, using gp_camera_get_single_config() and
+gp_camera_set_single_config(). If the camera driver doesn't support
+these, the whole configuration is fetched once and all the new values
+are sent with one gp_camera_set_config() call.
+
+Camera communication is done with the Python GIL released.
+
+Parameters
+----------
+* `values` :
+    a dict of {name: value}
+* `context` :
+    a GPContext (default=None)
+
+Returns
+-------
+a dict of {name: result}. Each result is None if the value was set, or
+the exception (e.g. gphoto2.GPhoto2Error or ValueError) that stopped it
+being set."
+%extend _Camera {
+  PyObject *set_config_values(PyObject *values, GPContext *context) {
+    PyObject *items = NULL;
+    PyObject *results = NULL;
+    PyObject *pending = NULL;
+    CameraWidget *tree = NULL;
+    int use_tree = 0;
+    int error;
+    Py_ssize_t n;
+    items = mapping_items(values);
+    if (!items)
+      return NULL;
+    results = PyDict_New();
+    pending = PyList_New(0);
+    if (!results || !pending)
+      goto fail;
+    for (n = 0; n < PySequence_Fast_GET_SIZE(items); n++) {
+      PyObject *key = NULL;
+      PyObject *value = NULL;
+      CameraWidget *widget = NULL;
+      const char *name = NULL;
+      if (mapping_item(items, n, &key, &value) < 0)
+        goto fail;
+      name = PyUnicode_AsUTF8(key);
+      if (!name)
+        goto fail;
+      error = GP_ERROR_NOT_SUPPORTED;
+      if (!use_tree) {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        error = gp_camera_get_single_config($self, name, &widget, context);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+        use_tree = error == GP_ERROR_NOT_SUPPORTED;
+      }
+      if (use_tree) {
+        if (!tree) {
+          SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+          error = gp_camera_get_config($self, &tree, context);
+          SWIG_PYTHON_THREAD_END_ALLOW;
+          if (error < GP_OK) {
+            GPHOTO2_ERROR(error)
+            goto fail;
+          }
+        }
+        error = gp_widget_get_child_by_name(tree, name, &widget);
+      }
+      if (error >= GP_OK && widget_set_py_value(widget, value) == 0) {
+        if (use_tree) {
+          // result is set after the whole tree is sent
+          if (PyList_Append(pending, key) < 0)
+            goto fail;
+          continue;
+        }
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        error = gp_camera_set_single_config($self, name, widget, context);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+      if (widget && !use_tree)
+        gp_widget_unref(widget);
+      if (config_value_result(results, key, error) < 0)
+        goto fail;
+    }
+    if (tree) {
+      error = GP_OK;
+      if (PyList_GET_SIZE(pending)) {
+        SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+        error = gp_camera_set_config($self, tree, context);
+        SWIG_PYTHON_THREAD_END_ALLOW;
+      }
+      for (n = 0; n < PyList_GET_SIZE(pending); n++)
+        if (config_value_result(
+              results, PyList_GET_ITEM(pending, n), error) < 0)
+          goto fail;
+      gp_widget_unref(tree);
+    }
+    SWIG_Py_DECREF(items);
+    SWIG_Py_DECREF(pending);
+    return results;
+fail:
+    if (tree)
+      gp_widget_unref(tree);
+    SWIG_Py_DECREF(items);
+    SWIG_Py_XDECREF(pending);
+    SWIG_Py_XDECREF(results);
+    return NULL;
+  }
+};
+
+// Camera.export_profile() and Camera.apply_profile() save and restore
+// all the writable config values
+%{
+// Add the path and value of every writable widget to a dict. Buttons and
+// dates (usually the camera's clock) are not included.
+static int camera_profile_add(CameraWidget *widget, PyObject *parent_path,
+                              PyObject *profile) {
+  const char *name = NULL;
+  CameraWidgetType type;
+  int readonly = 0;
+  PyObject *path = NULL;
+  int status = -1;
+  int error = gp_widget_get_name(widget, &name);
+  if (error >= GP_OK)
+    error = gp_widget_get_type(widget, &type);
+  if (error >= GP_OK)
+    error = gp_widget_get_readonly(widget, &readonly);
+  if (error < GP_OK) {
+    GPHOTO2_ERROR(error)
+    return -1;
+  }
+  if (parent_path)
+    path = PyUnicode_FromFormat("%U/%s", parent_path, name);
+  else
+    path = PyUnicode_FromString(name);
+  if (!path)
+    return -1;
+  if (type == GP_WIDGET_WINDOW || type == GP_WIDGET_SECTION) {
+    int count = gp_widget_count_children(widget);
+    int n;
+    for (n = 0; n < count; n++) {
+      CameraWidget *child = NULL;
+      error = gp_widget_get_child(widget, n, &child);
+      if (error < GP_OK) {
+        GPHOTO2_ERROR(error)
+        goto done;
+      }
+      if (camera_profile_add(child, path, profile) < 0)
+        goto done;
+    }
+  }
+  else if (!readonly && type != GP_WIDGET_BUTTON && type != GP_WIDGET_DATE) {
+    PyObject *value = widget_get_py_value(widget, type);
+    if (!value)
+      goto done;
+    error = PyDict_SetItem(profile, path, value);
+    SWIG_Py_DECREF(value);
+    if (error < 0)
+      goto done;
+  }
+  status = 0;
+done:
+  SWIG_Py_DECREF(path);
+  return status;
+}
+
+%}
+
+%feature("docstring") _Camera::export_profile "Get all the camera's writable configuration values.
+
+The result can be saved as JSON and restored later with
+apply_profile(). Date values, such as the camera's clock, are not
+included as they would be out of date when restored.
+
+Parameters
+----------
+* `context` :
+    a GPContext (default=None)
+
+Returns
+-------
+a dict of {path: value}, e.g. {'main/settings/capturetarget': '0', ...}.
+
+See also gphoto2.Camera.apply_profile"
+%extend _Camera {
+  PyObject *export_profile(GPContext *context) {
+    CameraWidget *tree = NULL;
+    PyObject *profile = NULL;
+    int error;
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    error = gp_camera_get_config($self, &tree, context);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+    if (error < GP_OK) {
+      GPHOTO2_ERROR(error)
+      return NULL;
+    }
+    profile = PyDict_New();
+    if (profile && camera_profile_add(tree, NULL, profile) < 0)
+      Py_CLEAR(profile);
+    gp_widget_unref(tree);
+    return profile;
+  }
+};
+
+%typemap(default) int only_changed %{
+  $1 = 1;
+%}
+%typemap(doc) int only_changed "$1_name: bool (default=True)";
+%feature("docstring") _Camera::apply_profile "Set configuration values saved by export_profile().
+
+The whole configuration is fetched once, each value in the profile is
+checked against its widget's type, range or choices, then all the new
+values are sent to the camera with one gp_camera_set_config() call.
+Camera communication is done with the Python GIL released.
+
+Parameters
+----------
+* `profile` :
+    a dict of {path: value}
+* `only_changed` :
+    only set values that differ from the camera's (default=True)
+* `context` :
+    a GPContext (default=None)
+
+Returns
+-------
+a dict of {path: result} for each value that was set or rejected. Each
+result is None if the value was set, or the exception (e.g. KeyError or
+ValueError) that stopped it being set.
+
+See also gphoto2.Camera.export_profile"
+%extend _Camera {
+  PyObject *apply_profile(PyObject *profile, int only_changed,
+                          GPContext *context) {
+    CameraWidget *tree = NULL;
+    PyObject *items = NULL;
+    PyObject *results = NULL;
+    PyObject *pending = NULL;
+    int error;
+    Py_ssize_t n;
+    items = mapping_items(profile);
+    if (!items)
+      return NULL;
+    results = PyDict_New();
+    pending = PyList_New(0);
+    if (!results || !pending)
+      goto fail;
+    SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+    error = gp_camera_get_config($self, &tree, context);
+    SWIG_PYTHON_THREAD_END_ALLOW;
+    if (error < GP_OK) {
+      GPHOTO2_ERROR(error)
+      goto fail;
+    }
+    for (n = 0; n < PySequence_Fast_GET_SIZE(items); n++) {
+      PyObject *key = NULL;
+      PyObject *value = NULL;
+      const char *path = NULL;
+      CameraWidget *widget = NULL;
+      if (mapping_item(items, n, &key, &value) < 0)
+        goto fail;
+      path = PyUnicode_AsUTF8(key);
+      if (!path)
+        goto fail;
+      if (widget_walk_path(tree, path, &widget) < GP_OK) {
+        widget = NULL;
+        PyErr_SetObject(PyExc_KeyError, key);
+      }
+      else if (only_changed) {
+        CameraWidgetType type;
+        PyObject *current = NULL;
+        int same;
+        error = gp_widget_get_type(widget, &type);
+        if (error < GP_OK) {
+          GPHOTO2_ERROR(error)
+          goto fail;
+        }
+        current = widget_get_py_value(widget, type);
+        if (!current)
+          goto fail;
+        same = PyObject_RichCompareBool(current, value, Py_EQ);
+        SWIG_Py_DECREF(current);
+        if (same < 0)
+          PyErr_Clear();
+        if (same > 0)
+          continue;
+      }
+      if (widget && widget_set_py_value(widget, value) == 0) {
+        // result is set after the whole tree is sent
+        if (PyList_Append(pending, key) < 0)
+          goto fail;
+        continue;
+      }
+      if (config_value_result(results, key, GP_OK) < 0)
+        goto fail;
+    }
+    error = GP_OK;
+    if (PyList_GET_SIZE(pending)) {
+      SWIG_PYTHON_THREAD_BEGIN_ALLOW;
+      error = gp_camera_set_config($self, tree, context);
+      SWIG_PYTHON_THREAD_END_ALLOW;
+    }
+    for (n = 0; n < PyList_GET_SIZE(pending); n++)
+      if (config_value_result(
+            results, PyList_GET_ITEM(pending, n), error) < 0)
+        goto fail;
+    gp_widget_unref(tree);
+    SWIG_Py_DECREF(items);
+    SWIG_Py_DECREF(pending);
+    return results;
+fail:
+    if (tree)
+      gp_widget_unref(tree);
+    SWIG_Py_DECREF(items);
+    SWIG_Py_XDECREF(pending);
+    SWIG_Py_XDECREF(results);
+    return NULL;
+  }
+};
+
 // Turn off default exception handling
 %noexception;
 
@@ -0,0 +1,107 @@
+# python-gphoto2 - Python interface to libgphoto2
+# http://github.com/jim-easterbrook/python-gphoto2
+# Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+#
+# This file is part of python-gphoto2.
+#
+# python-gphoto2 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# python-gphoto2 is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with python-gphoto2.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+"""Convert CameraList and file info results to NumPy structured arrays.
+
+NumPy is not a python-gphoto2 requirement. It is only imported when one
+of these functions is called.
+
+Example::
+
+    paths = [(folder, name) for folder, subfolders, names
+             in camera.walk() for name in names]
+    info = file_info_array(camera.file_get_info_many(paths, True))
+    big_files = info[info['size'] > 10000000]
+
+"""
+
+__all__ = ['abilities_array', 'camera_list_array', 'file_info_array']
+
+
+def _str_dtype(values):
+    return 'U{}'.format(max([len(x) for x in values] + [1]))
+
+
+def abilities_array(columns):
+    """Convert the result of CameraAbilitiesList.to_columns() to a NumPy
+    array.
+
+    The array has the same field names as the columns dict. Abilities
+    can then be selected with vectorised expressions, e.g.
+    ``array[array['usb_vendor'] == 0x04b0]['model']``.
+
+    """
+    import numpy as np
+    str_fields = ('model', 'library', 'id')
+    dtype = [(name, _str_dtype(values) if name in str_fields else 'i8')
+             for name, values in sorted(columns.items())]
+    result = np.empty(len(columns['model']), dtype=dtype)
+    for name, values in columns.items():
+        result[name] = values
+    return result
+
+
+def camera_list_array(camera_list):
+    """Convert a CameraList to a NumPy array.
+
+    The array has 'name' and 'value' fields. Missing values are stored
+    as empty strings.
+
+    """
+    import numpy as np
+    items = [(name or '', value or '')
+             for name, value in camera_list.to_tuple()]
+    dtype = [('name', _str_dtype([x[0] for x in items])),
+             ('value', _str_dtype([x[1] for x in items]))]
+    return np.array(items, dtype=dtype)
+
+
+def file_info_array(columns):
+    """Convert the result of Camera.file_get_info_many() to a NumPy array.
+
+    `columns` is the dict returned by file_get_info_many() with columnar
+    set. The array has 'folder', 'name', 'size', 'mtime', 'type',
+    'permissions' and 'error' fields. Values the camera didn't provide
+    are stored as -1 (or an empty string for 'type'). 'error' is the
+    gphoto2 error code of files whose information could not be got, or
+    zero.
+
+    """
+    import numpy as np
+    def fill(values, missing):
+        return [missing if x is None else x for x in values]
+
+    types = fill(columns['type'], '')
+    dtype = [('folder', _str_dtype(columns['folder'])),
+             ('name', _str_dtype(columns['name'])),
+             ('size', 'i8'),
+             ('mtime', 'i8'),
+             ('type', _str_dtype(types)),
+             ('permissions', 'i4'),
+             ('error', 'i4')]
+    result = np.empty(len(columns['name']), dtype=dtype)
+    result['folder'] = columns['folder']
+    result['name'] = columns['name']
+    result['size'] = fill(columns['size'], -1)
+    result['mtime'] = fill(columns['mtime'], -1)
+    result['type'] = types
+    result['permissions'] = fill(columns['permissions'], -1)
+    result['error'] = [0 if x is None else x.code for x in columns['error']]
+    return result
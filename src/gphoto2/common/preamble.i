@@ -60,13 +60,37 @@
 
 // Get PyExc_GPhoto2Error object
 %{
-PyObject *PyExc_GPhoto2Error = NULL;
+static PyObject *PyExc_GPhoto2Error = NULL;
 %}
 %init %{
 {
-  PyObject *module = PyImport_ImportModule("gphoto2");
+  // gphoto2 package is usually already being imported
+  PyObject *module = PyDict_GetItemString(PyImport_GetModuleDict(), "gphoto2");
+  if (module != NULL)
+    Py_INCREF(module);
+  else
+    module = PyImport_ImportModule("gphoto2");
   if (module != NULL) {
     PyExc_GPhoto2Error = PyObject_GetAttrString(module, "GPhoto2Error");
+#if GPHOTO2_VERSION >= 0x02051e00
+    // Use package's locale files, if there are any. libgphoto2 ignores
+    // all but the first call.
+    if (PyExc_GPhoto2Error != NULL) {
+      PyObject *localedir = PyObject_GetAttrString(module, "_localedir");
+      if (localedir == NULL)
+        PyErr_Clear();
+      else {
+        if (PyUnicode_Check(localedir)) {
+          const char *path = PyUnicode_AsUTF8(localedir);
+          if (path == NULL)
+            PyErr_Clear();
+          else
+            gp_init_localedir(path);
+        }
+        SWIG_Py_DECREF(localedir);
+      }
+    }
+#endif
     SWIG_Py_DECREF(module);
   }
   if (PyExc_GPhoto2Error == NULL)
@@ -0,0 +1,90 @@
+// python-gphoto2 - Python interface to libgphoto2
+// http://github.com/jim-easterbrook/python-gphoto2
+// Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+//
+// This file is part of python-gphoto2.
+//
+// python-gphoto2 is free software: you can redistribute it and/or modify
+// it under the terms of the GNU Lesser General Public License as published
+// by the Free Software Foundation, either version 3 of the License, or
+// (at your option) any later version.
+//
+// python-gphoto2 is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+// GNU Lesser General Public License for more details.
+//
+// You should have received a copy of the GNU Lesser General Public License
+// along with python-gphoto2.  If not, see <https://www.gnu.org/licenses/>.
+
+// Widget helper functions used by more than one module. SWIG only includes
+// a file once, so include this before any %import that also includes it.
+
+%{
+// Get a widget's value as a Python object, or None if it has no value
+static PyObject *widget_get_py_value(CameraWidget *widget,
+                                     CameraWidgetType type) {
+  int error = GP_OK;
+  PyObject *result = NULL;
+  switch (type) {
+    case GP_WIDGET_DATE:
+    case GP_WIDGET_TOGGLE: {
+      int int_val = 0;
+      error = gp_widget_get_value(widget, &int_val);
+      result = PyInt_FromLong(int_val);
+      break;
+    }
+    case GP_WIDGET_RANGE: {
+      float flt_val = 0.0;
+      error = gp_widget_get_value(widget, &flt_val);
+      result = PyFloat_FromDouble(flt_val);
+      break;
+    }
+    case GP_WIDGET_MENU:
+    case GP_WIDGET_RADIO:
+    case GP_WIDGET_TEXT: {
+      char *str_val = NULL;
+      error = gp_widget_get_value(widget, &str_val);
+      result = str_val ? PyString_FromString(str_val) : SWIG_Py_Void();
+      break;
+    }
+    default:
+      result = SWIG_Py_Void();
+  }
+  if (error < GP_OK) {
+    SWIG_Py_XDECREF(result);
+    GPHOTO2_ERROR(error)
+    return NULL;
+  }
+  return result;
+}
+
+// Find a widget from its path, e.g. "main/settings/capturetarget"
+static int widget_walk_path(CameraWidget *widget, const char *path,
+                            CameraWidget **child) {
+  const char *name = NULL;
+  const char *end = strchr(path, '/');
+  size_t len = end ? (size_t)(end - path) : strlen(path);
+  int count;
+  int n;
+  int error = gp_widget_get_name(widget, &name);
+  if (error < GP_OK)
+    return error;
+  if (strlen(name) != len || strncmp(name, path, len))
+    return GP_ERROR_BAD_PARAMETERS;
+  if (!end) {
+    *child = widget;
+    return GP_OK;
+  }
+  count = gp_widget_count_children(widget);
+  for (n = 0; n < count; n++) {
+    CameraWidget *next = NULL;
+    error = gp_widget_get_child(widget, n, &next);
+    if (error < GP_OK)
+      return error;
+    if (widget_walk_path(next, end + 1, child) == GP_OK)
+      return GP_OK;
+  }
+  return GP_ERROR_BAD_PARAMETERS;
+}
+%}
@@ -0,0 +1,269 @@
+# python-gphoto2 - Python interface to libgphoto2
+# http://github.com/jim-easterbrook/python-gphoto2
+# Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+#
+# This file is part of python-gphoto2.
+#
+# python-gphoto2 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# python-gphoto2 is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with python-gphoto2.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+"""Helpers for camera configuration.
+
+diff() compares two configurations and fingerprint() makes a short
+hash of a configuration, for example to check several cameras have the
+same settings.
+
+ConfigCache keeps a copy of a camera's configuration values that is
+updated from camera events, so the configuration doesn't need to be
+polled::
+
+    cache = ConfigCache(camera, ttl=300)
+    cache.subscribe(print)
+    while True:
+        event_type, event_data = camera.wait_for_event(1000)
+        cache.handle_event(event_type, event_data)
+        iso = cache['iso']
+
+"""
+
+import hashlib
+import json
+import re
+import time
+
+import gphoto2 as gp
+
+__all__ = ['ConfigCache', 'diff', 'fingerprint', 'flatten']
+
+# libgphoto2's PTP driver sends events like 'PTP Property d10d changed'.
+# Newer versions add ', "name" to "value"'.
+_property_changed = re.compile(
+    r'PTP Property ([0-9a-fA-F]{4}) changed(?:, "([^"]*)" to "(.*)")?')
+
+
+def flatten(widget_dict, paths=False):
+    """Convert a CameraWidget.to_dict() result to a {name: value} dict.
+
+    Only widgets that have a value (i.e. not windows, sections or
+    buttons) are included. If `paths` is set the keys are widget paths
+    such as 'main/settings/capturetarget' instead of names.
+
+    """
+    result = {}
+    stack = [(widget_dict, '')]
+    while stack:
+        item, parent = stack.pop()
+        path = parent + item['name']
+        if 'children' in item:
+            stack.extend((x, path + '/') for x in reversed(item['children']))
+        elif item['type'] not in (gp.GP_WIDGET_WINDOW, gp.GP_WIDGET_SECTION,
+                                  gp.GP_WIDGET_BUTTON):
+            result.setdefault(path if paths else item['name'], item['value'])
+    return result
+
+
+def _path_values(config):
+    if isinstance(config, gp.CameraWidget):
+        config = config.to_dict(True, False)
+    if 'children' in config and 'type' in config:
+        config = flatten(config, paths=True)
+    return config
+
+
+def diff(config_a, config_b):
+    """Compare two camera configurations.
+
+    Each configuration can be a CameraWidget, a CameraWidget.to_dict()
+    result or a {path: value} dict from flatten(). Widget trees are
+    converted with one to_dict() call, so no per-widget Python calls are
+    needed.
+
+    Returns
+    -------
+    a dict of {path: (value_a, value_b)} for every path whose value is
+    different, or is only in one configuration (the missing value is
+    shown as None).
+
+    """
+    values_a = _path_values(config_a)
+    values_b = _path_values(config_b)
+    result = {}
+    for path in values_a.keys() | values_b.keys():
+        value_a = values_a.get(path)
+        value_b = values_b.get(path)
+        if (value_a != value_b or
+                (path in values_a) != (path in values_b)):
+            result[path] = (value_a, value_b)
+    return result
+
+
+def fingerprint(config, ignore=()):
+    """Compute a short hash of a camera configuration.
+
+    Two cameras with the same settings have the same fingerprint, so a
+    fleet of cameras can be checked for drift by comparing fingerprints.
+    `config` can be any of the types accepted by diff(). Values that
+    change all the time, such as 'main/settings/datetime', can be left
+    out by listing their paths in `ignore`.
+
+    Returns
+    -------
+    a str.
+
+    """
+    values = _path_values(config)
+    items = sorted((k, v) for (k, v) in values.items() if k not in ignore)
+    data = json.dumps(items, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha1(data).hexdigest()
+
+
+class ConfigCache(object):
+    """Cache of a camera's configuration values.
+
+    Values are fetched with one Camera.get_config() call, then kept up to
+    date by passing camera events to handle_event(). Property change
+    events cause the changed value to be fetched with
+    Camera.get_single_config(). The whole configuration is fetched again
+    when the cache is older than `ttl` seconds.
+
+    Parameters
+    ----------
+    * `camera` :
+        an initialised gphoto2.Camera
+    * `ttl` :
+        maximum age of the cache in seconds, or None (default=60)
+    * `property_names` :
+        a dict of {PTP property code: config name} (default=None), used
+        to handle events that don't include the config name. Names are
+        also learned from events that do include them.
+    * `context` :
+        a gphoto2.Context (default=None)
+
+    """
+    def __init__(self, camera, ttl=60, property_names=None, context=None):
+        self.camera = camera
+        self.ttl = ttl
+        self.context = context
+        self.property_names = dict(property_names or {})
+        self._subscribers = []
+        self._values = {}
+        self._fetched = None
+
+    def subscribe(self, callback):
+        """Call `callback(changes)` whenever values change.
+
+        changes is a dict of {name: (old_value, new_value)}. A value that
+        is new or has been removed is shown as None.
+
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        self._subscribers.remove(callback)
+
+    def _notify(self, changes):
+        if changes:
+            for callback in list(self._subscribers):
+                callback(changes)
+        return changes
+
+    def _update(self, values):
+        changes = {}
+        for name, new in values.items():
+            old = self._values.get(name)
+            if name not in self._values or new != old:
+                changes[name] = (old, new)
+        self._values.update(values)
+        return changes
+
+    def refresh(self):
+        """Fetch the whole configuration from the camera.
+
+        Returns
+        -------
+        a dict of {name: (old_value, new_value)} changes.
+
+        """
+        values = flatten(self.camera.get_config(self.context).to_dict(
+            True, False))
+        removed = set(self._values).difference(values)
+        changes = self._update(values)
+        for name in removed:
+            changes[name] = (self._values.pop(name), None)
+        self._fetched = time.time()
+        return self._notify(changes)
+
+    def refresh_value(self, name):
+        """Fetch one configuration value from the camera.
+
+        Returns
+        -------
+        a dict of {name: (old_value, new_value)} changes.
+
+        """
+        widget = self.camera.get_single_config(name, self.context)
+        return self._notify(
+            self._update({name: widget.to_dict(False, False)['value']}))
+
+    def handle_event(self, event_type, event_data):
+        """Update the cache from a camera event.
+
+        Pass the results of Camera.wait_for_event() or
+        Camera.drain_events() to this method.
+
+        Returns
+        -------
+        True if the event was a property change.
+
+        """
+        if event_type != gp.GP_EVENT_UNKNOWN:
+            return False
+        match = _property_changed.match(event_data or '')
+        if not match:
+            return False
+        code, name, value = match.groups()
+        code = int(code, 16)
+        if name:
+            self.property_names[code] = name
+        else:
+            name = self.property_names.get(code)
+        if name:
+            try:
+                self.refresh_value(name)
+            except gp.GPhoto2Error:
+                # e.g. driver can't get single config values
+                self._fetched = None
+        else:
+            # don't know which value changed, so refresh everything later
+            self._fetched = None
+        return True
+
+    def _check_age(self):
+        if (self._fetched is None or (
+                self.ttl is not None
+                and time.time() > self._fetched + self.ttl)):
+            self.refresh()
+
+    def __getitem__(self, name):
+        self._check_age()
+        return self._values[name]
+
+    def __contains__(self, name):
+        self._check_age()
+        return name in self._values
+
+    def values(self):
+        """Return a copy of all the cached values as a {name: value} dict."""
+        self._check_age()
+        return dict(self._values)
@@ -0,0 +1,369 @@
+# python-gphoto2 - Python interface to libgphoto2
+# http://github.com/jim-easterbrook/python-gphoto2
+# Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+#
+# This file is part of python-gphoto2.
+#
+# python-gphoto2 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# python-gphoto2 is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with python-gphoto2.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+"""Process-wide cache of camera and port driver lists.
+
+Camera.autodetect() and Camera.init() load every camera driver (camlib)
+and port driver (iolib) each time they are called. The functions in
+this module load the drivers once and share the resulting
+CameraAbilitiesList and GPPortInfoList between all threads::
+
+    cameras = gphoto2.drivers.autodetect()
+    camera = gp.Camera()
+    gphoto2.drivers.init(camera)
+
+open_camera() also remembers the model and port of each camera, by
+serial number, in a small file so a camera can be reopened without
+probing::
+
+    camera = gphoto2.drivers.open_camera(serial='3012345')
+
+abilities_index() returns an AbilitiesIndex, for fast lookups by model
+name or USB ID and for selecting camera models with particular
+abilities.
+
+The cached lists are reloaded if the CAMLIBS or IOLIBS environment
+variables change, or after invalidate() is called. They should not be
+modified.
+
+"""
+
+import json
+import os
+import tempfile
+import threading
+
+import gphoto2 as gp
+
+__all__ = ['AbilitiesIndex', 'abilities_index', 'abilities_list',
+           'autodetect', 'init', 'invalidate', 'open_camera',
+           'port_info_list', 'set_model']
+
+_lock = threading.RLock()
+_abilities = None
+_index = None
+_ports = None
+
+
+def abilities_list(context=None):
+    """Get the shared CameraAbilitiesList, loading it if needed."""
+    global _abilities
+    key = os.environ.get('CAMLIBS')
+    with _lock:
+        if _abilities is None or _abilities[0] != key:
+            abilities = gp.CameraAbilitiesList()
+            abilities.load(context)
+            _abilities = key, abilities
+        return _abilities[1]
+
+
+class AbilitiesIndex(object):
+    """Read-only index of a CameraAbilitiesList.
+
+    The abilities are copied from the list in one
+    CameraAbilitiesList.to_columns() call. `columns` is the resulting
+    dict of tuples, e.g. columns['model'][n] is the model name of the
+    n'th camera. gphoto2.columnar.abilities_array() converts it to a
+    NumPy array.
+
+    Parameters
+    ----------
+    * `abilities_list` :
+        a loaded gphoto2.CameraAbilitiesList
+
+    """
+    def __init__(self, abilities_list):
+        self.abilities_list = abilities_list
+        self.columns = abilities_list.to_columns()
+        self._by_model = {}
+        self._by_usb = {}
+        for n, model in enumerate(self.columns['model']):
+            self._by_model.setdefault(model, n)
+        for n, usb_id in enumerate(zip(self.columns['usb_vendor'],
+                                       self.columns['usb_product'])):
+            if usb_id != (0, 0):
+                self._by_usb.setdefault(usb_id, []).append(n)
+
+    def __len__(self):
+        return len(self.columns['model'])
+
+    def index(self, model):
+        """Get the position of `model` in the abilities list.
+
+        Raises KeyError if the model is not known.
+
+        """
+        return self._by_model[model]
+
+    def abilities(self, model):
+        """Get the gphoto2.CameraAbilities of `model`."""
+        return self.abilities_list[self.index(model)]
+
+    def models(self):
+        """Return a tuple of all the model names."""
+        return self.columns['model']
+
+    def lookup_usb(self, usb_vendor, usb_product):
+        """Get the names of models with a USB vendor and product ID.
+
+        Returns
+        -------
+        a list of str, which is empty if the ID is not known.
+
+        """
+        return [self.columns['model'][n]
+                for n in self._by_usb.get((usb_vendor, usb_product), ())]
+
+    def select(self, operations=0, file_operations=0, folder_operations=0):
+        """Get the names of models that support all the given operations.
+
+        Each parameter is a combination of flags, e.g.
+        select(operations=gp.GP_OPERATION_TRIGGER_CAPTURE
+        | gp.GP_OPERATION_CAPTURE_PREVIEW).
+
+        Returns
+        -------
+        a list of str.
+
+        """
+        columns = self.columns
+        return [model for model, op, file_op, folder_op in zip(
+                    columns['model'], columns['operations'],
+                    columns['file_operations'], columns['folder_operations'])
+                if op & operations == operations
+                and file_op & file_operations == file_operations
+                and folder_op & folder_operations == folder_operations]
+
+
+def abilities_index(context=None):
+    """Get an AbilitiesIndex of the shared CameraAbilitiesList.
+
+    The index is only built once, unless the abilities list is reloaded.
+
+    """
+    global _index
+    with _lock:
+        abilities = abilities_list(context)
+        if _index is None or _index.abilities_list is not abilities:
+            _index = AbilitiesIndex(abilities)
+        return _index
+
+
+def port_info_list(reload=False):
+    """Get the shared GPPortInfoList, loading it if needed.
+
+    The port list includes the USB devices that were connected when it
+    was loaded. Set `reload` to find devices that have been connected
+    since then.
+
+    """
+    global _ports
+    key = os.environ.get('IOLIBS')
+    with _lock:
+        if reload or _ports is None or _ports[0] != key:
+            ports = gp.PortInfoList()
+            ports.load()
+            _ports = key, ports
+        return _ports[1]
+
+
+def invalidate(abilities=True, ports=True):
+    """Discard the cached lists so they are reloaded when next used."""
+    global _abilities, _index, _ports
+    with _lock:
+        if abilities:
+            _abilities = None
+            _index = None
+        if ports:
+            _ports = None
+
+
+def autodetect(context=None, reload_ports=True):
+    """Cached equivalent of gphoto2.Camera.autodetect().
+
+    Only the port list is reloaded (so newly connected cameras are
+    found), unless `reload_ports` is False. The camera drivers are not
+    reloaded.
+
+    Returns
+    -------
+    a gphoto2.CameraList of (model, port) pairs.
+
+    """
+    with _lock:
+        detected = abilities_list(context).detect(
+            port_info_list(reload=reload_ports), context)
+    result = gp.CameraList()
+    for name, value in detected.to_tuple():
+        # skip the generic USB port, as gp_camera_autodetect does
+        if value != 'usb:':
+            result.append(name, value)
+    return result
+
+
+def set_model(camera, model, port, context=None):
+    """Set a camera's abilities and port info from the cached lists.
+
+    A camera configured this way can be initialised without libgphoto2
+    loading all the camera drivers.
+
+    """
+    with _lock:
+        abilities = abilities_list(context)
+        camera.set_abilities(abilities[abilities.lookup_model(model)])
+        ports = port_info_list()
+        try:
+            idx = ports.lookup_path(port)
+        except gp.GPhoto2Error:
+            # port may have been connected since the list was loaded
+            ports = port_info_list(reload=True)
+            idx = ports.lookup_path(port)
+        camera.set_port_info(ports[idx])
+
+
+def init(camera, context=None):
+    """Cached equivalent of gphoto2.Camera.init().
+
+    If the camera's model has not been set, the first camera found by
+    autodetect() is used.
+
+    """
+    if not camera.get_abilities().model:
+        cameras = autodetect(context)
+        if not len(cameras):
+            raise gp.GPhoto2Error(gp.GP_ERROR_MODEL_NOT_FOUND)
+        model, port = cameras[0]
+        set_model(camera, model, port, context)
+    camera.init(context)
+
+
+def _default_cache_path():
+    cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_dir, 'python-gphoto2', 'cameras.json')
+
+
+def _read_cache(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(path, serial, model, port):
+    with _lock:
+        cache = _read_cache(path)
+        if cache.get(serial) == [model, port]:
+            return
+        cache[serial] = [model, port]
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        except OSError:
+            # the cache is only an optimisation
+            return
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def _camera_serial(camera, context):
+    try:
+        return camera.get_single_config(
+            'serialnumber', context).get_value() or None
+    except gp.GPhoto2Error:
+        return None
+
+
+def _candidates(model, port, cached, context):
+    # try the given or cached model and port before probing
+    first = None
+    if model and port:
+        first = model, port
+    elif cached:
+        first = model or cached[0], port or cached[1]
+    if first:
+        yield first
+    for candidate in autodetect(context).to_tuple():
+        if candidate == first:
+            continue
+        if model and candidate[0] != model:
+            continue
+        if port and candidate[1] != port:
+            continue
+        yield candidate
+
+
+def open_camera(model=None, port=None, serial=None, cache_path=None,
+                context=None):
+    """Open a camera, using the cached driver lists.
+
+    If `model` and `port` are known the camera is initialised without
+    probing. Otherwise the model and port last used by the camera with
+    serial number `serial` are tried, then any detected camera that
+    matches `model`, `port` and `serial`. The model and port of the
+    camera that is opened are saved in the cache file.
+
+    Parameters
+    ----------
+    * `model` :
+        camera model name, e.g. 'Nikon DSC D750' (default=None)
+    * `port` :
+        port path, e.g. 'usb:001,005' (default=None)
+    * `serial` :
+        camera serial number (default=None)
+    * `cache_path` :
+        cache file name (default=None). The default is
+        $XDG_CACHE_HOME/python-gphoto2/cameras.json.
+    * `context` :
+        a gphoto2.Context (default=None)
+
+    Returns
+    -------
+    an initialised gphoto2.Camera.
+
+    """
+    if cache_path is None:
+        cache_path = _default_cache_path()
+    cached = None
+    if serial is not None:
+        cached = _read_cache(cache_path).get(serial)
+    for candidate in _candidates(model, port, cached, context):
+        camera = gp.Camera()
+        try:
+            set_model(camera, *candidate, context=context)
+            camera.init(context)
+        except gp.GPhoto2Error:
+            continue
+        camera_serial = _camera_serial(camera, context)
+        if serial is not None and camera_serial != serial:
+            camera.exit(context)
+            continue
+        if camera_serial:
+            _write_cache(cache_path, camera_serial, *candidate)
+        return camera
+    raise gp.GPhoto2Error(gp.GP_ERROR_MODEL_NOT_FOUND)
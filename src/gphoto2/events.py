@@ -0,0 +1,117 @@
+# python-gphoto2 - Python interface to libgphoto2
+# http://github.com/jim-easterbrook/python-gphoto2
+# Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+#
+# This file is part of python-gphoto2.
+#
+# python-gphoto2 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# python-gphoto2 is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with python-gphoto2.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+"""Background thread to collect camera events.
+
+An EventPump repeatedly calls Camera.drain_events() and puts each
+(event_type, event_data) tuple into a queue.Queue or asyncio.Queue.
+Events are collected while the rest of the program is busy, so they are
+less likely to be lost by the camera.
+
+libgphoto2 is not re-entrant for a single camera, so other threads must
+hold the pump's lock while using the camera::
+
+    pump = EventPump(camera)
+    pump.start()
+    with pump.lock:
+        path = camera.capture(gp.GP_CAPTURE_IMAGE)
+    event_type, event_data = pump.queue.get()
+    ...
+    pump.stop()
+
+"""
+
+import asyncio
+from queue import Queue
+import threading
+
+__all__ = ['EventPump']
+
+
+class EventPump(threading.Thread):
+    """Thread that copies camera events into a queue.
+
+    Parameters
+    ----------
+    * `camera` :
+        an initialised gphoto2.Camera
+    * `queue` :
+        a queue.Queue or asyncio.Queue (default=None). A new queue.Queue
+        is created if needed.
+    * `loop` :
+        the asyncio event loop that owns an asyncio.Queue (default=None).
+        The current event loop is used if not set.
+    * `max_events` :
+        maximum number of events to get in one Camera.drain_events call
+    * `timeout` :
+        time to wait for each event, in milliseconds. This is not a limit
+        on the whole Camera.drain_events call.
+    * `interval` :
+        time to wait between Camera.drain_events calls, in seconds
+        (default=0.01). The lock is released during this wait, so other
+        threads can use the camera.
+    * `context` :
+        a gphoto2.Context (default=None)
+
+    If an error occurs the thread stops and the gphoto2.GPhoto2Error
+    exception is stored in the `error` attribute.
+
+    """
+    def __init__(self, camera, queue=None, loop=None, max_events=32,
+                 timeout=100, interval=0.01, context=None):
+        super().__init__(name='gphoto2.EventPump', daemon=True)
+        self.camera = camera
+        self.context = context
+        self.max_events = max_events
+        self.timeout = timeout
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.error = None
+        self._stopping = threading.Event()
+        if queue is None:
+            queue = Queue()
+        self.queue = queue
+        if isinstance(queue, asyncio.Queue):
+            if loop is None:
+                loop = asyncio.get_event_loop()
+            self._put = lambda event: loop.call_soon_threadsafe(
+                queue.put_nowait, event)
+        else:
+            self._put = queue.put
+
+    def run(self):
+        while not self._stopping.is_set():
+            with self.lock:
+                try:
+                    events = self.camera.drain_events(
+                        self.max_events, self.timeout, self.context)
+                except Exception as ex:
+                    self.error = ex
+                    return
+            for event in events:
+                self._put(event)
+            # threading.Lock is not fair, so give other threads a chance
+            # to acquire it
+            self._stopping.wait(self.interval)
+
+    def stop(self):
+        """Stop the thread and wait for it to finish."""
+        self._stopping.set()
+        self.join()
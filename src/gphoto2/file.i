@@ -38,6 +38,7 @@ typedef long int time_t;
 // Allow other Python threads to continue during some function calls
 %thread gp_file_copy;
 %thread gp_file_get_data_and_size;
+%thread gp_file_open;
 %thread gp_file_save;
 %thread gp_file_set_data_and_size;
 
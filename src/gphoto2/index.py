@@ -0,0 +1,256 @@
+# python-gphoto2 - Python interface to libgphoto2
+# http://github.com/jim-easterbrook/python-gphoto2
+# Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+#
+# This file is part of python-gphoto2.
+#
+# python-gphoto2 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# python-gphoto2 is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with python-gphoto2.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+"""Persistent index of camera contents.
+
+A CameraIndex stores the camera's folder listings and the size, mtime and
+MIME type of every file in an SQLite database. Entries are keyed by the
+camera's serial number and storage ID (the first folder level, e.g.
+'/store_00010001'), so one database can index several cameras.
+
+refresh() lists every folder, as the camera has no cheaper way to tell
+if a folder has changed, but after the first scan it only gets file
+information for files that are not already in the index. Camera events
+can be passed to handle_event() to keep the index up to date without
+rescanning::
+
+    index = CameraIndex(camera, 'camera_index.sqlite')
+    index.refresh()
+    for folder, name, size, mtime, mime_type in index.new_files():
+        ...
+    index.mark_synced()
+
+"""
+
+import os
+import sqlite3
+import time
+
+import gphoto2 as gp
+
+__all__ = ['CameraIndex']
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS folders (
+    serial TEXT, folder TEXT, PRIMARY KEY (serial, folder));
+CREATE TABLE IF NOT EXISTS files (
+    serial TEXT, storage TEXT, folder TEXT, name TEXT,
+    size INTEGER, mtime INTEGER, mime_type TEXT, added REAL,
+    PRIMARY KEY (serial, folder, name));
+CREATE TABLE IF NOT EXISTS sync (
+    serial TEXT PRIMARY KEY, last_sync REAL);
+'''
+
+
+def _storage_id(folder):
+    return '/' + folder.split('/')[1]
+
+
+def _camera_serial(camera, context):
+    try:
+        serial = camera.get_single_config('serialnumber', context).get_value()
+        if serial:
+            return serial
+    except gp.GPhoto2Error:
+        pass
+    return '{} {}'.format(camera.get_abilities().model,
+                          camera.get_port_info().get_path())
+
+
+class CameraIndex(object):
+    """Cache of a camera's file listings and file information.
+
+    Parameters
+    ----------
+    * `camera` :
+        an initialised gphoto2.Camera
+    * `path` :
+        the SQLite database file name, or ':memory:'
+    * `serial` :
+        camera identifier (default=None). If not set, the camera's
+        'serialnumber' config value is used, or its model and port if
+        it has no serial number.
+    * `context` :
+        a gphoto2.Context (default=None)
+
+    """
+    def __init__(self, camera, path, serial=None, context=None):
+        self.camera = camera
+        self.context = context
+        if serial is None:
+            serial = _camera_serial(camera, context)
+        self.serial = serial
+        self._db = sqlite3.connect(path)
+        with self._db:
+            self._db.executescript(_SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    def _get_info(self, folder, name):
+        info = self.camera.file_get_info(folder, name, self.context)
+        return info.file.size, info.file.mtime, info.file.type
+
+    def _add_files(self, folder, names):
+        now = time.time()
+        rows = []
+        for name in names:
+            size, mtime, mime_type = self._get_info(folder, name)
+            rows.append((self.serial, _storage_id(folder), folder, name,
+                         size, mtime, mime_type, now))
+        self._db.executemany(
+            'INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            rows)
+
+    def _update_files(self, folder, names):
+        rows = []
+        for name in names:
+            rows.append(self._get_info(folder, name)
+                        + (self.serial, folder, name))
+        self._db.executemany(
+            'UPDATE files SET size = ?, mtime = ?, mime_type = ?'
+            ' WHERE serial = ? AND folder = ? AND name = ?', rows)
+
+    def _cached_names(self, folder):
+        return set(row[0] for row in self._db.execute(
+            'SELECT name FROM files WHERE serial = ? AND folder = ?',
+            (self.serial, folder)))
+
+    def _forget_folder(self, folder):
+        # remove a folder and everything below it
+        prefix = folder.rstrip('/') + '/'
+        for table in ('folders', 'files'):
+            self._db.execute(
+                'DELETE FROM {} WHERE serial = ? AND (folder = ?'
+                ' OR substr(folder, 1, length(?)) = ?)'.format(table),
+                (self.serial, folder, prefix, prefix))
+
+    def refresh(self, top='/', full=False):
+        """Update the index by listing the camera's folders.
+
+        Each folder's file names are compared with the index. File
+        information is only fetched for files that are not in the index,
+        unless `full` is set.
+
+        Returns
+        -------
+        the number of files added to the index.
+
+        """
+        added = 0
+        with self._db:
+            for folder, subfolders, names in self.camera.walk(
+                    top, False, self.context):
+                # compare names, as a file may have been added and
+                # another deleted since the last refresh
+                cached = self._cached_names(folder)
+                new_names = [x for x in names if x not in cached]
+                self._add_files(folder, new_names)
+                added += len(new_names)
+                if full:
+                    self._update_files(
+                        folder, [x for x in names if x in cached])
+                for name in cached.difference(names):
+                    self._db.execute(
+                        'DELETE FROM files WHERE serial = ?'
+                        ' AND folder = ? AND name = ?',
+                        (self.serial, folder, name))
+                self._db.execute(
+                    'INSERT OR REPLACE INTO folders (serial, folder)'
+                    ' VALUES (?, ?)', (self.serial, folder))
+                # forget folders that have been removed from the camera
+                prefix = folder.rstrip('/') + '/'
+                for (child,) in self._db.execute(
+                        'SELECT folder FROM folders WHERE serial = ?'
+                        ' AND substr(folder, 1, length(?)) = ?',
+                        (self.serial, prefix, prefix)).fetchall():
+                    name = child[len(prefix):]
+                    if name and '/' not in name and name not in subfolders:
+                        self._forget_folder(child)
+        return added
+
+    def handle_event(self, event_type, event_data):
+        """Update the index from a camera event.
+
+        Pass the results of Camera.wait_for_event() or
+        Camera.drain_events() to this method.
+
+        Returns
+        -------
+        True if the event changed the index.
+
+        """
+        if event_type not in (gp.GP_EVENT_FILE_ADDED,
+                              gp.GP_EVENT_FILE_CHANGED,
+                              gp.GP_EVENT_FOLDER_ADDED):
+            return False
+        folder, name = event_data.folder, event_data.name
+        if event_type == gp.GP_EVENT_FOLDER_ADDED:
+            self.refresh(os.path.join(folder, name))
+            return True
+        with self._db:
+            if (event_type == gp.GP_EVENT_FILE_CHANGED
+                    and name in self._cached_names(folder)):
+                # keep the time it was added, so it's not a new file
+                self._update_files(folder, [name])
+            else:
+                self._add_files(folder, [name])
+        return True
+
+    def files(self, folder=None, storage=None):
+        """Get (folder, name, size, mtime, mime_type) of indexed files.
+
+        Results can be restricted to one folder or one storage ID.
+
+        """
+        query = ('SELECT folder, name, size, mtime, mime_type FROM files'
+                 ' WHERE serial = ?')
+        params = [self.serial]
+        if folder is not None:
+            query += ' AND folder = ?'
+            params.append(folder)
+        if storage is not None:
+            query += ' AND storage = ?'
+            params.append(storage)
+        return self._db.execute(
+            query + ' ORDER BY folder, name', params).fetchall()
+
+    def new_files(self):
+        """Get files added to the index since the last mark_synced().
+
+        Returns
+        -------
+        a list of (folder, name, size, mtime, mime_type) tuples.
+
+        """
+        row = self._db.execute('SELECT last_sync FROM sync WHERE serial = ?',
+                               (self.serial,)).fetchone()
+        last_sync = row[0] if row else 0.0
+        return self._db.execute(
+            'SELECT folder, name, size, mtime, mime_type FROM files'
+            ' WHERE serial = ? AND added > ? ORDER BY added, folder, name',
+            (self.serial, last_sync)).fetchall()
+
+    def mark_synced(self):
+        """Record that all the files currently indexed have been synced."""
+        with self._db:
+            self._db.execute(
+                'INSERT OR REPLACE INTO sync VALUES (?, ?)',
+                (self.serial, time.time()))
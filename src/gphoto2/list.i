@@ -101,7 +101,10 @@ PLAIN_ARGOUT(CameraList **)
       SWIG_Py_DECREF(name);
       return NULL;
     }
-    return PyTuple_Pack(2, name, value);
+    PyObject *result = PyTuple_Pack(2, name, value);
+    SWIG_Py_DECREF(name);
+    SWIG_Py_DECREF(value);
+    return result;
   }
 }
 
@@ -152,6 +155,13 @@ DEPRECATED(_CameraList::__iter__, 1)
 %feature("docstring") _CameraList::keys "Return an accessor for the names in the list."
 %feature("docstring") _CameraList::values "Return an accessor for the values in the list."
 %feature("docstring") _CameraList::items "Return an accessor for the (name, value) pairs in the list."
+%feature("docstring") _CameraList::to_tuple "Return a tuple of all the (name, value) pairs in the list.
+
+The whole list is converted in one call, which is quicker than
+iterating over items()."
+%feature("docstring") _CameraList::to_dict "Return a dict of all the names and values in the list.
+
+If a name occurs more than once the last value is used."
 %newobject _CameraList::keys;
 %newobject _CameraList::values;
 %newobject _CameraList::items;
@@ -186,6 +196,36 @@ DEPRECATED(_CameraList::__iter__, 1)
   CameraList_accessor* items() {
     return new_CameraList_accessor($self, CameraList_get_item);
   }
+  PyObject *to_tuple() {
+    int count = gp_list_count($self);
+    PyObject *result = PyTuple_New(count > 0 ? count : 0);
+    int n;
+    if (!result)
+      return NULL;
+    for (n = 0; n < count; n++) {
+      PyObject *item = CameraList_get_item($self, n);
+      if (!item) {
+        SWIG_Py_DECREF(result);
+        return NULL;
+      }
+      PyTuple_SET_ITEM(result, n, item);
+    }
+    return result;
+  }
+  PyObject *to_dict() {
+    int count = gp_list_count($self);
+    PyObject *result = PyDict_New();
+    int n;
+    for (n = 0; result && n < count; n++) {
+      PyObject *name = CameraList_get_key($self, n);
+      PyObject *value = name ? CameraList_get_value($self, n) : NULL;
+      if (!value || PyDict_SetItem(result, name, value) < 0)
+        Py_CLEAR(result);
+      SWIG_Py_XDECREF(name);
+      SWIG_Py_XDECREF(value);
+    }
+    return result;
+  }
   PyObject* __iter__() {
     return PySeqIter_New(SWIG_Python_NewPointerObj(
       NULL, SWIG_as_voidptr(_CameraList_items($self)),
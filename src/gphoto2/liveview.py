@@ -0,0 +1,331 @@
+# python-gphoto2 - Python interface to libgphoto2
+# http://github.com/jim-easterbrook/python-gphoto2
+# Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+#
+# This file is part of python-gphoto2.
+#
+# python-gphoto2 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# python-gphoto2 is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with python-gphoto2.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+"""Background live view capture into a bounded ring buffer.
+
+A FrameRing thread captures preview frames with Camera.preview_stream()
+and keeps the most recent ones in a ring buffer. Slow consumers don't
+slow down the capture loop: with the 'drop_oldest' policy the oldest
+frame is discarded when the ring is full. With the 'block' policy the
+capture loop waits for a consumer to take a frame instead.
+
+Consumers can take frames in order with get(), or several consumers can
+each follow the newest frame with latest()::
+
+    ring = FrameRing(camera, depth=4)
+    ring.start()
+    frame = None
+    while True:
+        frame = ring.latest(after=frame and frame.sequence)
+        show(frame.data)
+    ring.stop()
+
+"""
+
+from collections import deque, namedtuple
+import http.server
+import json
+import socketserver
+import threading
+import time
+
+import gphoto2 as gp
+
+__all__ = ['Frame', 'FrameRing', 'LiveViewServer']
+
+Frame = namedtuple('Frame', ('sequence', 'timestamp', 'latency', 'data'))
+Frame.__doc__ = """A live view frame.
+
+sequence counts frames from zero, timestamp is the time the frame was
+received (as time.time()), latency is the time taken to capture it in
+seconds and data is a memoryview of the frame, usually a JPEG image.
+The data is not overwritten by later frames."""
+
+
+class FrameRing(threading.Thread):
+    """Thread that captures preview frames into a ring buffer.
+
+    Parameters
+    ----------
+    * `camera` :
+        an initialised gphoto2.Camera
+    * `depth` :
+        maximum number of frames to keep (default=4)
+    * `policy` :
+        'drop_oldest' or 'block' (default='drop_oldest')
+    * `max_fps` :
+        maximum frame rate, or None for no limit (default=None)
+    * `lock` :
+        a threading.Lock to hold while capturing (default=None), e.g. an
+        EventPump's lock
+    * `context` :
+        a gphoto2.Context (default=None)
+
+    If an error occurs the thread stops and the gphoto2.GPhoto2Error
+    exception is stored in the `error` attribute. Waiting consumers are
+    woken up and get() or latest() raise the exception.
+
+    """
+    def __init__(self, camera, depth=4, policy='drop_oldest', max_fps=None,
+                 lock=None, context=None):
+        super().__init__(name='gphoto2.FrameRing', daemon=True)
+        if depth < 1:
+            raise ValueError('depth must be positive')
+        if policy not in ('drop_oldest', 'block'):
+            raise ValueError("policy must be 'drop_oldest' or 'block'")
+        self.camera = camera
+        self.depth = depth
+        self.policy = policy
+        self.interval = 1.0 / max_fps if max_fps else 0.0
+        self.lock = lock or threading.Lock()
+        self.context = context
+        self.error = None
+        self.frames = 0
+        self.dropped = 0
+        self._frames = deque()
+        self._unread = set()
+        self._history = deque(maxlen=50)
+        self._newest = None
+        self._condition = threading.Condition()
+        self._stopping = threading.Event()
+
+    def run(self):
+        # the stream doesn't overwrite frames that are still in use, so
+        # its data can be stored without copying. A pool bigger than the
+        # ring lets buffers be reused once frames are discarded.
+        stream = iter(self.camera.preview_stream(
+            None, self.depth + 2, self.context))
+        next_start = 0.0
+        while not self._stopping.is_set():
+            wait = next_start - time.time()
+            if wait > 0:
+                self._stopping.wait(wait)
+            try:
+                with self.lock:
+                    # don't count waiting for the lock as latency
+                    start = time.time()
+                    sequence, timestamp, data = next(stream)
+            except Exception as ex:
+                with self._condition:
+                    self.error = ex
+                    self._condition.notify_all()
+                return
+            next_start = start + self.interval
+            self._add(Frame(sequence, timestamp, timestamp - start, data))
+
+    def _add(self, frame):
+        with self._condition:
+            if self.policy == 'block':
+                while (len(self._frames) >= self.depth
+                       and not self._stopping.is_set()):
+                    self._condition.wait()
+                if self._stopping.is_set():
+                    return
+            while len(self._frames) >= self.depth:
+                sequence = self._frames.popleft().sequence
+                if sequence in self._unread:
+                    self._unread.discard(sequence)
+                    self.dropped += 1
+            self._frames.append(frame)
+            self._unread.add(frame.sequence)
+            self._newest = frame
+            self.frames += 1
+            self._history.append((frame.timestamp, frame.latency))
+            self._condition.notify_all()
+
+    def _wait(self, predicate, timeout):
+        if not self._condition.wait_for(
+                lambda: predicate() or self.error or self._stopping.is_set(),
+                timeout):
+            return False
+        if not predicate():
+            if self.error:
+                raise self.error
+            return False
+        return True
+
+    def get(self, timeout=None):
+        """Remove and return the oldest frame in the ring.
+
+        Returns None if no frame arrives within `timeout` seconds or the
+        thread is stopped.
+
+        """
+        with self._condition:
+            if not self._wait(lambda: self._frames, timeout):
+                return None
+            frame = self._frames.popleft()
+            self._unread.discard(frame.sequence)
+            self._condition.notify_all()
+            return frame
+
+    def latest(self, after=None, timeout=None):
+        """Return the newest frame, without removing it from the ring.
+
+        If `after` is a sequence number, wait for a frame newer than it.
+        Returns None if no frame arrives within `timeout` seconds or the
+        thread is stopped.
+
+        """
+        if after is None:
+            after = -1
+        with self._condition:
+            if not self._wait(lambda: (self._newest and
+                                       self._newest.sequence > after),
+                              timeout):
+                return None
+            self._unread.discard(self._newest.sequence)
+            return self._newest
+
+    def stats(self):
+        """Return a dict of capture statistics.
+
+        'dropped' is the number of frames discarded from the ring
+        before get() or latest() returned them. 'fps' and 'latency'
+        (mean capture latency in seconds) are measured over the last 50
+        frames.
+
+        """
+        with self._condition:
+            history = list(self._history)
+            result = {'frames': self.frames, 'dropped': self.dropped,
+                      'fps': 0.0, 'latency': 0.0}
+        if history:
+            result['latency'] = sum(x[1] for x in history) / len(history)
+        if len(history) > 1:
+            duration = history[-1][0] - history[0][0]
+            if duration > 0:
+                result['fps'] = (len(history) - 1) / duration
+        return result
+
+    def stop(self):
+        """Stop the thread and wait for it to finish."""
+        self._stopping.set()
+        with self._condition:
+            self._condition.notify_all()
+        self.join()
+
+
+class _LiveViewHandler(http.server.BaseHTTPRequestHandler):
+    boundary = 'gphoto2frame'
+
+    def do_GET(self):
+        if self.path in ('/', '/stream.mjpg'):
+            self.send_stream()
+        elif self.path == '/stats':
+            self.send_stats()
+        else:
+            self.send_error(404)
+
+    def send_stats(self):
+        stats = self.server.stats()
+        body = json.dumps(stats).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def next_frame(self, frame):
+        # wait for the newest frame, skipping any that arrived while this
+        # client was busy, or return None if the ring has stopped
+        ring = self.server.ring
+        while True:
+            new_frame = ring.latest(
+                after=frame and frame.sequence, timeout=1.0)
+            if new_frame or not ring.is_alive():
+                return new_frame
+
+    def send_stream(self):
+        try:
+            frame = self.next_frame(None)
+        except gp.GPhoto2Error:
+            frame = None
+        if frame is None:
+            self.send_error(503, 'Live view not available')
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'multipart/x-mixed-replace;'
+                         ' boundary=' + self.boundary)
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        self.server.add_client(1)
+        try:
+            while frame:
+                self.wfile.write((
+                    '--{}\r\nContent-Type: image/jpeg\r\n'
+                    'Content-Length: {}\r\n\r\n').format(
+                        self.boundary, len(frame.data)).encode('ascii'))
+                self.wfile.write(frame.data)
+                self.wfile.write(b'\r\n')
+                new_frame = self.next_frame(frame)
+                if new_frame:
+                    self.server.add_skipped(
+                        new_frame.sequence - frame.sequence - 1)
+                frame = new_frame
+        except (ConnectionError, OSError, gp.GPhoto2Error):
+            pass
+        finally:
+            self.server.add_client(-1)
+
+
+class LiveViewServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    """HTTP server that sends a FrameRing's frames to any number of clients.
+
+    '/' or '/stream.mjpg' is a multipart/x-mixed-replace (MJPEG) stream
+    and '/stats' returns the capture statistics and client count as JSON.
+    The stream request fails with status 503 if the FrameRing has
+    stopped, e.g. because of a camera error.
+    Each client is sent the newest frame whenever it's ready for one, so
+    a slow client skips frames without delaying the other clients.
+
+    Parameters
+    ----------
+    * `address` :
+        a (host, port) tuple
+    * `ring` :
+        a running FrameRing
+
+    """
+    daemon_threads = True
+
+    def __init__(self, address, ring):
+        super().__init__(address, _LiveViewHandler)
+        self.ring = ring
+        self.clients = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+    def add_client(self, count):
+        with self._lock:
+            self.clients += count
+
+    def add_skipped(self, count):
+        with self._lock:
+            self.skipped += count
+
+    def stats(self):
+        """Return the FrameRing stats plus 'clients' and 'skipped'."""
+        result = self.ring.stats()
+        with self._lock:
+            result['clients'] = self.clients
+            result['skipped'] = self.skipped
+        return result
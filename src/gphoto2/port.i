@@ -17,13 +17,19 @@
 // You should have received a copy of the GNU Lesser General Public License
 // along with python-gphoto2.  If not, see <https://www.gnu.org/licenses/>.
 
-%module(package="gphoto2") port
+%module(package="gphoto2", threads="1") port
+%nothread;
 #pragma SWIG nowarn=321
 
 %include "common/preamble.i"
 
 %import "port_info_list.i"
 
+// Allow other Python threads to continue during port I/O
+%thread gp_port_open;
+%thread gp_port_close;
+%thread gp_port_reset;
+
 // Turn on default exception handling
 DEFAULT_EXCEPTION
 
@@ -37,16 +43,16 @@ DEFAULT_DTOR(_GPPort, gp_port_free)
 // Add member methods to _GPPort
 MEMBER_FUNCTION(_GPPort,
     void, close, (),
-    gp_port_close, ($self), )
+    gp_port_close, ($self), 1)
 MEMBER_FUNCTION(_GPPort,
     void, get_info, (GPPortInfo *info),
     gp_port_get_info, ($self, info), )
 MEMBER_FUNCTION(_GPPort,
     void, open, (),
-    gp_port_open, ($self), )
+    gp_port_open, ($self), 1)
 MEMBER_FUNCTION(_GPPort,
     void, reset, (),
-    gp_port_reset, ($self), )
+    gp_port_reset, ($self), 1)
 MEMBER_FUNCTION(_GPPort,
     void, set_info, (GPPortInfo info),
     gp_port_set_info, ($self, info), )
@@ -17,7 +17,8 @@
 // You should have received a copy of the GNU Lesser General Public License
 // along with python-gphoto2.  If not, see <https://www.gnu.org/licenses/>.
 
-%module(package="gphoto2") port_info_list
+%module(package="gphoto2", threads="1") port_info_list
+%nothread;
 
 %include "common/preamble.i"
 
@@ -41,6 +42,9 @@ DEPRECATED(_GPPortInfoList::append, 1)
     $result, SWIG_NewPointerObj(*$1, $descriptor(_GPPortInfo*), 0));
 }
 
+// Allow other Python threads to continue while I/O drivers are loaded
+%thread gp_port_info_list_load;
+
 // Make docstring parameter types more Pythonic
 %typemap(doc) GPPortInfo "$1_name: gphoto2.$1_type";
 %typemap(doc) GPPortInfoList * "$1_name: gphoto2.$*1_type";
@@ -102,7 +106,7 @@ MEMBER_FUNCTION(_GPPortInfoList,
     gp_port_info_list_append, ($self, info), )
 MEMBER_FUNCTION(_GPPortInfoList,
     void, load, (),
-    gp_port_info_list_load, ($self), )
+    gp_port_info_list_load, ($self), 1)
 MEMBER_FUNCTION(_GPPortInfoList,
     int, count, (),
     gp_port_info_list_count, ($self), )
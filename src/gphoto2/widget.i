@@ -1,6 +1,6 @@
 // python-gphoto2 - Python interface to libgphoto2
 // http://github.com/jim-easterbrook/python-gphoto2
-// Copyright (C) 2014-24  Jim Easterbrook  jim@jim-easterbrook.me.uk
+// Copyright (C) 2014-25  Jim Easterbrook  jim@jim-easterbrook.me.uk
 //
 // This file is part of python-gphoto2.
 //
@@ -20,6 +20,7 @@
 %module(package="gphoto2") widget
 
 %include "common/preamble.i"
+%include "common/widget_util.i"
 
 %rename(CameraWidget) _CameraWidget;
 
@@ -78,6 +79,7 @@ Beware of changes in the libgphoto2 definitions though.
       GPHOTO2_ERROR(error);
       SWIG_fail;
     }
+    widget_count_wrapper(root);
   }
   // Append result to output object
   $result = SWIG_AppendOutput(
@@ -291,6 +293,87 @@ int gp_widget_get_choices(CameraWidget* widget, PyObject **iter) {
 // Add default destructor to _CameraWidget
 // Destructor decrefs root widget
 %{
+// Index of widget trees, used by __getitem__(path), find() and the cached
+// choices. Each entry is keyed by the tree's root widget and holds a
+// reference to it. The entry is created by a lookup on the root widget and
+// removed when the last Python object of any widget in the tree is
+// deleted, so each new tree gets a new index.
+static PyObject *widget_index_cache = NULL;
+
+// Number of Python objects of each tree, not counting the one created
+// with the tree by gp_camera_get_config() etc., keyed by root widget.
+// These are the objects made by the CameraWidget **child, **root and
+// **parent typemaps, each of which holds a reference to the root.
+static PyObject *widget_wrapper_counts = NULL;
+
+static void widget_count_wrapper(CameraWidget *root) {
+  PyObject *key = NULL;
+  PyObject *count = NULL;
+  if (!widget_wrapper_counts) {
+    widget_wrapper_counts = PyDict_New();
+    if (!widget_wrapper_counts) {
+      PyErr_Clear();
+      return;
+    }
+  }
+  key = PyLong_FromVoidPtr(root);
+  if (key) {
+    count = PyDict_GetItem(widget_wrapper_counts, key);
+    count = PyLong_FromLong(count ? PyLong_AsLong(count) + 1 : 1);
+  }
+  if (!(key && count && PyDict_SetItem(widget_wrapper_counts, key, count) == 0))
+    PyErr_Clear();
+  SWIG_Py_XDECREF(key);
+  SWIG_Py_XDECREF(count);
+}
+
+// Decrement the tree's object count. Returns 1 if the object being deleted
+// is the last one of the tree.
+static int widget_uncount_wrapper(CameraWidget *root) {
+  PyObject *key = NULL;
+  PyObject *count = NULL;
+  long value;
+  if (!widget_wrapper_counts)
+    return 1;
+  key = PyLong_FromVoidPtr(root);
+  if (!key) {
+    PyErr_Clear();
+    return 0;
+  }
+  count = PyDict_GetItem(widget_wrapper_counts, key);
+  if (!count) {
+    SWIG_Py_DECREF(key);
+    return 1;
+  }
+  value = PyLong_AsLong(count) - 1;
+  if (value > 0) {
+    count = PyLong_FromLong(value);
+    if (!(count && PyDict_SetItem(widget_wrapper_counts, key, count) == 0))
+      PyErr_Clear();
+    SWIG_Py_XDECREF(count);
+  }
+  else if (PyDict_DelItem(widget_wrapper_counts, key) < 0)
+    PyErr_Clear();
+  SWIG_Py_DECREF(key);
+  return 0;
+}
+
+static void widget_index_drop(CameraWidget *root) {
+  PyObject *key = NULL;
+  if (!widget_index_cache)
+    return;
+  key = PyLong_FromVoidPtr(root);
+  if (!key) {
+    PyErr_Clear();
+    return;
+  }
+  if (PyDict_GetItem(widget_index_cache, key)) {
+    PyDict_DelItem(widget_index_cache, key);
+    gp_widget_unref(root);
+  }
+  SWIG_Py_DECREF(key);
+}
+
 static int widget_dtor(CameraWidget *widget) {
   if (widget == NULL)
     return GP_OK;
@@ -299,6 +382,8 @@ static int widget_dtor(CameraWidget *widget) {
     int error = gp_widget_get_root(widget, &root);
     if (error < GP_OK)
       return error;
+    if (widget_uncount_wrapper(root))
+      widget_index_drop(root);
     return gp_widget_unref(root);
   }
 }
@@ -307,11 +392,279 @@ struct _CameraWidget {};
 DEFAULT_DTOR(_CameraWidget, widget_dtor)
 
 
-// Make _CameraWidget more like a list
+// Functions to build and use the widget tree index
+%{
+// Add a widget and its children to an index. paths maps each widget's
+// path to its address, names maps each name to a list of paths.
+static int widget_index_add(CameraWidget *widget, PyObject *parent_path,
+                            PyObject *paths, PyObject *names) {
+  const char *name = NULL;
+  PyObject *path = NULL;
+  PyObject *address = NULL;
+  PyObject *name_paths = NULL;
+  int error = gp_widget_get_name(widget, &name);
+  int count;
+  int n;
+  if (error < GP_OK) {
+    GPHOTO2_ERROR(error)
+    return -1;
+  }
+  if (parent_path)
+    path = PyUnicode_FromFormat("%U/%s", parent_path, name);
+  else
+    path = PyUnicode_FromString(name);
+  if (!path)
+    return -1;
+  address = PyLong_FromVoidPtr(widget);
+  if (!address || PyDict_SetItem(paths, path, address) < 0)
+    goto fail;
+  name_paths = PyDict_GetItemString(names, name);
+  if (name_paths)
+    SWIG_Py_INCREF(name_paths);
+  else {
+    name_paths = PyList_New(0);
+    if (!name_paths || PyDict_SetItemString(names, name, name_paths) < 0)
+      goto fail;
+  }
+  if (PyList_Append(name_paths, path) < 0)
+    goto fail;
+  count = gp_widget_count_children(widget);
+  for (n = 0; n < count; n++) {
+    CameraWidget *child = NULL;
+    error = gp_widget_get_child(widget, n, &child);
+    if (error < GP_OK) {
+      GPHOTO2_ERROR(error)
+      goto fail;
+    }
+    if (widget_index_add(child, path, paths, names) < 0)
+      goto fail;
+  }
+  SWIG_Py_DECREF(path);
+  SWIG_Py_DECREF(address);
+  SWIG_Py_DECREF(name_paths);
+  return 0;
+fail:
+  SWIG_Py_XDECREF(path);
+  SWIG_Py_XDECREF(address);
+  SWIG_Py_XDECREF(name_paths);
+  return -1;
+}
+
+// Get the (paths, names, choices) index of a widget's tree. Sets *index to a
+// borrowed reference, or NULL if the tree has no index and widget isn't
+// the root.
+static int widget_get_index(CameraWidget *widget, PyObject **index) {
+  CameraWidget *root = NULL;
+  PyObject *key = NULL;
+  PyObject *paths = NULL;
+  PyObject *names = NULL;
+  PyObject *choices = NULL;
+  int error = gp_widget_get_root(widget, &root);
+  *index = NULL;
+  if (error < GP_OK) {
+    GPHOTO2_ERROR(error)
+    return -1;
+  }
+  if (!widget_index_cache) {
+    widget_index_cache = PyDict_New();
+    if (!widget_index_cache)
+      return -1;
+  }
+  key = PyLong_FromVoidPtr(root);
+  if (!key)
+    return -1;
+  *index = PyDict_GetItem(widget_index_cache, key);
+  if (*index || widget != root) {
+    SWIG_Py_DECREF(key);
+    return 0;
+  }
+  paths = PyDict_New();
+  names = PyDict_New();
+  choices = PyDict_New();
+  if (paths && names && choices &&
+      widget_index_add(root, NULL, paths, names) == 0) {
+    *index = PyTuple_Pack(3, paths, names, choices);
+    if (*index && PyDict_SetItem(widget_index_cache, key, *index) == 0) {
+      gp_widget_ref(root);
+      SWIG_Py_DECREF(*index);
+    }
+    else
+      Py_CLEAR(*index);
+  }
+  SWIG_Py_DECREF(key);
+  SWIG_Py_XDECREF(paths);
+  SWIG_Py_XDECREF(names);
+  SWIG_Py_XDECREF(choices);
+  return *index ? 0 : -1;
+}
+
+// Get a widget's (choices tuple, choices frozenset, {choice: index} dict),
+// using the tree index's cache if there is one
+static PyObject *widget_choice_info(CameraWidget *widget) {
+  PyObject *index = NULL;
+  PyObject *key = NULL;
+  PyObject *choices = NULL;
+  PyObject *choice_set = NULL;
+  PyObject *positions = NULL;
+  PyObject *result = NULL;
+  int count;
+  int n;
+  if (widget_get_index(widget, &index) < 0)
+    return NULL;
+  key = PyLong_FromVoidPtr(widget);
+  if (!key)
+    return NULL;
+  if (index) {
+    result = PyDict_GetItem(PyTuple_GET_ITEM(index, 2), key);
+    if (result) {
+      SWIG_Py_INCREF(result);
+      SWIG_Py_DECREF(key);
+      return result;
+    }
+  }
+  count = gp_widget_count_choices(widget);
+  if (count < GP_OK) {
+    GPHOTO2_ERROR(count)
+    goto fail;
+  }
+  choices = PyTuple_New(count);
+  positions = PyDict_New();
+  if (!choices || !positions)
+    goto fail;
+  for (n = 0; n < count; n++) {
+    const char *choice = NULL;
+    PyObject *py_choice = NULL;
+    PyObject *py_n = NULL;
+    int error = gp_widget_get_choice(widget, n, &choice);
+    if (error < GP_OK) {
+      GPHOTO2_ERROR(error)
+      goto fail;
+    }
+    py_choice = PyUnicode_FromString(choice);
+    if (!py_choice)
+      goto fail;
+    PyTuple_SET_ITEM(choices, n, py_choice);
+    if (!PyDict_GetItem(positions, py_choice)) {
+      py_n = PyInt_FromLong(n);
+      if (!py_n || PyDict_SetItem(positions, py_choice, py_n) < 0) {
+        SWIG_Py_XDECREF(py_n);
+        goto fail;
+      }
+      SWIG_Py_DECREF(py_n);
+    }
+  }
+  choice_set = PyFrozenSet_New(choices);
+  if (!choice_set)
+    goto fail;
+  result = PyTuple_Pack(3, choices, choice_set, positions);
+  if (result && index &&
+      PyDict_SetItem(PyTuple_GET_ITEM(index, 2), key, result) < 0)
+    Py_CLEAR(result);
+fail:
+  SWIG_Py_DECREF(key);
+  SWIG_Py_XDECREF(choices);
+  SWIG_Py_XDECREF(choice_set);
+  SWIG_Py_XDECREF(positions);
+  return result;
+}
+
+// Get a widget's path, e.g. "main/settings/capturetarget"
+static PyObject *widget_get_path(CameraWidget *widget) {
+  CameraWidget *parent = NULL;
+  const char *name = NULL;
+  PyObject *parent_path = NULL;
+  PyObject *result = NULL;
+  int error = gp_widget_get_name(widget, &name);
+  if (error >= GP_OK)
+    error = gp_widget_get_parent(widget, &parent);
+  if (error < GP_OK) {
+    GPHOTO2_ERROR(error)
+    return NULL;
+  }
+  if (!parent)
+    return PyUnicode_FromString(name);
+  parent_path = widget_get_path(parent);
+  if (!parent_path)
+    return NULL;
+  result = PyUnicode_FromFormat("%U/%s", parent_path, name);
+  SWIG_Py_DECREF(parent_path);
+  return result;
+}
+%}
+
+// Make _CameraWidget more like a list, and a dict of widget paths
 %feature("python:slot", "sq_item", functype="ssizeargfunc")
     _CameraWidget::__getitem__;
+%feature("python:slot", "mp_subscript", functype="binaryfunc")
+    _CameraWidget::__getitem__;
+%feature("docstring") _CameraWidget::find "Find a widget by name.
+
+This is similar to get_child_by_name(), but after the first call on the
+root widget of a config tree all the widget names are indexed, so
+further calls to find() or widget[path] on any widget in the tree are
+much quicker. The index is deleted with the root widget.
+
+Parameters
+----------
+* `name` :
+    the name of the widget to find
+
+Returns
+-------
+a gphoto2.CameraWidget.
+
+See also gphoto2.CameraWidget.get_child_by_name"
+%feature("docstring") _CameraWidget::choice_index "Get the position of a value in the widget's choices.
+
+This is quicker than widget.choices.index(value) as it uses a dict of
+choices that is cached with the choices.
+
+Parameters
+----------
+* `value` :
+    one of the widget's choices
+
+Returns
+-------
+an int."
+// Add read only choices and choice_set attributes. These are cached with
+// the tree index, if the tree has one.
+%{
+static PyObject *widget_choice_item(CameraWidget *widget, int item) {
+  PyObject *info = widget_choice_info(widget);
+  PyObject *result = NULL;
+  if (!info)
+    return NULL;
+  result = PyTuple_GET_ITEM(info, item);
+  SWIG_Py_INCREF(result);
+  SWIG_Py_DECREF(info);
+  return result;
+}
+#define _CameraWidget_choices_get(w) widget_choice_item(w, 0)
+#define _CameraWidget_choice_set_get(w) widget_choice_item(w, 1)
+%}
 %extend _CameraWidget {
+    %immutable;
+    PyObject *choices;
+    PyObject *choice_set;
+    %mutable;
+    PyObject *choice_index(PyObject *value) {
+        PyObject *info = widget_choice_info($self);
+        PyObject *result = NULL;
+        if (!info)
+            return NULL;
+        result = PyDict_GetItem(PyTuple_GET_ITEM(info, 2), value);
+        if (result)
+            SWIG_Py_INCREF(result);
+        else if (!PyErr_Occurred())
+            PyErr_SetString(PyExc_ValueError, "value is not a valid choice");
+        SWIG_Py_DECREF(info);
+        return result;
+    }
     void __getitem__(int child_number, CameraWidget **child) {
+        // mp_subscript doesn't adjust negative indexes as sq_item does
+        if (child_number < 0)
+            child_number += gp_widget_count_children($self);
         if ((child_number < 0) ||
             (child_number >= gp_widget_count_children($self))) {
             PyErr_SetNone(PyExc_IndexError);
@@ -320,6 +673,255 @@ DEFAULT_DTOR(_CameraWidget, widget_dtor)
         int result = gp_widget_get_child($self, child_number, child);
         if (result < GP_OK) GPHOTO2_ERROR(result)
     }
+    // The path starts with this widget's name, e.g.
+    // config['main/settings/capturetarget']
+    void __getitem__(const char *path, CameraWidget **child) {
+        PyObject *index = NULL;
+        PyObject *full_path = NULL;
+        PyObject *address = NULL;
+        CameraWidget *parent = NULL;
+        if (widget_get_index($self, &index) < 0)
+            return;
+        if (!index) {
+            if (widget_walk_path($self, path, child) < GP_OK)
+                PyErr_SetString(PyExc_KeyError, path);
+            return;
+        }
+        gp_widget_get_parent($self, &parent);
+        if (parent) {
+            PyObject *parent_path = widget_get_path(parent);
+            if (!parent_path)
+                return;
+            full_path = PyUnicode_FromFormat("%U/%s", parent_path, path);
+            SWIG_Py_DECREF(parent_path);
+        }
+        else
+            full_path = PyUnicode_FromString(path);
+        if (!full_path)
+            return;
+        address = PyDict_GetItem(PyTuple_GET_ITEM(index, 0), full_path);
+        SWIG_Py_DECREF(full_path);
+        if (!address) {
+            PyErr_SetString(PyExc_KeyError, path);
+            return;
+        }
+        *child = PyLong_AsVoidPtr(address);
+    }
+    void find(const char *name, CameraWidget **child) {
+        PyObject *index = NULL;
+        PyObject *name_paths = NULL;
+        PyObject *own_path = NULL;
+        Py_ssize_t own_len;
+        Py_ssize_t n;
+        int error;
+        if (widget_get_index($self, &index) < 0)
+            return;
+        if (!index) {
+            error = gp_widget_get_child_by_name($self, name, child);
+            if (error < GP_OK)
+                GPHOTO2_ERROR(error)
+            return;
+        }
+        name_paths = PyDict_GetItemString(PyTuple_GET_ITEM(index, 1), name);
+        if (!name_paths) {
+            GPHOTO2_ERROR(GP_ERROR_BAD_PARAMETERS)
+            return;
+        }
+        own_path = widget_get_path($self);
+        if (!own_path)
+            return;
+        own_len = PyUnicode_GET_LENGTH(own_path);
+        // use the first match in or below this widget
+        for (n = 0; n < PyList_GET_SIZE(name_paths); n++) {
+            PyObject *path = PyList_GET_ITEM(name_paths, n);
+            Py_ssize_t len = PyUnicode_GET_LENGTH(path);
+            if (PyUnicode_Tailmatch(path, own_path, 0, own_len, -1) == 1 &&
+                (len == own_len ||
+                 PyUnicode_READ_CHAR(path, own_len) == '/')) {
+                PyObject *address = PyDict_GetItem(
+                    PyTuple_GET_ITEM(index, 0), path);
+                *child = PyLong_AsVoidPtr(address);
+                break;
+            }
+        }
+        SWIG_Py_DECREF(own_path);
+        if (!*child)
+            GPHOTO2_ERROR(GP_ERROR_BAD_PARAMETERS)
+    }
+};
+
+// Add to_dict() method that converts a widget tree in one call
+%{
+// Add a new reference to a dict, then release it
+static int widget_dict_set(PyObject *dict, const char *key, PyObject *value) {
+  int result;
+  if (!value)
+    return -1;
+  result = PyDict_SetItemString(dict, key, value);
+  SWIG_Py_DECREF(value);
+  return result;
+}
+
+static PyObject *widget_str(const char *str) {
+  if (str)
+    return PyString_FromString(str);
+  return SWIG_Py_Void();
+}
+
+static PyObject *widget_to_dict(CameraWidget *widget, int recursive,
+                                int include_choices) {
+  const char *name = NULL;
+  const char *label = NULL;
+  const char *info = NULL;
+  int id = 0;
+  int readonly = 0;
+  CameraWidgetType type;
+  PyObject *dict = NULL;
+  int error;
+  int count;
+  int n;
+  error = gp_widget_get_name(widget, &name);
+  if (error >= GP_OK)
+    error = gp_widget_get_label(widget, &label);
+  if (error >= GP_OK)
+    error = gp_widget_get_info(widget, &info);
+  if (error >= GP_OK)
+    error = gp_widget_get_id(widget, &id);
+  if (error >= GP_OK)
+    error = gp_widget_get_type(widget, &type);
+  if (error >= GP_OK)
+    error = gp_widget_get_readonly(widget, &readonly);
+  if (error < GP_OK)
+    goto gp_fail;
+  dict = PyDict_New();
+  if (!dict)
+    return NULL;
+  if (widget_dict_set(dict, "name", widget_str(name)) < 0 ||
+      widget_dict_set(dict, "label", widget_str(label)) < 0 ||
+      widget_dict_set(dict, "info", widget_str(info)) < 0 ||
+      widget_dict_set(dict, "id", PyInt_FromLong(id)) < 0 ||
+      widget_dict_set(dict, "type", PyInt_FromLong(type)) < 0 ||
+      widget_dict_set(dict, "readonly", PyBool_FromLong(readonly)) < 0)
+    goto fail;
+  switch (type) {
+    case GP_WIDGET_RANGE: {
+      float min = 0.0, max = 0.0, increment = 0.0;
+      error = gp_widget_get_range(widget, &min, &max, &increment);
+      if (error < GP_OK)
+        goto gp_fail;
+      if (widget_dict_set(dict, "range", Py_BuildValue(
+              "(ddd)", (double)min, (double)max, (double)increment)) < 0)
+        goto fail;
+      break;
+    }
+    case GP_WIDGET_MENU:
+    case GP_WIDGET_RADIO:
+      if (include_choices) {
+        PyObject *choices = NULL;
+        count = gp_widget_count_choices(widget);
+        if (count < GP_OK) {
+          error = count;
+          goto gp_fail;
+        }
+        choices = PyTuple_New(count);
+        if (!choices)
+          goto fail;
+        for (n = 0; n < count; n++) {
+          const char *choice = NULL;
+          PyObject *py_choice = NULL;
+          error = gp_widget_get_choice(widget, n, &choice);
+          if (error < GP_OK) {
+            SWIG_Py_DECREF(choices);
+            goto gp_fail;
+          }
+          py_choice = widget_str(choice);
+          if (!py_choice) {
+            SWIG_Py_DECREF(choices);
+            goto fail;
+          }
+          PyTuple_SET_ITEM(choices, n, py_choice);
+        }
+        if (widget_dict_set(dict, "choices", choices) < 0)
+          goto fail;
+      }
+      break;
+    default:
+      break;
+  }
+  if (widget_dict_set(dict, "value", widget_get_py_value(widget, type)) < 0)
+    goto fail;
+  if (recursive &&
+      (type == GP_WIDGET_WINDOW || type == GP_WIDGET_SECTION)) {
+    PyObject *children = NULL;
+    count = gp_widget_count_children(widget);
+    if (count < GP_OK) {
+      error = count;
+      goto gp_fail;
+    }
+    children = PyTuple_New(count);
+    if (!children)
+      goto fail;
+    for (n = 0; n < count; n++) {
+      CameraWidget *child = NULL;
+      PyObject *py_child = NULL;
+      error = gp_widget_get_child(widget, n, &child);
+      if (error < GP_OK) {
+        SWIG_Py_DECREF(children);
+        goto gp_fail;
+      }
+      py_child = widget_to_dict(child, recursive, include_choices);
+      if (!py_child) {
+        SWIG_Py_DECREF(children);
+        goto fail;
+      }
+      PyTuple_SET_ITEM(children, n, py_child);
+    }
+    if (widget_dict_set(dict, "children", children) < 0)
+      goto fail;
+  }
+  return dict;
+gp_fail:
+  GPHOTO2_ERROR(error)
+fail:
+  SWIG_Py_XDECREF(dict);
+  return NULL;
+}
+%}
+
+%typemap(default) int recursive %{
+  $1 = 1;
+%}
+%typemap(doc) int recursive "$1_name: bool (default=True)";
+%typemap(default) int include_choices %{
+  $1 = 1;
+%}
+%typemap(doc) int include_choices "$1_name: bool (default=True)";
+%feature("docstring") _CameraWidget::to_dict "Convert the widget, and optionally its children, to a dict.
+
+The whole widget tree is converted in one call, which is much quicker
+than calling get_name(), get_value() etc. for every widget.
+
+The dict has 'name', 'label', 'info', 'id', 'type', 'readonly' and
+'value' keys. Range widgets also have a 'range' (min, max, increment)
+tuple, menu and radio widgets have a 'choices' tuple if include_choices
+is set, and window and section widgets have a 'children' tuple of dicts
+if recursive is set. The value of window, section and button widgets is
+None.
+
+Parameters
+----------
+* `recursive` :
+    include the widget's children (default=True)
+* `include_choices` :
+    include the choices of menu and radio widgets (default=True)
+
+Returns
+-------
+a dict."
+%extend _CameraWidget {
+    PyObject *to_dict(int recursive, int include_choices) {
+        return widget_to_dict($self, recursive, include_choices);
+    }
 };
 
 // Add member methods to _CameraWidget
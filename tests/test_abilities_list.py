@@ -55,6 +55,14 @@ class TestAbilitiesList(unittest.TestCase):
         name, value = camera_list[0]
         self.assertEqual(name, 'Nikon DSC D750')
         self.assertIsInstance(abilities_list.lookup_model(name), int)
+        columns = abilities_list.to_columns()
+        self.assertEqual(len(columns['model']), len(abilities_list))
+        idx = abilities_list.lookup_model(name)
+        self.assertEqual(columns['model'][idx], name)
+        self.assertEqual(columns['usb_vendor'][idx],
+                         abilities_list[idx].usb_vendor)
+        self.assertEqual(columns['operations'][idx],
+                         abilities_list[idx].operations)
         abilities_list.reset()
         self.assertEqual(len(abilities_list), 0)
         abilities_list.load_dir(os.environ['CAMLIBS'])
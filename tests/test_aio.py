@@ -0,0 +1,171 @@
+# python-gphoto2 - Python interface to libgphoto2
+# http://github.com/jim-easterbrook/python-gphoto2
+# Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+#
+# This file is part of python-gphoto2.
+#
+# python-gphoto2 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# python-gphoto2 is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with python-gphoto2.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+
+import gphoto2 as gp
+from gphoto2.aio import AsyncCamera
+
+path = os.path.dirname(os.path.dirname(__file__))
+if path not in sys.path:
+    sys.path.insert(0, path)
+from tests.vcamera import has_vcam, use_vcam
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@unittest.skipUnless(has_vcam, 'no virtual camera')
+class TestAsyncCamera(unittest.TestCase):
+    def setUp(self):
+        use_vcam(True)
+        test_file = os.path.join(
+            os.path.dirname(__file__), 'vcamera', 'copyright-free-image.jpg')
+        with open(test_file, 'rb') as f:
+            self.src_data = f.read()
+
+    def test_camera(self):
+        run(self._test_camera())
+
+    def test_serialised(self):
+        run(self._test_serialised())
+
+    def test_cancel(self):
+        run(self._test_cancel())
+
+    def test_cancel_running(self):
+        run(self._test_cancel_running())
+
+    def test_close(self):
+        run(self._test_close())
+
+    async def _test_camera(self):
+        async with AsyncCamera() as camera:
+            self.assertIsInstance(camera.camera, gp.Camera)
+            self.assertIsInstance(camera.context, gp.Context)
+            widget = await camera.get_config()
+            self.assertIsInstance(widget, gp.CameraWidget)
+            widget = await camera.get_single_config('thumbsize')
+            self.assertIsInstance(widget, gp.CameraWidget)
+            files = await camera.folder_list_files('/store_00010001')
+            self.assertIn('copyright-free-image.jpg', files.keys())
+            camera_file = await camera.file_get(
+                '/store_00010001', 'copyright-free-image.jpg',
+                gp.GP_FILE_TYPE_NORMAL)
+            self.assertIsInstance(camera_file, gp.CameraFile)
+            self.assertEqual(camera_file.get_data_and_size(), self.src_data)
+            path = await camera.capture(gp.GP_CAPTURE_IMAGE)
+            self.assertIsInstance(path, gp.CameraFilePath)
+            info = await camera.file_get_info(path.folder, path.name)
+            self.assertEqual(info.file.size, 7082)
+            event_type, event_data = await camera.wait_for_event(10)
+            self.assertIsInstance(event_type, int)
+            await camera.file_delete(path.folder, path.name)
+            with self.assertRaises(gp.GPhoto2Error) as cm:
+                await camera.capture_preview()
+            self.assertEqual(cm.exception.code, gp.GP_ERROR_NOT_SUPPORTED)
+
+    async def _test_serialised(self):
+        async with AsyncCamera() as camera:
+            results = await asyncio.gather(
+                *[camera.capture(gp.GP_CAPTURE_IMAGE) for n in range(5)])
+            names = [path.name for path in results]
+            self.assertEqual(len(set(names)), 5)
+            for path in results:
+                await camera.file_delete(path.folder, path.name)
+
+    async def _test_cancel(self):
+        async with AsyncCamera() as camera:
+            # queue several calls then cancel the last one
+            tasks = [asyncio.ensure_future(camera.wait_for_event(100))
+                     for n in range(3)]
+            await asyncio.sleep(0)
+            tasks[-1].cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await tasks[-1]
+            for task in tasks[:-1]:
+                event_type, event_data = await task
+                self.assertIsInstance(event_type, int)
+
+    async def _test_cancel_running(self):
+        started = threading.Event()
+        feedback = []
+
+        def slow_operation(context):
+            # poll the context's cancel callback, as a camera driver does
+            # during a long operation
+            started.set()
+            deadline = time.time() + 10
+            while time.time() < deadline:
+                result = camera._cancel_func(context, None)
+                if result == gp.GP_CONTEXT_FEEDBACK_CANCEL:
+                    feedback.append(result)
+                    raise gp.GPhoto2Error(gp.GP_ERROR_CANCEL)
+                time.sleep(0.01)
+            return 'not cancelled'
+
+        async with AsyncCamera() as camera:
+            task = asyncio.ensure_future(camera.run(slow_operation))
+            while not started.is_set():
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            # wait for the worker thread to finish the cancelled call
+            event_type, event_data = await camera.wait_for_event(10)
+            self.assertEqual(feedback, [gp.GP_CONTEXT_FEEDBACK_CANCEL])
+            # later calls are not cancelled
+            self.assertEqual(camera._cancel_func(camera.context, None),
+                             gp.GP_CONTEXT_FEEDBACK_OK)
+
+    async def _test_close(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_operation(context):
+            started.set()
+            release.wait(10)
+            return 'finished'
+
+        camera = AsyncCamera()
+        task = asyncio.ensure_future(camera.run(slow_operation))
+        while not started.is_set():
+            await asyncio.sleep(0.01)
+        closing = asyncio.ensure_future(camera.close())
+        await asyncio.sleep(0.1)
+        # event loop still runs while close waits for the worker thread
+        self.assertFalse(closing.done())
+        release.set()
+        await closing
+        self.assertEqual(await task, 'finished')
+
+
+if __name__ == "__main__":
+    unittest.main()
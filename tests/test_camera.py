@@ -18,9 +18,15 @@
 # License along with python-gphoto2.  If not, see
 # <https://www.gnu.org/licenses/>.
 
+import io
+import json
+import mmap
 import os
 import sys
+import tempfile
+import threading
 import time
+import types
 import unittest
 
 import gphoto2 as gp
@@ -135,12 +141,112 @@ class TestVirtualCamera(unittest.TestCase):
         # get single config
         widget = self.camera.get_single_config('thumbsize')
         self.assertIsInstance(widget, gp.CameraWidget)
+        # set config values
+        choices = list(widget.get_choices())
+        results = self.camera.set_config_values({
+            'thumbsize': choices[1], 'batterylevel': '50%',
+            'capturetarget': 'nowhere', 'bulb': 'on', 'missing': 1})
+        self.assertIsNone(results['thumbsize'])
+        self.assertEqual(
+            self.camera.get_single_config('thumbsize').get_value(),
+            choices[1])
+        self.assertIsInstance(results['batterylevel'], ValueError)
+        self.assertIsInstance(results['capturetarget'], ValueError)
+        self.assertIsInstance(results['bulb'], TypeError)
+        self.assertIsInstance(results['missing'], gp.GPhoto2Error)
+        results = self.camera.set_config_values({'thumbsize': choices[0]})
+        self.assertEqual(results, {'thumbsize': None})
+        # any mapping can be used
+        results = self.camera.set_config_values(
+            types.MappingProxyType({'thumbsize': choices[0]}))
+        self.assertEqual(results, {'thumbsize': None})
+        # config profiles
+        profile = self.camera.export_profile()
+        self.assertEqual(json.loads(json.dumps(profile)), profile)
+        paths = dict((x.split('/')[-1], x) for x in profile)
+        self.assertEqual(profile[paths['thumbsize']], choices[0])
+        self.assertNotIn('batterylevel', paths)
+        # the camera's clock changes, so isn't saved
+        self.assertNotIn('datetime', paths)
+        self.assertEqual(self.camera.apply_profile(profile), {})
+        profile[paths['thumbsize']] = choices[1]
+        profile['main/missing'] = 1
+        results = self.camera.apply_profile(profile)
+        self.assertEqual(set(results), {paths['thumbsize'], 'main/missing'})
+        self.assertIsNone(results[paths['thumbsize']])
+        self.assertIsInstance(results['main/missing'], KeyError)
+        self.assertEqual(
+            self.camera.get_single_config('thumbsize').get_value(),
+            choices[1])
+        del profile['main/missing']
+        results = self.camera.apply_profile(profile, False)
+        self.assertEqual(set(results), set(profile))
+        self.camera.set_config_values({'thumbsize': choices[0]})
         # list config
         config_list = self.camera.list_config()
         self.assertEqual(len(config_list), 68)
         # list_files
         files = list_files()
         self.assertEqual(files[0], '/store_00010001/copyright-free-image.jpg')
+        # walk
+        walk_files = []
+        for folder, subfolders, names in self.camera.walk():
+            self.assertIsInstance(subfolders, list)
+            self.assertIsInstance(names, list)
+            for name in names:
+                walk_files.append(os.path.join(folder, name))
+        self.assertEqual(walk_files, files)
+        walk = list(self.camera.walk('/store_00010001', True))
+        folder, subfolders, names = walk[0]
+        self.assertEqual(folder, '/store_00010001')
+        self.assertIsInstance(names, dict)
+        info = names['copyright-free-image.jpg']
+        self.assertIsInstance(info, gp.CameraFileInfo)
+        self.assertEqual(info.file.size, len(self.src_data))
+        for folder, subfolders, names in self.camera.walk():
+            # don't descend into any folders
+            subfolders.clear()
+        self.assertEqual(folder, '/')
+        walk = self.camera.walk('/store_00010001')
+        self.assertIs(iter(walk), walk)
+        folder, subfolders, names = next(walk)
+        self.assertEqual(folder, '/store_00010001')
+        subfolders.clear()
+        with self.assertRaises(StopIteration):
+            next(walk)
+        with self.assertRaises(gp.GPhoto2Error):
+            list(self.camera.walk('/missing'))
+        # file_get_info_many
+        paths = [os.path.split(x) for x in files]
+        infos = self.camera.file_get_info_many(paths)
+        self.assertEqual(len(infos), len(files))
+        self.assertIsInstance(infos[0], gp.CameraFileInfo)
+        self.assertEqual(infos[0].file.size, len(self.src_data))
+        columns = self.camera.file_get_info_many(paths, True)
+        self.assertEqual(columns['folder'][0], '/store_00010001')
+        self.assertEqual(columns['name'][0], 'copyright-free-image.jpg')
+        self.assertEqual(columns['size'],
+                         [info.file.size for info in infos])
+        self.assertEqual(columns['mtime'],
+                         [info.file.mtime for info in infos])
+        self.assertEqual(columns['type'][0], 'image/jpeg')
+        self.assertEqual(columns['error'], [None] * len(files))
+        self.assertEqual(self.camera.file_get_info_many([]), [])
+        # list pairs are accepted and errors don't stop the batch
+        infos = self.camera.file_get_info_many(
+            [['/store_00010001', 'missing']] + paths)
+        self.assertEqual(len(infos), len(files) + 1)
+        self.assertIsInstance(infos[0], gp.GPhoto2Error)
+        self.assertEqual(infos[0].code, gp.GP_ERROR_FILE_NOT_FOUND)
+        self.assertIsInstance(infos[1], gp.CameraFileInfo)
+        columns = self.camera.file_get_info_many(
+            [('/store_00010001', 'missing')], True)
+        self.assertEqual(columns['size'], [None])
+        self.assertEqual(columns['error'][0].code, gp.GP_ERROR_FILE_NOT_FOUND)
+        with self.assertRaises(TypeError):
+            self.camera.file_get_info_many(['/store_00010001'])
+        with self.assertRaises(TypeError):
+            self.camera.file_get_info_many([('/store_00010001', 1)])
         # file_get
         file = self.camera.file_get(
             '/store_00010001', 'copyright-free-image.jpg',
@@ -153,6 +259,34 @@ class TestVirtualCamera(unittest.TestCase):
                 '/store_00010001', 'copyright-free-image.jpg',
                 gp.GP_FILE_TYPE_NORMAL, file)
         self.assertEqual(file.get_data_and_size(), self.src_data)
+        # download to path
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            dest = os.path.join(tmp_dir, 'image.jpg')
+            size = self.camera.download_to_path(
+                '/store_00010001', 'copyright-free-image.jpg', dest)
+            self.assertEqual(size, len(self.src_data))
+            with open(dest, 'rb') as f:
+                self.assertEqual(f.read(), self.src_data)
+            # file size is known, so data is copied into a memory map in
+            # 1000 byte chunks
+            size = self.camera.download_to_path(
+                '/store_00010001', 'copyright-free-image.jpg', dest,
+                gp.GP_FILE_TYPE_NORMAL, True, 1000)
+            self.assertEqual(size, len(self.src_data))
+            self.assertEqual(os.listdir(tmp_dir), ['image.jpg'])
+            with open(dest, 'rb') as f:
+                self.assertEqual(f.read(), self.src_data)
+            umask = os.umask(0)
+            os.umask(umask)
+            self.assertEqual(os.stat(dest).st_mode & 0o777, 0o666 & ~umask)
+            with self.assertRaises(gp.GPhoto2Error):
+                self.camera.download_to_path(
+                    '/store_00010001', 'missing.jpg', dest + '2')
+            self.assertEqual(os.listdir(tmp_dir), ['image.jpg'])
+            with self.assertRaises(OSError):
+                self.camera.download_to_path(
+                    '/store_00010001', 'copyright-free-image.jpg',
+                    os.path.join(tmp_dir, 'missing', 'image.jpg'))
         # file put
         with self.assertRaises(gp.GPhoto2Error) as cm:
             self.camera.folder_put_file('/store_00010001', 'uploaded.jpg',
@@ -167,6 +301,57 @@ class TestVirtualCamera(unittest.TestCase):
                 gp.GP_FILE_TYPE_NORMAL, 0, buffer)
         ex = cm.exception
         self.assertEqual(ex.code, gp.GP_ERROR_NOT_SUPPORTED)
+        # file_stream
+        stream = self.camera.file_stream(
+            '/store_00010001', 'copyright-free-image.jpg',
+            gp.GP_FILE_TYPE_NORMAL, 1024)
+        self.assertIsInstance(stream, gp.CameraFileStream)
+        with self.assertRaises(gp.GPhoto2Error) as cm:
+            chunk = stream[0]
+        ex = cm.exception
+        self.assertEqual(ex.code, gp.GP_ERROR_NOT_SUPPORTED)
+        with self.assertRaises(IndexError):
+            chunk = stream[-1]
+        with self.assertRaises(ValueError):
+            self.camera.file_stream(
+                '/store_00010001', 'copyright-free-image.jpg',
+                gp.GP_FILE_TYPE_NORMAL, 0)
+        # file_get_into
+        chunks = []
+        class Dest(object):
+            def write(self, data):
+                chunks.append(bytes(data))
+        size = self.camera.file_get_into(
+            '/store_00010001', 'copyright-free-image.jpg',
+            gp.GP_FILE_TYPE_NORMAL, Dest(), 1000)
+        self.assertEqual(size, len(self.src_data))
+        self.assertEqual(len(chunks), (len(self.src_data) + 999) // 1000)
+        for chunk in chunks[:-1]:
+            self.assertEqual(len(chunk), 1000)
+        self.assertEqual(b''.join(chunks), self.src_data)
+        with tempfile.TemporaryFile() as f:
+            size = self.camera.file_get_into(
+                '/store_00010001', 'copyright-free-image.jpg',
+                gp.GP_FILE_TYPE_NORMAL, f.fileno(), 1000)
+            self.assertEqual(size, len(self.src_data))
+            f.seek(0)
+            self.assertEqual(f.read(), self.src_data)
+        with self.assertRaises(TypeError):
+            self.camera.file_get_into(
+                '/store_00010001', 'copyright-free-image.jpg',
+                gp.GP_FILE_TYPE_NORMAL, True)
+        with self.assertRaises(OverflowError):
+            self.camera.file_get_into(
+                '/store_00010001', 'copyright-free-image.jpg',
+                gp.GP_FILE_TYPE_NORMAL, 2 ** 70)
+        with self.assertRaises(ValueError):
+            self.camera.file_get_into(
+                '/store_00010001', 'copyright-free-image.jpg',
+                gp.GP_FILE_TYPE_NORMAL, -1)
+        with self.assertRaises(gp.GPhoto2Error):
+            self.camera.file_get_into(
+                '/store_00010001', 'missing.jpg',
+                gp.GP_FILE_TYPE_NORMAL, io.BytesIO())
         # capture
         path = self.camera.capture(gp.GP_CAPTURE_IMAGE)
         self.assertRegex(path.name, 'GPH_\d{4}.JPG')
@@ -195,6 +380,21 @@ class TestVirtualCamera(unittest.TestCase):
                 self.camera.capture_preview(preview_file)
         ex = cm.exception
         self.assertEqual(ex.code, gp.GP_ERROR_NOT_SUPPORTED)
+        # preview stream
+        stream = self.camera.preview_stream()
+        with self.assertRaises(gp.GPhoto2Error) as cm:
+            next(iter(stream))
+        ex = cm.exception
+        self.assertEqual(ex.code, gp.GP_ERROR_NOT_SUPPORTED)
+        stream = self.camera.preview_stream(10.0, 2)
+        with self.assertRaises(gp.GPhoto2Error):
+            for sequence, timestamp, data in stream:
+                break
+        del stream
+        with self.assertRaises(ValueError):
+            self.camera.preview_stream(-1.0)
+        with self.assertRaises(ValueError):
+            self.camera.preview_stream(None, 0)
         # trigger capture
         self.camera.trigger_capture()
         # wait for event
@@ -206,6 +406,22 @@ class TestVirtualCamera(unittest.TestCase):
             if event_type in (gp.GP_EVENT_FILE_ADDED,
                               gp.GP_EVENT_FOLDER_ADDED):
                 self.assertIsInstance(event_data, gp.CameraFilePath)
+        # drain events
+        self.camera.trigger_capture()
+        events = self.camera.drain_events(100, 100)
+        self.assertIsInstance(events, list)
+        self.assertGreater(len(events), 0)
+        for event_type, event_data in events:
+            self.assertNotEqual(event_type, gp.GP_EVENT_TIMEOUT)
+            if event_type in (gp.GP_EVENT_FILE_ADDED,
+                              gp.GP_EVENT_FOLDER_ADDED):
+                self.assertIsInstance(event_data, gp.CameraFilePath)
+        self.assertEqual(self.camera.drain_events(100, 10), [])
+        self.camera.trigger_capture()
+        self.assertEqual(len(self.camera.drain_events(1, 100)), 1)
+        self.camera.drain_events(100, 10)
+        with self.assertRaises(ValueError):
+            self.camera.drain_events(0, 10)
         # delete file(s)
         self.camera.file_delete(path.folder, path.name)
         self.camera.folder_delete_all(path.folder)
@@ -395,5 +611,182 @@ class TestVirtualCamera(unittest.TestCase):
             gp.gp_camera_set_abilities(self.camera, abilities), gp.GP_OK)
 
 
+@unittest.skipUnless(has_vcam, 'no virtual camera')
+class TestThreading(unittest.TestCase):
+    # Check that other Python threads can run while a blocking function is
+    # being called. The thread switch interval is set very long so the
+    # background thread can only run when the main thread releases the GIL.
+    def setUp(self):
+        use_vcam(True)
+        self.camera = gp.Camera()
+        self.camera.init()
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1000.0)
+        self.count = 0
+        self.running = True
+        self.thread = threading.Thread(target=self.background)
+        self.thread.start()
+
+    def tearDown(self):
+        self.running = False
+        self.thread.join()
+        sys.setswitchinterval(self.switch_interval)
+        self.camera.exit()
+
+    def background(self):
+        while self.running:
+            self.count += 1
+            # release the GIL so the main thread can continue
+            time.sleep(0)
+
+    def assertReleasesGIL(self, func, *args, repeat=20):
+        progress = 0
+        for n in range(repeat):
+            count = self.count
+            func(*args)
+            progress += self.count - count
+        self.assertGreater(progress, 0,
+                           '{} did not release the GIL'.format(func.__name__))
+
+    def capture_files(self, count):
+        paths = []
+        for n in range(count):
+            path = self.camera.capture(gp.GP_CAPTURE_IMAGE)
+            paths.append((path.folder, path.name))
+        return paths
+
+    def test_camera(self):
+        folder, name = '/store_00010001', 'copyright-free-image.jpg'
+        self.assertReleasesGIL(gp.Camera.autodetect)
+        self.assertReleasesGIL(self.camera.get_summary)
+        self.assertReleasesGIL(self.camera.get_about)
+        self.assertReleasesGIL(self.camera.get_storageinfo)
+        self.assertReleasesGIL(self.camera.get_config)
+        self.assertReleasesGIL(self.camera.list_config)
+        self.assertReleasesGIL(self.camera.get_single_config, 'thumbsize')
+        self.assertReleasesGIL(self.camera.folder_list_files, folder)
+        self.assertReleasesGIL(self.camera.folder_list_folders, folder)
+        self.assertReleasesGIL(self.camera.file_get_info, folder, name)
+        self.assertReleasesGIL(
+            self.camera.file_get, folder, name, gp.GP_FILE_TYPE_NORMAL)
+        self.assertReleasesGIL(self.camera.capture, gp.GP_CAPTURE_IMAGE)
+        self.assertReleasesGIL(self.camera.trigger_capture)
+        self.assertReleasesGIL(self.camera.wait_for_event, 10)
+        self.assertReleasesGIL(self.camera.drain_events, 10, 10)
+        info = gp.CameraFileInfo()
+        info.preview.fields = gp.GP_FILE_INFO_NONE
+        info.audio.fields = gp.GP_FILE_INFO_NONE
+        info.file.fields = gp.GP_FILE_INFO_MTIME
+        info.file.mtime = int(time.time())
+        self.assertReleasesGIL(self.camera.file_set_info, folder, name, info)
+
+    def test_delete(self):
+        paths = self.capture_files(20)
+        progress = 0
+        for folder, name in paths:
+            count = self.count
+            self.camera.file_delete(folder, name)
+            progress += self.count - count
+        self.assertGreater(progress, 0, 'file_delete did not release the GIL')
+
+    def test_init_exit(self):
+        progress = 0
+        for n in range(10):
+            count = self.count
+            self.camera.exit()
+            self.camera.init()
+            progress += self.count - count
+        self.assertGreater(progress, 0, 'init/exit did not release the GIL')
+
+    def test_lists(self):
+        abilities_list = gp.CameraAbilitiesList()
+        self.assertReleasesGIL(abilities_list.load, repeat=2)
+        port_info_list = gp.PortInfoList()
+        self.assertReleasesGIL(port_info_list.load, repeat=2)
+        self.assertReleasesGIL(abilities_list.detect, port_info_list)
+
+
+@unittest.skipUnless(has_vcam, 'no virtual camera')
+class TestFileRead(unittest.TestCase):
+    # The virtual camera doesn't support gp_camera_file_read, but buffer
+    # handling can still be tested.
+    folder, name = '/store_00010001', 'copyright-free-image.jpg'
+
+    def setUp(self):
+        use_vcam(True)
+        self.camera = gp.Camera()
+        self.camera.init()
+
+    def tearDown(self):
+        self.camera.exit()
+
+    def file_read(self, buffer):
+        with self.assertRaises(gp.GPhoto2Error) as cm:
+            self.camera.file_read(self.folder, self.name,
+                                  gp.GP_FILE_TYPE_NORMAL, 0, buffer)
+        self.assertEqual(cm.exception.code, gp.GP_ERROR_NOT_SUPPORTED)
+
+    def test_buffer_types(self):
+        buffer = bytearray(100)
+        self.file_read(buffer)
+        self.file_read(memoryview(buffer)[10:20])
+        with mmap.mmap(-1, 100) as buffer:
+            self.file_read(buffer)
+            self.file_read(memoryview(buffer)[50:])
+        with self.assertRaises(TypeError):
+            self.file_read(bytes(100))
+        with self.assertRaises(TypeError):
+            self.file_read(memoryview(bytearray(100))[::2])
+        try:
+            import numpy
+        except ImportError:
+            return
+        self.file_read(numpy.zeros((10, 10), dtype=numpy.uint8))
+        self.file_read(numpy.zeros(100, dtype=numpy.int16)[20:30])
+
+    def test_buffer_held(self):
+        # try to resize buffer from a log callback during the function call
+        buffer = bytearray(100)
+        results = []
+
+        def log_func(level, domain, msg, data):
+            try:
+                buffer.extend(b'x')
+                results.append(True)
+            except BufferError:
+                results.append(False)
+
+        callback_obj = gp.check_result(
+            gp.gp_log_add_func(gp.GP_LOG_DEBUG, log_func))
+        try:
+            self.file_read(buffer)
+        finally:
+            del callback_obj
+        if not results:
+            self.skipTest('no log messages during file_read')
+        self.assertNotIn(True, results)
+        self.assertEqual(len(buffer), 100)
+        # buffer is released after the call
+        buffer.extend(b'x')
+        self.assertEqual(len(buffer), 101)
+
+    def test_buffer_release(self):
+        # the buffer can be resized or closed as soon as file_read raises
+        shared = bytearray(4096)
+        self.file_read(shared)
+        shared.extend(bytes(16))
+        del shared[4096:]
+        view = memoryview(shared)[256:512]
+        self.file_read(view)
+        view.release()
+        shared.extend(bytes(16))
+        del shared[4096:]
+        self.assertEqual(len(shared), 4096)
+        slab = mmap.mmap(-1, 4096)
+        self.file_read(memoryview(slab)[256:512])
+        slab.close()
+        self.assertTrue(slab.closed)
+
+
 if __name__ == "__main__":
     unittest.main()
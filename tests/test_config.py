@@ -0,0 +1,120 @@
+# python-gphoto2 - Python interface to libgphoto2
+# http://github.com/jim-easterbrook/python-gphoto2
+# Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+#
+# This file is part of python-gphoto2.
+#
+# python-gphoto2 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# python-gphoto2 is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with python-gphoto2.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import os
+import sys
+import unittest
+
+import gphoto2 as gp
+from gphoto2.config import ConfigCache, diff, fingerprint, flatten
+
+path = os.path.dirname(os.path.dirname(__file__))
+if path not in sys.path:
+    sys.path.insert(0, path)
+from tests.vcamera import has_vcam, use_vcam
+
+
+class TestDiff(unittest.TestCase):
+    def test_dicts(self):
+        config_a = {'main/settings/iso': '100', 'main/status/battery': '50%',
+                    'main/settings/artist': None}
+        config_b = {'main/settings/iso': '200', 'main/status/battery': '50%'}
+        self.assertEqual(diff(config_a, config_b), {
+            'main/settings/iso': ('100', '200'),
+            'main/settings/artist': (None, None)})
+        self.assertEqual(diff(config_a, dict(config_a)), {})
+        self.assertEqual(fingerprint(config_a), fingerprint(dict(config_a)))
+        self.assertNotEqual(fingerprint(config_a), fingerprint(config_b))
+        self.assertEqual(
+            fingerprint(config_b, ignore=['main/settings/iso']),
+            fingerprint({'main/status/battery': '50%'}))
+
+
+@unittest.skipUnless(has_vcam, 'no virtual camera')
+class TestConfigCache(unittest.TestCase):
+    def setUp(self):
+        use_vcam(True)
+        self.camera = gp.Camera()
+        self.camera.init()
+
+    def tearDown(self):
+        self.camera.exit()
+
+    def test_flatten(self):
+        config = self.camera.get_config()
+        values = flatten(config.to_dict())
+        self.assertEqual(values['capturetarget'],
+                         config.find('capturetarget').get_value())
+        self.assertNotIn('main', values)
+        self.assertNotIn('settings', values)
+
+    def test_diff(self):
+        config_a = self.camera.get_config()
+        config_b = self.camera.get_config()
+        ignore = ['main/settings/datetime']
+        self.assertEqual(fingerprint(config_a, ignore),
+                         fingerprint(config_b.to_dict(), ignore))
+        widget = config_b.find('capturetarget')
+        old_value = widget.get_value()
+        new_value = [x for x in widget.choices if x != old_value][0]
+        widget.set_value(new_value)
+        changes = diff(config_a, config_b)
+        self.assertEqual(changes['main/settings/capturetarget'],
+                         (old_value, new_value))
+        self.assertNotEqual(fingerprint(config_a, ignore),
+                            fingerprint(config_b, ignore))
+        values = flatten(config_a.to_dict(), paths=True)
+        self.assertEqual(diff(values, config_a), {})
+
+    def test_cache(self):
+        changes = []
+        cache = ConfigCache(self.camera, ttl=None)
+        cache.subscribe(changes.append)
+        choices = list(
+            self.camera.get_single_config('thumbsize').get_choices())
+        self.assertIn(cache['thumbsize'], choices)
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0]['thumbsize'], (None, cache['thumbsize']))
+        # refresh with no changes
+        self.assertEqual(cache.refresh(), {})
+        self.assertEqual(len(changes), 1)
+        # change a value and send an event
+        old_value = cache['thumbsize']
+        new_value = [x for x in choices if x != old_value][0]
+        self.camera.set_config_values({'thumbsize': new_value})
+        self.assertTrue(cache.handle_event(
+            gp.GP_EVENT_UNKNOWN,
+            'PTP Property d10d changed, "thumbsize" to "{}"'.format(
+                new_value)))
+        self.assertEqual(changes[-1], {'thumbsize': (old_value, new_value)})
+        self.assertEqual(cache['thumbsize'], new_value)
+        self.assertEqual(cache.property_names[0xd10d], 'thumbsize')
+        # event without a config name
+        self.camera.set_config_values({'thumbsize': old_value})
+        self.assertTrue(cache.handle_event(
+            gp.GP_EVENT_UNKNOWN, 'PTP Property d10d changed'))
+        self.assertEqual(changes[-1], {'thumbsize': (new_value, old_value)})
+        self.assertFalse(cache.handle_event(gp.GP_EVENT_UNKNOWN, 'hello'))
+        self.assertFalse(cache.handle_event(gp.GP_EVENT_TIMEOUT, None))
+        self.assertIsInstance(cache.values(), dict)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+# python-gphoto2 - Python interface to libgphoto2
+# http://github.com/jim-easterbrook/python-gphoto2
+# Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+#
+# This file is part of python-gphoto2.
+#
+# python-gphoto2 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# python-gphoto2 is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with python-gphoto2.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+import gphoto2 as gp
+from gphoto2 import drivers
+
+path = os.path.dirname(os.path.dirname(__file__))
+if path not in sys.path:
+    sys.path.insert(0, path)
+from tests.vcamera import has_vcam, use_vcam
+
+
+@unittest.skipUnless(has_vcam, 'no virtual camera')
+class TestDrivers(unittest.TestCase):
+    def setUp(self):
+        use_vcam(True)
+
+    def tearDown(self):
+        drivers.invalidate()
+
+    def test_cache(self):
+        abilities = drivers.abilities_list()
+        self.assertIsInstance(abilities, gp.CameraAbilitiesList)
+        self.assertGreater(len(abilities), 0)
+        self.assertIs(drivers.abilities_list(), abilities)
+        ports = drivers.port_info_list()
+        self.assertIsInstance(ports, gp.PortInfoList)
+        self.assertIs(drivers.port_info_list(), ports)
+        self.assertIsNot(drivers.port_info_list(reload=True), ports)
+        drivers.invalidate(ports=False)
+        self.assertIsNot(drivers.abilities_list(), abilities)
+
+    def test_index(self):
+        index = drivers.abilities_index()
+        self.assertIs(drivers.abilities_index(), index)
+        abilities = drivers.abilities_list()
+        self.assertEqual(len(index), len(abilities))
+        model = 'Nikon DSC D750'
+        self.assertEqual(index.index(model), abilities.lookup_model(model))
+        info = index.abilities(model)
+        self.assertIsInstance(info, gp.CameraAbilities)
+        self.assertEqual(info.model, model)
+        self.assertIn(model,
+                      index.lookup_usb(info.usb_vendor, info.usb_product))
+        self.assertEqual(index.lookup_usb(0xffff, 0xffff), [])
+        with self.assertRaises(KeyError):
+            index.index('Nonexistent camera')
+        capture = index.select(operations=gp.GP_OPERATION_TRIGGER_CAPTURE)
+        self.assertLess(len(capture), len(index))
+        for name in capture[:10]:
+            self.assertTrue(index.abilities(name).operations
+                            & gp.GP_OPERATION_TRIGGER_CAPTURE)
+        self.assertEqual(len(index.select()), len(index))
+        drivers.invalidate()
+        self.assertIsNot(drivers.abilities_index(), index)
+        try:
+            import numpy
+        except ImportError:
+            return
+        from gphoto2.columnar import abilities_array
+        array = abilities_array(index.columns)
+        self.assertEqual(len(array), len(index))
+        self.assertEqual(array['model'][index.index(model)], model)
+
+    def test_autodetect(self):
+        cameras = drivers.autodetect()
+        self.assertIsInstance(cameras, gp.CameraList)
+        self.assertEqual(cameras.to_tuple(),
+                         gp.Camera.autodetect().to_tuple())
+        self.assertEqual(drivers.autodetect(reload_ports=False).to_tuple(),
+                         cameras.to_tuple())
+
+    def test_init(self):
+        camera = gp.Camera()
+        drivers.init(camera)
+        self.assertEqual(camera.get_abilities().model, 'Nikon DSC D750')
+        self.assertIsInstance(camera.get_config(), gp.CameraWidget)
+        camera.exit()
+
+    def test_open_camera(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, 'cameras.json')
+            camera = drivers.open_camera(cache_path=cache_path)
+            model = camera.get_abilities().model
+            self.assertEqual(model, 'Nikon DSC D750')
+            port = camera.get_port_info().get_path()
+            camera.exit()
+            camera = drivers.open_camera(model, port, cache_path=cache_path)
+            self.assertEqual(camera.get_abilities().model, model)
+            self.assertEqual(camera.get_port_info().get_path(), port)
+            camera.exit()
+            with self.assertRaises(gp.GPhoto2Error):
+                drivers.open_camera(model='Nonexistent camera',
+                                    cache_path=cache_path)
+            with self.assertRaises(gp.GPhoto2Error):
+                drivers.open_camera(model, 'nonexistent:1',
+                                    cache_path=cache_path)
+
+    def test_open_camera_serial(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = os.path.join(tmp_dir, 'cameras.json')
+            camera = drivers.open_camera(cache_path=cache_path)
+            model = camera.get_abilities().model
+            port = camera.get_port_info().get_path()
+            serial = drivers._camera_serial(camera, None)
+            camera.exit()
+            if not serial:
+                self.skipTest('camera has no serial number')
+            with open(cache_path) as f:
+                self.assertEqual(json.load(f), {serial: [model, port]})
+            camera = drivers.open_camera(serial=serial, cache_path=cache_path)
+            self.assertEqual(camera.get_abilities().model, model)
+            camera.exit()
+            # stale cached port is replaced
+            with open(cache_path, 'w') as f:
+                json.dump({serial: [model, 'nonexistent:1']}, f)
+            camera = drivers.open_camera(serial=serial, cache_path=cache_path)
+            camera.exit()
+            with open(cache_path) as f:
+                self.assertEqual(json.load(f), {serial: [model, port]})
+            with self.assertRaises(gp.GPhoto2Error):
+                drivers.open_camera(serial=serial + 'x',
+                                    cache_path=cache_path)
+
+    def test_write_cache_failure(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # os.replace fails if the cache path is a directory
+            cache_path = os.path.join(tmp_dir, 'cameras.json')
+            os.mkdir(cache_path)
+            drivers._write_cache(cache_path, '1234', 'model', 'usb:001,002')
+            self.assertEqual(os.listdir(tmp_dir), ['cameras.json'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# python-gphoto2 - Python interface to libgphoto2
+# http://github.com/jim-easterbrook/python-gphoto2
+# Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+#
+# This file is part of python-gphoto2.
+#
+# python-gphoto2 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# python-gphoto2 is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with python-gphoto2.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import asyncio
+import os
+import sys
+import unittest
+
+import gphoto2 as gp
+from gphoto2.events import EventPump
+
+path = os.path.dirname(os.path.dirname(__file__))
+if path not in sys.path:
+    sys.path.insert(0, path)
+from tests.vcamera import has_vcam, use_vcam
+
+
+@unittest.skipUnless(has_vcam, 'no virtual camera')
+class TestEventPump(unittest.TestCase):
+    def setUp(self):
+        use_vcam(True)
+        self.camera = gp.Camera()
+        self.camera.init()
+
+    def tearDown(self):
+        self.camera.exit()
+
+    def test_queue(self):
+        pump = EventPump(self.camera, timeout=10)
+        pump.start()
+        with pump.lock:
+            self.camera.trigger_capture()
+        while True:
+            event_type, event_data = pump.queue.get(timeout=5)
+            self.assertNotEqual(event_type, gp.GP_EVENT_TIMEOUT)
+            if event_type == gp.GP_EVENT_FILE_ADDED:
+                self.assertIsInstance(event_data, gp.CameraFilePath)
+                break
+        pump.stop()
+        self.assertFalse(pump.is_alive())
+        self.assertIsNone(pump.error)
+
+    def test_lock(self):
+        pump = EventPump(self.camera, timeout=10)
+        pump.start()
+        # other threads must not be starved of the lock
+        for n in range(20):
+            self.assertTrue(pump.lock.acquire(timeout=2))
+            pump.lock.release()
+        pump.stop()
+        self.assertIsNone(pump.error)
+
+    def test_asyncio(self):
+        async def run():
+            pump = EventPump(self.camera, queue=asyncio.Queue(), timeout=10)
+            pump.start()
+            with pump.lock:
+                self.camera.trigger_capture()
+            while True:
+                event_type, event_data = await asyncio.wait_for(
+                    pump.queue.get(), 5)
+                if event_type == gp.GP_EVENT_FILE_ADDED:
+                    break
+            pump.stop()
+            return event_data
+
+        loop = asyncio.new_event_loop()
+        try:
+            event_data = loop.run_until_complete(run())
+        finally:
+            loop.close()
+        self.assertIsInstance(event_data, gp.CameraFilePath)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+# python-gphoto2 - Python interface to libgphoto2
+# http://github.com/jim-easterbrook/python-gphoto2
+# Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+#
+# This file is part of python-gphoto2.
+#
+# python-gphoto2 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# python-gphoto2 is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with python-gphoto2.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import subprocess
+import sys
+import unittest
+
+import gphoto2 as gp
+
+# count extension modules loaded by 'import gphoto2' in a new process
+_script = '''
+import sys
+import gphoto2
+{}
+print(len([x for x in gphoto2._module_names
+           if 'gphoto2.' + x in sys.modules]))
+'''
+
+
+def _modules_loaded(extra=''):
+    output = subprocess.check_output(
+        [sys.executable, '-c', _script.format(extra)],
+        universal_newlines=True).split()
+    return int(output[-1])
+
+
+# time 'import gphoto2' in a new process
+_timer = '''
+import time
+start = time.perf_counter()
+import gphoto2
+{}
+print(time.perf_counter() - start)
+'''
+
+
+def _import_time(extra='', repeat=5):
+    # best of several runs, to reduce the effect of other processes
+    result = []
+    for n in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, '-c', _timer.format(extra)],
+            universal_newlines=True).split()
+        result.append(float(output[-1]))
+    return min(result)
+
+
+class TestImport(unittest.TestCase):
+    def test_api(self):
+        self.assertIn('Camera', dir(gp))
+        self.assertIn('GP_OK', gp.__all__)
+        self.assertIs(gp.Camera, gp.camera.Camera)
+        self.assertIs(gp.PortInfoList, gp.GPPortInfoList)
+        with self.assertRaises(AttributeError):
+            gp.no_such_name
+        namespace = {}
+        exec('from gphoto2 import *', namespace)
+        self.assertIs(namespace['CameraWidget'], gp.CameraWidget)
+        ex = gp.GPhoto2Error(gp.GP_ERROR_NOT_SUPPORTED)
+        self.assertEqual(ex.code, gp.GP_ERROR_NOT_SUPPORTED)
+        self.assertNotIn('__getattr__', gp.__all__)
+        self.assertNotIn('_name_map', gp.__all__)
+        self.assertNotIn('os', gp.__all__)
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'no module __getattr__')
+    def test_lazy_import(self):
+        lazy_modules = _modules_loaded()
+        full_modules = _modules_loaded('from gphoto2 import *')
+        used_modules = _modules_loaded('gphoto2.gp_library_version')
+        self.assertEqual(lazy_modules, 0)
+        self.assertEqual(full_modules, len(gp._module_names))
+        self.assertLess(used_modules, full_modules)
+
+    @unittest.skipIf(sys.version_info < (3, 7), 'no module __getattr__')
+    def test_import_time(self):
+        # compare with importing everything, as absolute times depend on
+        # the machine
+        lazy_time = _import_time()
+        full_time = _import_time('from gphoto2 import *')
+        self.assertLess(lazy_time, full_time * 0.75,
+                        'import gphoto2 took {:.1f} ms, importing everything'
+                        ' took {:.1f} ms'.format(
+                            lazy_time * 1000.0, full_time * 1000.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+# python-gphoto2 - Python interface to libgphoto2
+# http://github.com/jim-easterbrook/python-gphoto2
+# Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+#
+# This file is part of python-gphoto2.
+#
+# python-gphoto2 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# python-gphoto2 is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with python-gphoto2.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import os
+import sys
+import tempfile
+import types
+import unittest
+
+import gphoto2 as gp
+from gphoto2.index import CameraIndex
+
+path = os.path.dirname(os.path.dirname(__file__))
+if path not in sys.path:
+    sys.path.insert(0, path)
+from tests.vcamera import has_vcam, use_vcam
+
+
+@unittest.skipUnless(has_vcam, 'no virtual camera')
+class TestCameraIndex(unittest.TestCase):
+    def setUp(self):
+        use_vcam(True)
+        self.camera = gp.Camera()
+        self.camera.init()
+
+    def tearDown(self):
+        self.camera.exit()
+
+    def test_refresh(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = os.path.join(tmp_dir, 'index.sqlite')
+            index = CameraIndex(self.camera, db_path)
+            self.assertIsInstance(index.serial, str)
+            count = index.refresh()
+            self.assertGreater(count, 0)
+            files = index.files()
+            self.assertEqual(len(files), count)
+            folder, name, size, mtime, mime_type = files[0]
+            info = self.camera.file_get_info(folder, name)
+            self.assertEqual(size, info.file.size)
+            self.assertEqual(mime_type, info.file.type)
+            self.assertEqual(index.new_files(), files)
+            index.mark_synced()
+            self.assertEqual(index.new_files(), [])
+            # nothing has changed on the camera
+            self.assertEqual(index.refresh(), 0)
+            self.assertEqual(index.refresh(full=True), 0)
+            index.close()
+            # reopen the saved index
+            index = CameraIndex(self.camera, db_path, serial=index.serial)
+            self.assertEqual(index.files(), files)
+            self.assertEqual(index.refresh(), 0)
+            self.assertEqual(index.new_files(), [])
+            index.close()
+
+    def test_changed_names(self):
+        index = CameraIndex(self.camera, ':memory:', serial='vcam')
+        count = index.refresh()
+        folder, name = index.files()[0][:2]
+        # same number of files, but one added and one deleted
+        with index._db:
+            index._db.execute(
+                'UPDATE files SET name = ? WHERE folder = ? AND name = ?',
+                ('deleted.jpg', folder, name))
+        self.assertEqual(index.refresh(), 1)
+        self.assertEqual(len(index.files()), count)
+        self.assertEqual(index.files(folder)[0][1], name)
+        # LIKE wildcards and case in folder names don't match other folders
+        other = folder.replace('_', 'X', 1) + '/other'
+        with index._db:
+            index._db.execute(
+                'INSERT INTO folders VALUES (?, ?)', ('vcam', other))
+            index._db.execute(
+                'INSERT INTO files VALUES (?, ?, ?, ?, 0, 0, ?, 0)',
+                ('vcam', other.split('/other')[0], other, 'a.jpg', 'x'))
+            index._db.execute(
+                'INSERT INTO folders VALUES (?, ?)',
+                ('vcam', folder.upper() + '/other'))
+        index.refresh()
+        self.assertEqual(len(index.files(other)), 1)
+        self.assertEqual(index._db.execute(
+            'SELECT COUNT(*) FROM folders WHERE folder IN (?, ?)',
+            (other, folder.upper() + '/other')).fetchone()[0], 2)
+        index.close()
+
+    def test_events(self):
+        index = CameraIndex(self.camera, ':memory:', serial='vcam')
+        count = index.refresh()
+        index.mark_synced()
+        self.camera.trigger_capture()
+        added = []
+        while True:
+            event_type, event_data = self.camera.wait_for_event(1000)
+            if event_type == gp.GP_EVENT_TIMEOUT:
+                break
+            if (index.handle_event(event_type, event_data)
+                    and event_type == gp.GP_EVENT_FILE_ADDED):
+                added.append((event_data.folder, event_data.name))
+        self.assertEqual(len(added), 1)
+        self.assertEqual(len(index.files()), count + 1)
+        self.assertEqual([x[:2] for x in index.new_files()], added)
+        self.assertFalse(index.handle_event(gp.GP_EVENT_UNKNOWN, 'x'))
+        # a changed file that has been synced isn't new
+        index.mark_synced()
+        folder, name = added[0]
+        with index._db:
+            index._db.execute(
+                'UPDATE files SET size = 0 WHERE folder = ? AND name = ?',
+                (folder, name))
+        self.assertTrue(index.handle_event(
+            gp.GP_EVENT_FILE_CHANGED,
+            types.SimpleNamespace(folder=folder, name=name)))
+        self.assertEqual(index.new_files(), [])
+        self.assertEqual(
+            [x[2] for x in index.files(folder) if x[1] == name], [7082])
+        index.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,6 +22,12 @@ import os
 import unittest
 
 import gphoto2 as gp
+from gphoto2.columnar import camera_list_array, file_info_array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class TestList(unittest.TestCase):
@@ -82,6 +88,8 @@ class TestList(unittest.TestCase):
         self.assertEqual(next(it), test_list[2])
         with self.assertRaises(StopIteration):
             next(it)
+        self.assertEqual(test_list.to_tuple(), tuple(test_list.items()))
+        self.assertEqual(test_list.to_dict(), {'B': '2', 'A': '1', 'D': None})
         test_list.sort()
         self.assertEqual(test_list.get_name(0), 'A')
         self.assertEqual(test_list.get_value(0), '1')
@@ -123,5 +131,37 @@ class TestList(unittest.TestCase):
         self.assertEqual(gp.gp_list_count(test_list), 0)
 
 
+@unittest.skipUnless(np, 'numpy not installed')
+class TestColumnar(unittest.TestCase):
+    def test_camera_list(self):
+        test_list = gp.CameraList()
+        test_list.append('B', '2')
+        test_list.append('Apple', None)
+        array = camera_list_array(test_list)
+        self.assertEqual(len(array), 2)
+        self.assertEqual(list(array['name']), ['B', 'Apple'])
+        self.assertEqual(list(array['value']), ['2', ''])
+        self.assertEqual(len(camera_list_array(gp.CameraList())), 0)
+
+    def test_file_info(self):
+        columns = {
+            'folder': ['/store_00010001', '/store_00010001/DCIM'],
+            'name': ['a.jpg', 'b.raw'],
+            'size': [1000, None],
+            'mtime': [1700000000, 1700000100],
+            'type': ['image/jpeg', None],
+            'permissions': [gp.GP_FILE_PERM_ALL, None],
+            'error': [None, gp.GPhoto2Error(gp.GP_ERROR_FILE_NOT_FOUND)],
+            }
+        array = file_info_array(columns)
+        self.assertEqual(list(array['name']), columns['name'])
+        self.assertEqual(list(array['size']), [1000, -1])
+        self.assertEqual(list(array['type']), ['image/jpeg', ''])
+        self.assertEqual(list(array['error']),
+                         [0, gp.GP_ERROR_FILE_NOT_FOUND])
+        self.assertEqual(
+            list(array[array['mtime'] > 1700000050]['name']), ['b.raw'])
+
+
 if __name__ == "__main__":
     unittest.main()
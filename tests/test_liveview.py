@@ -0,0 +1,214 @@
+# python-gphoto2 - Python interface to libgphoto2
+# http://github.com/jim-easterbrook/python-gphoto2
+# Copyright (C) 2026  Jim Easterbrook  jim@jim-easterbrook.me.uk
+#
+# This file is part of python-gphoto2.
+#
+# python-gphoto2 is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# python-gphoto2 is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with python-gphoto2.  If not, see
+# <https://www.gnu.org/licenses/>.
+
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+
+import gphoto2 as gp
+from gphoto2.liveview import Frame, FrameRing, LiveViewServer
+
+path = os.path.dirname(os.path.dirname(__file__))
+if path not in sys.path:
+    sys.path.insert(0, path)
+from tests.vcamera import has_vcam, use_vcam
+
+
+class CountingCamera(object):
+    # produces numbered frames as fast as they are read
+    def preview_stream(self, max_fps, pool_size, context):
+        sequence = 0
+        while True:
+            yield sequence, time.time(), memoryview(b'frame %d' % sequence)
+            sequence += 1
+
+
+class ErrorCamera(object):
+    # fails like a camera that doesn't support preview
+    def preview_stream(self, max_fps, pool_size, context):
+        raise gp.GPhoto2Error(gp.GP_ERROR_NOT_SUPPORTED)
+        yield
+
+
+class TestFrameRing(unittest.TestCase):
+    def test_drop_oldest(self):
+        ring = FrameRing(CountingCamera(), depth=3)
+        ring.start()
+        frame = ring.latest(after=100, timeout=5)
+        self.assertIsInstance(frame, Frame)
+        self.assertGreater(frame.sequence, 100)
+        self.assertEqual(frame.data, b'frame %d' % frame.sequence)
+        self.assertGreaterEqual(frame.latency, 0.0)
+        ring.stop()
+        self.assertGreater(ring.dropped, 0)
+        first = ring.get()
+        self.assertEqual(ring.get().sequence, first.sequence + 1)
+        self.assertEqual(ring.get().sequence, first.sequence + 2)
+        self.assertIsNone(ring.get(timeout=0.1))
+        self.assertIsNone(ring.error)
+        # frames returned by latest() or get() are not counted as dropped
+        read = 3 + (frame.sequence < first.sequence)
+        self.assertEqual(ring.dropped, ring.frames - read)
+
+    def test_lock_wait_not_latency(self):
+        lock = threading.Lock()
+        ring = FrameRing(CountingCamera(), depth=1, policy='block', lock=lock)
+        with lock:
+            ring.start()
+            time.sleep(0.5)
+        frame = ring.get(timeout=5)
+        ring.stop()
+        self.assertEqual(frame.sequence, 0)
+        self.assertLess(frame.latency, 0.5)
+
+    def test_latest_not_dropped(self):
+        ring = FrameRing(CountingCamera(), depth=1, policy='block')
+        ring.start()
+        for sequence in range(5):
+            frame = ring.latest(after=sequence - 1, timeout=5)
+            self.assertEqual(frame.sequence, sequence)
+            self.assertEqual(ring.get(timeout=5).sequence, sequence)
+        ring.stop()
+        self.assertEqual(ring.dropped, 0)
+
+    def test_block(self):
+        ring = FrameRing(CountingCamera(), depth=2, policy='block')
+        ring.start()
+        for sequence in range(20):
+            frame = ring.get(timeout=5)
+            self.assertEqual(frame.sequence, sequence)
+        ring.stop()
+        self.assertEqual(ring.dropped, 0)
+
+    def test_max_fps(self):
+        ring = FrameRing(CountingCamera(), policy='block', max_fps=20)
+        ring.start()
+        start = time.time()
+        for sequence in range(5):
+            ring.get(timeout=5)
+        self.assertGreater(time.time() - start, 0.15)
+        ring.stop()
+
+    def test_params(self):
+        with self.assertRaises(ValueError):
+            FrameRing(CountingCamera(), depth=0)
+        with self.assertRaises(ValueError):
+            FrameRing(CountingCamera(), policy='newest')
+
+
+class TestLiveViewServer(unittest.TestCase):
+    camera = CountingCamera
+
+    def setUp(self):
+        self.ring = FrameRing(self.camera(), max_fps=100)
+        self.ring.start()
+        self.server = LiveViewServer(('localhost', 0), self.ring)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        self.port = self.server.server_address[1]
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.ring.stop()
+
+    def get(self, path):
+        connection = http.client.HTTPConnection('localhost', self.port)
+        connection.request('GET', path)
+        return connection, connection.getresponse()
+
+    def test_stream(self):
+        connections = []
+        for client in range(2):
+            connection, response = self.get('/')
+            self.assertEqual(response.status, 200)
+            self.assertTrue(response.getheader('Content-Type').startswith(
+                'multipart/x-mixed-replace'))
+            for part in range(3):
+                self.assertEqual(response.readline(), b'--gphoto2frame\r\n')
+                self.assertEqual(response.readline(),
+                                 b'Content-Type: image/jpeg\r\n')
+                length = int(response.readline().split()[1])
+                self.assertEqual(response.readline(), b'\r\n')
+                self.assertTrue(response.read(length).startswith(b'frame '))
+                self.assertEqual(response.readline(), b'\r\n')
+            connections.append((connection, response))
+        connection, response = self.get('/stats')
+        self.assertEqual(response.status, 200)
+        stats = json.loads(response.read().decode('utf-8'))
+        connection.close()
+        self.assertEqual(stats['clients'], 2)
+        self.assertGreater(stats['frames'], 0)
+        self.assertGreater(stats['fps'], 0.0)
+        self.assertIn('latency', stats)
+        for connection, response in connections:
+            response.close()
+            connection.close()
+
+    def test_not_found(self):
+        connection, response = self.get('/missing')
+        self.assertEqual(response.status, 404)
+        connection.close()
+
+
+class TestLiveViewServerError(TestLiveViewServer):
+    camera = ErrorCamera
+
+    def test_stream(self):
+        connection, response = self.get('/')
+        self.assertEqual(response.status, 503)
+        connection.close()
+        connection, response = self.get('/stats')
+        self.assertEqual(response.status, 200)
+        stats = json.loads(response.read().decode('utf-8'))
+        connection.close()
+        self.assertEqual(stats['clients'], 0)
+        self.assertEqual(stats['frames'], 0)
+
+
+@unittest.skipUnless(has_vcam, 'no virtual camera')
+class TestVirtualCamera(unittest.TestCase):
+    def setUp(self):
+        use_vcam(True)
+        self.camera = gp.Camera()
+        self.camera.init()
+
+    def tearDown(self):
+        self.camera.exit()
+
+    def test_error(self):
+        # virtual camera doesn't support preview
+        ring = FrameRing(self.camera)
+        ring.start()
+        with self.assertRaises(gp.GPhoto2Error) as cm:
+            ring.latest(timeout=5)
+        ex = cm.exception
+        self.assertEqual(ex.code, gp.GP_ERROR_NOT_SUPPORTED)
+        ring.stop()
+        self.assertIs(ring.error, ex)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -119,6 +119,67 @@ class TestWidget(unittest.TestCase):
         widget = status.get_child_by_name('batterylevel')
         self.assertEqual(widget.get_type(), gp.GP_WIDGET_TEXT)
         self.assertEqual(widget.get_readonly(), 1)
+        # test lookup by path and name
+        widget = settings.get_child_by_name('capturetarget')
+        self.assertEqual(config['main/settings/capturetarget'], widget)
+        self.assertEqual(config.find('capturetarget'), widget)
+        self.assertEqual(settings['settings/capturetarget'], widget)
+        self.assertEqual(settings.find('capturetarget'), widget)
+        self.assertEqual(config['main'], config)
+        self.assertEqual(config.find('main'), config)
+        self.assertEqual(config[0], actions)
+        count = config.count_children()
+        self.assertEqual(config[-1], config[count - 1])
+        self.assertEqual(config[-count], actions)
+        with self.assertRaises(IndexError):
+            config[count]
+        with self.assertRaises(IndexError):
+            config[-count - 1]
+        with self.assertRaises(KeyError):
+            config['main/capturetarget']
+        with self.assertRaises(gp.GPhoto2Error):
+            status.find('capturetarget')
+        with self.assertRaises(gp.GPhoto2Error):
+            config.find('missing')
+        # test cached choices
+        widget = config.find('capturetarget')
+        choices = tuple(widget.get_choices())
+        self.assertEqual(widget.choices, choices)
+        self.assertIs(widget.choices, widget.choices)
+        self.assertEqual(widget.choice_set, frozenset(choices))
+        self.assertIn(choices[1], widget.choice_set)
+        self.assertEqual(widget.choice_index(choices[1]), 1)
+        with self.assertRaises(ValueError):
+            widget.choice_index('missing')
+        with self.assertRaises(gp.GPhoto2Error):
+            config.find('bulb').choices
+        # index survives deleting temporary root widget objects
+        choices = widget.choices
+        self.assertEqual(config['main'].get_name(), 'main')
+        self.assertEqual(widget.get_root().get_name(), 'main')
+        self.assertIs(widget.choices, choices)
+        # test conversion to dict
+        config_dict = config.to_dict()
+        self.assertEqual(config_dict['name'], 'main')
+        self.assertEqual(config_dict['type'], gp.GP_WIDGET_WINDOW)
+        self.assertIsNone(config_dict['value'])
+        self.assertEqual(len(config_dict['children']), 6)
+        status_dict = [x for x in config_dict['children']
+                       if x['name'] == 'status'][0]
+        self.assertEqual(status_dict, status.to_dict())
+        battery_dict = [x for x in status_dict['children']
+                        if x['name'] == 'batterylevel'][0]
+        self.assertEqual(battery_dict['type'], gp.GP_WIDGET_TEXT)
+        self.assertIs(battery_dict['readonly'], True)
+        self.assertEqual(battery_dict['value'],
+                         status.get_child_by_name('batterylevel').get_value())
+        widget = settings.get_child_by_name('capturetarget')
+        widget_dict = widget.to_dict()
+        self.assertEqual(widget_dict['label'], widget.get_label())
+        self.assertEqual(widget_dict['value'], widget.get_value())
+        self.assertEqual(widget_dict['choices'], tuple(widget.get_choices()))
+        self.assertNotIn('choices', widget.to_dict(True, False))
+        self.assertNotIn('children', config.to_dict(False))
         # store changed config
         self.camera.set_config(config)
         del config